@@ -0,0 +1,258 @@
+"""Local stand-in for Booking.com serving the benchmark corpus.
+
+Serves hotel pages at ``/hotel/{country}/{slug}.{lang}.html`` with the query
+string produced by build_booking_url, plus a home page with the consent
+banner used by the Chrome profile template warm-up. Latency, slow
+subresources, empty room tables and error responses can be injected, so the
+real Selenium path can be measured on a machine without network access.
+
+Point the scraper at it with BOOKING_BASE_URL=http://127.0.0.1:<port>, or
+run ``python -m src.main benchmark`` which starts one for the run.
+"""
+
+import random
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.corpus import load_manifest, load_page
+
+HOTEL_PATH_RE = re.compile(
+    r"^/hotel/(?P<country>[a-z]{2})/(?P<slug>[\w.-]+?)\.(?P<lang>[a-z]{2}(?:-[a-z]{2})?)\.html$"
+)
+TBODY_RE = re.compile(r"(<tbody>).*?(</tbody>)", re.DOTALL)
+
+# Query parameters build_booking_url always sends
+REQUIRED_PARAMS = ("checkin", "checkout", "group_adults", "no_rooms", "selected_currency")
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><title>Booking stand-in</title></head><body>
+<div id="onetrust-banner-sdk">
+  <button id="onetrust-accept-btn-handler"
+    onclick="document.cookie='OptanonAlertBoxClosed=1; path=/'; this.remove();">Aceptar</button>
+</div>
+</body></html>
+"""
+
+ERROR_PAGE = """<!DOCTYPE html>
+<html><head><title>{status}</title></head><body><h1>{status} {phrase}</h1></body></html>
+"""
+
+STATIC_CONTENT_TYPES = {
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".jpg": "image/jpeg",
+}
+
+
+@dataclass
+class ServerBehavior:
+    """Faults and delays injected by the stand-in server.
+
+    Attributes:
+        latency: Seconds before a hotel page is answered.
+        subresources: Slow assets added to each hotel page (images, async
+            scripts and stylesheets, in turn).
+        subresource_delay: Seconds before each asset is answered.
+        empty_table_rate: Share of hotel pages served with an empty room table.
+        error_rate: Share of hotel page requests answered with error_status.
+        error_status: HTTP status of the injected errors.
+        seed: Seed of the fault injection.
+    """
+
+    latency: float = 0.0
+    subresources: int = 0
+    subresource_delay: float = 0.0
+    empty_table_rate: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int = 0
+
+
+class BookingStandInServer:
+    """Threaded HTTP server with the routes of the scraper's Booking.com pages."""
+
+    def __init__(
+        self, behavior: ServerBehavior | None = None, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """Initialize the server (started by start() or the context manager).
+
+        Args:
+            behavior: Faults and delays to inject (none by default).
+            host: Address to bind.
+            port: Port to bind (0 = any free port).
+        """
+        self.behavior = behavior or ServerBehavior()
+        manifest = load_manifest()
+        self.pages = {name: load_page(name) for name in manifest}
+        # Pages picked for unknown slugs: the ones that have a room table
+        self.default_pages = sorted(name for name, entry in manifest.items() if entry["rooms"])
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.stats: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.behavior.seed)
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stand_in = self  # type: ignore[attr-defined]
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL, to be used as settings.booking_base_url."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "BookingStandInServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="booking-stand-in", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "BookingStandInServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def page_for(self, slug: str) -> str:
+        """Corpus page served for a hotel slug.
+
+        A slug naming a corpus page (e.g. ``large_es``) gets that page; any
+        other slug is mapped to a page with rooms by a stable hash.
+        """
+        if slug in self.pages:
+            return slug
+        return self.default_pages[zlib.crc32(slug.encode()) % len(self.default_pages)]
+
+    def count(self, kind: str) -> None:
+        """Count a served response by kind."""
+        with self._lock:
+            self.stats[kind] = self.stats.get(kind, 0) + 1
+
+    def roll(self, rate: float) -> bool:
+        """Draw a fault with the given probability."""
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < rate
+
+    def record_request(self, path: str, query: dict[str, str]) -> None:
+        """Keep a hotel page request for inspection."""
+        with self._lock:
+            self.requests.append((path, query))
+
+    def render_hotel_page(self, name: str, empty_table: bool) -> str:
+        """HTML of a hotel page with the configured subresources."""
+        html = self.pages[name]
+        if empty_table:
+            html = TBODY_RE.sub(r"\1\2", html, count=1)
+        assets = []
+        for index in range(self.behavior.subresources):
+            kind = index % 3
+            if kind == 0:
+                assets.append(f'<img src="/static/slow-{index}.jpg" alt="">')
+            elif kind == 1:
+                assets.append(f'<script async src="/static/slow-{index}.js"></script>')
+            else:
+                assets.append(f'<link rel="stylesheet" href="/static/slow-{index}.css">')
+        if assets:
+            html = html.replace("</body>", "".join(assets) + "</body>", 1)
+        return html
+
+
+def _query_error(query: dict[str, str]) -> str | None:
+    """Why a hotel page query would not be accepted by Booking.com, or None."""
+    missing = [name for name in REQUIRED_PARAMS if not query.get(name)]
+    if missing:
+        return f"missing parameters: {', '.join(missing)}"
+    try:
+        if date.fromisoformat(query["checkout"]) <= date.fromisoformat(query["checkin"]):
+            return "checkout must be after checkin"
+    except ValueError:
+        return "invalid dates"
+    return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler of BookingStandInServer."""
+
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def stand_in(self) -> BookingStandInServer:
+        return self.server.stand_in  # type: ignore[attr-defined, no-any-return]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the benchmark output clean."""
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        behavior = self.stand_in.behavior
+
+        if parts.path == "/":
+            self.stand_in.count("home")
+            self._send(HTTPStatus.OK, HOME_PAGE)
+            return
+
+        if parts.path.startswith("/static/"):
+            time.sleep(behavior.subresource_delay)
+            self.stand_in.count("static")
+            suffix = parts.path[parts.path.rfind(".") :]
+            self._send(HTTPStatus.OK, "", STATIC_CONTENT_TYPES.get(suffix, "text/plain"))
+            return
+
+        match = HOTEL_PATH_RE.match(parts.path)
+        if match is None:
+            self.stand_in.count("not_found")
+            self._send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        self.stand_in.record_request(parts.path, query)
+        error = _query_error(query)
+        if error is not None:
+            self.stand_in.count("bad_request")
+            self._send_error(HTTPStatus.BAD_REQUEST, error)
+            return
+
+        time.sleep(behavior.latency)
+        if self.stand_in.roll(behavior.error_rate):
+            self.stand_in.count("error")
+            self._send_error(HTTPStatus(behavior.error_status))
+            return
+
+        empty_table = self.stand_in.roll(behavior.empty_table_rate)
+        self.stand_in.count("empty_table" if empty_table else "hotel")
+        name = self.stand_in.page_for(match.group("slug"))
+        self._send(HTTPStatus.OK, self.stand_in.render_hotel_page(name, empty_table))
+
+    def _send_error(self, status: HTTPStatus, detail: str = "") -> None:
+        body = ERROR_PAGE.format(status=status.value, phrase=detail or status.phrase)
+        self._send(status, body)
+
+    def _send(self, status: HTTPStatus, body: str, content_type: str = "text/html") -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
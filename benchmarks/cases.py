@@ -0,0 +1,162 @@
+"""Benchmark cases: parsing, price/number cleaning, URL building and the write path."""
+
+import itertools
+from datetime import datetime
+
+from benchmarks.corpus import load_manifest, load_page
+from benchmarks.harness import Benchmark
+from benchmarks.stand_in_db import InMemoryDatabase
+from src.application.persist_results import ResultPersister
+from src.application.url_builder import build_booking_url
+from src.domain.models import RoomAvailability, ScrapeResult, ScrapeSession
+from src.domain.services import PriceService, TextExtractionService
+from src.infrastructure.database.room_type_cache import RoomTypeCache
+from src.infrastructure.database.snapshot_cache import SnapshotCache
+from src.infrastructure.scraping.room_table import build_room_availabilities
+from src.infrastructure.scraping.room_table_parser import parse_room_rows, parse_room_table
+
+# Pages used by the write path benchmarks
+WRITE_PAGES = ("small_es", "large_es")
+
+# Results saved per transaction by the batch benchmark (like DB_WRITER_BATCH_SIZE)
+WRITE_BATCH_SIZE = 20
+
+
+def _parsing_benchmarks(manifest: dict[str, dict]) -> list[Benchmark]:
+    """Room table parsing of every corpus page, raw rows and mapped rooms."""
+    benchmarks = []
+    for name, entry in manifest.items():
+        html = load_page(name)
+        rows = max(entry["rate_rows"], 1)
+        benchmarks.append(
+            Benchmark(f"parse.rows[{name}]", lambda html=html: parse_room_rows(html), rows)
+        )
+        benchmarks.append(
+            Benchmark(f"parse.rooms[{name}]", lambda html=html: parse_room_table(html), rows)
+        )
+
+    raw_rows = parse_room_rows(load_page("large_es"))
+    benchmarks.append(
+        Benchmark(
+            "parse.build_room_availabilities[large_es]",
+            lambda: build_room_availabilities(raw_rows, "", "", ""),
+            len(raw_rows),
+        )
+    )
+    return benchmarks
+
+
+def _service_benchmarks(manifest: dict[str, dict]) -> list[Benchmark]:
+    """PriceService.clean_price and TextExtractionService.extract_number over corpus texts."""
+    prices: list[str | None] = []
+    availabilities: list[str | None] = []
+    for name in manifest:
+        for row in parse_room_rows(load_page(name)):
+            prices.extend((row.base_price, row.final_price))
+            availabilities.append(row.availability)
+
+    def clean_prices() -> None:
+        for text in prices:
+            PriceService.clean_price(text)
+
+    def extract_numbers() -> None:
+        for text in availabilities:
+            TextExtractionService.extract_number(text)
+
+    return [
+        Benchmark("services.clean_price", clean_prices, len(prices)),
+        Benchmark("services.extract_number", extract_numbers, len(availabilities)),
+    ]
+
+
+def _url_benchmarks() -> list[Benchmark]:
+    """build_booking_url as called for every job."""
+    return [
+        Benchmark(
+            "url.build_booking_url",
+            lambda: build_booking_url("hotel-bristol", "2026-01-10", "2026-01-11", currency="EUR"),
+        )
+    ]
+
+
+def _scrape_result(rooms: list[RoomAvailability], checkin_date: str) -> ScrapeResult:
+    """Scrape result of hotel 1 for a date."""
+    session = ScrapeSession(
+        hotel_id=1,
+        checkin_date=checkin_date,
+        checkout_date=checkin_date,
+        capture_date=datetime(2026, 1, 1, 12, 0, 0),
+        url_requested="https://www.booking.com/hotel/ar/bristol.es.html",
+        currency="EUR",
+        success=True,
+        room_types_found=len(rooms),
+    )
+    request_params = {"checkin_date": checkin_date, "currency": "EUR", "extraction_mode": "daily"}
+    return ScrapeResult(session, request_params, rooms, complete=True)
+
+
+def _persister() -> ResultPersister:
+    """Persister over a fresh stand-in database and fresh caches."""
+    return ResultPersister(
+        InMemoryDatabase().connect(),  # type: ignore[arg-type]
+        room_types=RoomTypeCache(),
+        snapshots=SnapshotCache(),
+    )
+
+
+def _write_benchmarks() -> list[Benchmark]:
+    """ResultPersister against the in-memory stand-in database."""
+    benchmarks = []
+    for name in WRITE_PAGES:
+        rooms = parse_room_table(load_page(name))
+
+        new_persister, dates = _persister(), itertools.count()
+        benchmarks.append(
+            Benchmark(
+                f"db.persist_new_session[{name}]",
+                lambda p=new_persister, d=dates, r=rooms: p.persist(
+                    _scrape_result(r, f"d{next(d)}")
+                ),
+                len(rooms),
+            )
+        )
+
+        unchanged_persister = _persister()
+        unchanged = _scrape_result(rooms, "2026-01-10")
+        unchanged_persister.persist(unchanged)
+        benchmarks.append(
+            Benchmark(
+                f"db.persist_unchanged[{name}]",
+                lambda p=unchanged_persister, result=unchanged: p.persist(result),
+                len(rooms),
+            )
+        )
+
+    rooms = parse_room_table(load_page("small_es"))
+    batch_persister, batches = _persister(), itertools.count()
+
+    def persist_batch() -> None:
+        batch_id = next(batches)
+        batch_persister.persist_batch(
+            [_scrape_result(rooms, f"b{batch_id}-{i}") for i in range(WRITE_BATCH_SIZE)]
+        )
+
+    benchmarks.append(
+        Benchmark(
+            f"db.persist_batch[{WRITE_BATCH_SIZE}x small_es]",
+            persist_batch,
+            WRITE_BATCH_SIZE * len(rooms),
+        )
+    )
+    return benchmarks
+
+
+def build_benchmarks() -> list[Benchmark]:
+    """Every benchmark of the suite, in run order."""
+    manifest = load_manifest()
+    return [
+        *_parsing_benchmarks(manifest),
+        *_service_benchmarks(manifest),
+        *_url_benchmarks(),
+        *_write_benchmarks(),
+    ]
@@ -0,0 +1,315 @@
+"""Corpus of Booking.com hotel pages used by the benchmarks.
+
+The pages mirror the markup the scraper reads (hprt-table rows and the
+selectors in src.infrastructure.scraping.room_table) surrounded by the kind of
+page weight a real hotel page carries (inline scripts, styles, reviews,
+navigation). They are generated deterministically and committed under
+benchmarks/corpus/, with a manifest of the rows each page holds; regenerate
+them with:
+
+    python -m benchmarks.corpus
+"""
+
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+MANIFEST_FILE = CORPUS_DIR / "manifest.json"
+
+
+@dataclass(frozen=True)
+class Locale:
+    """Texts and price format of a Booking.com language."""
+
+    code: str
+    room_names: tuple[str, ...]
+    left_text: str  # "{n}" is replaced by the rooms left
+    non_refundable: str
+    free_cancellation: str
+    offer: str
+    no_availability: str
+    currency: str
+    thousands: str
+
+
+LOCALES = {
+    "es": Locale(
+        code="es",
+        room_names=(
+            "Habitación Doble",
+            "Habitación Doble Superior",
+            "Habitación Triple",
+            "Suite Junior",
+            "Habitación Individual",
+            "Habitación Familiar",
+            "Estudio",
+            "Apartamento de 1 dormitorio",
+        ),
+        left_text="Solo quedan {n}",
+        non_refundable="No reembolsable",
+        free_cancellation="Cancelación gratis",
+        offer="Oferta de último minuto",
+        no_availability="No hay disponibilidad en este alojamiento para tus fechas",
+        currency="€ ",
+        thousands=".",
+    ),
+    "en-gb": Locale(
+        code="en-gb",
+        room_names=(
+            "Double Room",
+            "Superior Double Room",
+            "Twin Room",
+            "Junior Suite",
+            "Single Room",
+            "Family Room",
+        ),
+        left_text="Only {n} rooms left on our site",
+        non_refundable="Non-refundable",
+        free_cancellation="Free cancellation",
+        offer="Limited-time Deal",
+        no_availability="There are no available rooms for your dates",
+        currency="€",
+        thousands=",",
+    ),
+    "pt-br": Locale(
+        code="pt-br",
+        room_names=(
+            "Quarto Duplo",
+            "Quarto Duplo Superior",
+            "Quarto Triplo",
+            "Suíte Júnior",
+        ),
+        left_text="Só restam {n}",
+        non_refundable="Não reembolsável",
+        free_cancellation="Cancelamento grátis",
+        offer="Oferta por tempo limitado",
+        no_availability="Não há disponibilidade para suas datas",
+        currency="R$ ",
+        thousands=".",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class PageSpec:
+    """Shape of a corpus page."""
+
+    name: str
+    description: str
+    locale: str
+    room_types: int
+    rates_per_room: int
+    non_refundable_share: float = 0.3
+    reviews: int = 20
+    sold_out: bool = False
+    seed: int = 1
+
+
+PAGES = (
+    PageSpec("small_es", "Small hotel, 3 room types", "es", room_types=3, rates_per_room=2),
+    PageSpec(
+        "large_es",
+        "Large hotel, many rates per room type and a heavy page",
+        "es",
+        room_types=24,
+        rates_per_room=6,
+        reviews=120,
+        seed=2,
+    ),
+    PageSpec(
+        "sold_out_es",
+        "No availability: the page has no room table",
+        "es",
+        room_types=0,
+        rates_per_room=0,
+        sold_out=True,
+        seed=3,
+    ),
+    PageSpec(
+        "non_refundable_es",
+        "Most rates are non-refundable",
+        "es",
+        room_types=8,
+        rates_per_room=4,
+        non_refundable_share=0.9,
+        seed=4,
+    ),
+    PageSpec("medium_en_gb", "English page", "en-gb", room_types=6, rates_per_room=3, seed=5),
+    PageSpec("medium_pt_br", "Portuguese page, R$ prices", "pt-br", 4, 3, seed=6),
+)
+
+
+def _price(amount: int, locale: Locale) -> str:
+    """Format an integer price like Booking.com does for the locale."""
+    return f"{locale.currency}{amount:,}".replace(",", locale.thousands)
+
+
+def _rate_row(
+    rng: random.Random, locale: Locale, block_id: str, room_name: str | None, non_refundable: bool
+) -> str:
+    """One row of the room table; only the first rate of a room type has its name."""
+    final = rng.randrange(60, 2400)
+    discounted = rng.random() < 0.4
+    name_cell = (
+        f'<td class="hprt-table-cell-roomtype" rowspan="1"><div class="hprt-roomtype-block">'
+        f'<a class="hprt-roomtype-link" href="#RD{block_id}">'
+        f'<span class="hprt-roomtype-icon-link">\n  {room_name}\n</span></a>'
+        f'<div class="hprt-facilities-block">{_facilities(rng)}</div></div></td>'
+        if room_name
+        else ""
+    )
+    base = (
+        f'<div class="bui-f-color-destructive js-strikethrough-price">'
+        f"{_price(int(final * 1.25), locale)}</div>"
+        if discounted
+        else ""
+    )
+    offer = (
+        '<div class="c-deals-container"><div><div class="bui-badge">-20%</div>'
+        f"<div><span><span><span>{locale.offer}</span></span></span></div></div></div>"
+        if discounted
+        else ""
+    )
+    left = rng.randrange(1, 6)
+    availability = (
+        '<ul class="bui-list"><li class="bui-list__item bui-text--color-destructive-dark">'
+        f'<div class="bui-list__description">{locale.left_text.format(n=left)}</div></li></ul>'
+        if room_name and rng.random() < 0.7
+        else ""
+    )
+    policy = locale.non_refundable if non_refundable else locale.free_cancellation
+    return (
+        f'<tr data-block-id="{block_id}" class="js-rt-block-row e2e-hprt-table-row">'
+        f"{name_cell}"
+        f'<td class="hprt-table-cell-occupancy"><span class="bui-u-sr-only">'
+        f"Max. {rng.randrange(1, 5)}</span></td>"
+        f'<td class="hprt-table-cell-price">{base}'
+        f'<div class="prco-wrapper"><span class="prco-valign-middle-helper">'
+        f"{_price(final, locale)}</span></div>{offer}"
+        f'<div class="prd-taxes-and-fees-under-price">+ impuestos</div></td>'
+        f'<td class="hprt-table-cell-conditions"><ul class="hprt-conditions-bui">'
+        f"<li><span>{policy}</span></li></ul>{availability}</td>"
+        f'<td class="hprt-table-cell-select"><select class="hprt-nos-select" '
+        f'name="nr_rooms_{block_id}">'
+        + "".join(f'<option value="{n}">{n}</option>' for n in range(0, 6))
+        + "</select></td></tr>\n"
+    )
+
+
+def _facilities(rng: random.Random) -> str:
+    """Facility badges of a room type."""
+    names = ["Aire acondicionado", "Baño privado", "TV", "WiFi gratis", "Minibar", "Vistas"]
+    return "".join(
+        f'<span class="hprt-facilities-facility"><svg class="bk-icon"><path d="M0 0h24v24H0z"/>'
+        f"</svg>{name}</span>"
+        for name in rng.sample(names, 4)
+    )
+
+
+def _noise(rng: random.Random, spec: PageSpec) -> tuple[str, str]:
+    """Head and body filler: scripts, styles, navigation and reviews."""
+    scripts = "".join(
+        f'<script>window.__bk_{i} = {json.dumps({"k": [rng.random() for _ in range(40)]})};'
+        "</script>\n"
+        for i in range(spec.reviews // 4 + 5)
+    )
+    styles = "<style>" + "".join(f".c{i}{{margin:{i}px}}" for i in range(400)) + "</style>\n"
+    reviews = "".join(
+        f'<div class="review_item"><div class="review_item_header">Review {i}</div>'
+        f'<p class="review_pos">{"Muy buena ubicación y atención. " * rng.randrange(2, 8)}</p>'
+        "</div>\n"
+        for i in range(spec.reviews)
+    )
+    nav = "".join(f'<li><a href="/landmark/{i}.html">Lugar {i}</a></li>' for i in range(60))
+    head = f"<head><meta charset='utf-8'><title>{spec.name}</title>{styles}{scripts}</head>"
+    body_top = f'<header><nav><ul class="bui-list">{nav}</ul></nav></header>'
+    return head, body_top + f'<section id="reviews">{reviews}</section>'
+
+
+def build_page(spec: PageSpec) -> tuple[str, dict[str, int]]:
+    """Build the HTML of a corpus page.
+
+    Returns:
+        Tuple of (html, counts) where counts has the room types, rate rows,
+        expected RoomAvailability objects and non-refundable rates of the
+        room table.
+    """
+    rng = random.Random(spec.seed)
+    locale = LOCALES[spec.locale]
+    head, filler = _noise(rng, spec)
+
+    rows: list[str] = []
+    non_refundable = 0
+    names = []
+    for index in range(spec.room_types):
+        name = locale.room_names[index % len(locale.room_names)]
+        repeat = index // len(locale.room_names)
+        names.append(f"{name} {repeat + 1}" if repeat else name)
+    for room_index, room_name in enumerate(names):
+        for rate_index in range(spec.rates_per_room):
+            is_non_refundable = rng.random() < spec.non_refundable_share
+            non_refundable += is_non_refundable
+            rows.append(
+                _rate_row(
+                    rng,
+                    locale,
+                    block_id=f"{1000 + room_index}_{rate_index}",
+                    room_name=room_name if rate_index == 0 else None,
+                    non_refundable=is_non_refundable,
+                )
+            )
+
+    if spec.sold_out:
+        table = f'<div class="bui-alert bui-alert--error"><p>{locale.no_availability}</p></div>'
+    else:
+        table = (
+            '<table id="hprt-table" class="hprt-table hprt-table-long-language">'
+            '<thead><tr class="hprt-table-header"><th>Tipo</th><th>Personas</th>'
+            "<th>Precio</th><th>Condiciones</th><th>Seleccionar</th></tr></thead>\n"
+            f"<tbody>\n{''.join(rows)}</tbody></table>"
+        )
+
+    html = (
+        f'<!DOCTYPE html>\n<html lang="{locale.code}">{head}<body>'
+        f'<div id="basiclayout"><h2 class="pp-header__title">{spec.description}</h2>'
+        f'<div id="available_rooms"><form id="hprt-form">{table}</form></div>'
+        f"{filler}</div></body></html>\n"
+    )
+    # The scraper keeps only the last "Estudio" row of a page (see build_room_availabilities)
+    estudio_rows = sum(spec.rates_per_room for name in names if "estudio" in name.lower())
+    counts = {
+        "room_types": len(names),
+        "rate_rows": len(rows),
+        "rooms": len(rows) - estudio_rows + (1 if estudio_rows else 0),
+        "non_refundable_rows": non_refundable,
+    }
+    return html, counts
+
+
+def load_manifest() -> dict[str, dict]:
+    """Manifest of the committed corpus: page name -> spec and expected counts."""
+    return json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+
+
+def load_page(name: str) -> str:
+    """HTML of a committed corpus page."""
+    return (CORPUS_DIR / f"{name}.html").read_text(encoding="utf-8")
+
+
+def write_corpus() -> None:
+    """Regenerate the corpus pages and their manifest."""
+    CORPUS_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for spec in PAGES:
+        html, counts = build_page(spec)
+        (CORPUS_DIR / f"{spec.name}.html").write_text(html, encoding="utf-8")
+        manifest[spec.name] = {**asdict(spec), **counts, "bytes": len(html.encode("utf-8"))}
+    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    write_corpus()
+    for name, entry in load_manifest().items():
+        print(f"{name:<20} {entry['rate_rows']:>4} rows {entry['bytes'] / 1024:>8.1f} KB")
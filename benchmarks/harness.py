@@ -0,0 +1,170 @@
+"""Minimal timing harness: calibrated loops, repeated samples, baseline comparison."""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.utils.timing import run_timings
+
+# Format version of the results file
+RESULTS_SCHEMA = 1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A function timed as one operation.
+
+    Attributes:
+        name: Unique name, ``group.case[variant]``.
+        func: Operation to time (called with no arguments).
+        items: Items processed by one call (rows, strings...), for throughput.
+    """
+
+    name: str
+    func: Callable[[], Any]
+    items: int = 1
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A benchmark slower than its baseline beyond the allowed ratio."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median / baseline median."""
+        return self.current / self.baseline
+
+
+def _time_loops(func: Callable[[], Any], loops: int) -> float:
+    """Seconds taken by ``loops`` calls, with the garbage collector off (like timeit)."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure(benchmark: Benchmark, repeat: int = 5, min_time: float = 0.05) -> dict[str, Any]:
+    """Time a benchmark.
+
+    The number of calls per sample doubles until a sample takes at least
+    ``min_time`` seconds; ``repeat`` samples are then taken.
+
+    Args:
+        benchmark: Benchmark to time.
+        repeat: Samples to take.
+        min_time: Minimum duration of a sample, in seconds.
+
+    Returns:
+        Seconds per call (min, median, mean, stdev) plus loops, repeat,
+        items and items_per_second.
+    """
+    loops = 1
+    while True:
+        elapsed = _time_loops(benchmark.func, loops)
+        if elapsed >= min_time or loops >= 1 << 24:
+            break
+        loops *= 2
+
+    samples = [elapsed / loops]
+    samples += [_time_loops(benchmark.func, loops) / loops for _ in range(repeat - 1)]
+    # Stage timings recorded by instrumented code would grow without bound here
+    run_timings.reset()
+
+    median = statistics.median(samples)
+    return {
+        "loops": loops,
+        "repeat": len(samples),
+        "min": min(samples),
+        "median": median,
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "items": benchmark.items,
+        "items_per_second": benchmark.items / median if median else 0.0,
+    }
+
+
+def _git_commit() -> str | None:
+    """Short commit hash of the working tree, if available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_report(results: dict[str, dict[str, Any]], extra: dict[str, Any] | None = None) -> dict:
+    """Wrap benchmark results with the metadata needed to compare runs."""
+    return {
+        "schema": RESULTS_SCHEMA,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        **(extra or {}),
+        "benchmarks": results,
+    }
+
+
+def load_report(path: str | Path) -> dict[str, Any]:
+    """Load a results file written by save_report()."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def save_report(report: dict[str, Any], path: str | Path) -> None:
+    """Write a results file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(
+    current: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    max_regression: float,
+) -> list[Regression]:
+    """Find the benchmarks whose median got slower than the baseline allows.
+
+    Args:
+        current: Benchmark results of this run.
+        baseline: Benchmark results of the baseline run.
+        max_regression: Allowed slowdown, e.g. 0.2 = 20% slower.
+
+    Returns:
+        Regressions, worst first. Benchmarks missing from either side are ignored.
+    """
+    regressions = [
+        Regression(name, baseline[name]["median"], result["median"])
+        for name, result in current.items()
+        if name in baseline
+        and baseline[name]["median"] > 0
+        and result["median"] > baseline[name]["median"] * (1 + max_regression)
+    ]
+    return sorted(regressions, key=lambda regression: regression.ratio, reverse=True)
@@ -0,0 +1,112 @@
+"""Run the benchmark suite.
+
+Usage:
+    python -m benchmarks.run                       # run and write benchmarks/results/latest.json
+    python -m benchmarks.run --save-baseline       # also store it as the baseline
+    python -m benchmarks.run --baseline benchmarks/baseline.json --max-regression 0.2
+    python -m benchmarks.run --filter parse. --quick
+
+Exits with status 1 when a baseline is given and a benchmark median is slower
+than the baseline by more than --max-regression.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks.cases import build_benchmarks
+from benchmarks.harness import build_report, compare, load_report, measure, save_report
+from src.config.settings import settings
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results" / "latest.json"
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+
+
+def _format_seconds(seconds: float) -> str:
+    """Human readable duration of one call."""
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and compare them with a baseline.
+
+    Returns:
+        Process exit status.
+    """
+    parser = argparse.ArgumentParser(description="Scraper benchmark suite")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7, help="Samples per benchmark (default: 7)")
+    parser.add_argument(
+        "--min-time", type=float, default=0.1, help="Minimum seconds per sample (default: 0.1)"
+    )
+    parser.add_argument("--quick", action="store_true", help="3 short samples (smoke run)")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Results file to write")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"Also write the results to {DEFAULT_BASELINE.relative_to(BENCHMARKS_DIR.parent)}",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed median slowdown against the baseline (default: 0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.repeat, args.min_time = 3, 0.01
+
+    # Instrumented code logs at DEBUG level; keep it out of the measurements
+    logging.disable(logging.INFO)
+
+    baseline = load_report(args.baseline)["benchmarks"] if args.baseline else {}
+    benchmarks = [bench for bench in build_benchmarks() if args.filter in bench.name]
+
+    results = {}
+    width = max((len(bench.name) for bench in benchmarks), default=10)
+    print(f"{'benchmark':<{width}} {'median':>11} {'stdev':>7} {'items/s':>12} {'vs base':>8}")
+    for bench in benchmarks:
+        result = measure(bench, repeat=args.repeat, min_time=args.min_time)
+        results[bench.name] = result
+        stdev_pct = result["stdev"] / result["median"] * 100 if result["median"] else 0.0
+        versus = ""
+        if bench.name in baseline and baseline[bench.name]["median"]:
+            versus = f"{result['median'] / baseline[bench.name]['median']:.2f}x"
+        print(
+            f"{bench.name:<{width}} {_format_seconds(result['median']):>11} "
+            f"{stdev_pct:>6.1f}% {result['items_per_second']:>12,.0f} {versus:>8}"
+        )
+
+    report = build_report(
+        results,
+        extra={
+            "settings": {
+                "db_delta_storage": settings.db_delta_storage,
+                "db_session_upsert": settings.db_session_upsert,
+            }
+        },
+    )
+    save_report(report, args.output)
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        save_report(report, DEFAULT_BASELINE)
+        print(f"Baseline written to {DEFAULT_BASELINE}")
+
+    regressions = compare(results, baseline, args.max_regression)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {_format_seconds(regression.baseline)} -> "
+            f"{_format_seconds(regression.current)} ({regression.ratio:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
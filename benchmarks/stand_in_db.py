@@ -0,0 +1,155 @@
+"""In-memory stand-in for the MySQL connection used by the repositories.
+
+Understands exactly the statements issued by src.infrastructure.database.
+repositories and keeps the rows in Python structures, so the write path
+(session upsert, room type resolution, bulk inserts, delta storage) can be
+timed without a database server. It measures the Python side of a save (SQL
+and parameter building, hashing, caches); network and server time are out of
+scope.
+"""
+
+from typing import Any
+
+
+class InMemoryDatabase:
+    """Tables of the scraper schema."""
+
+    def __init__(self) -> None:
+        """Create empty tables."""
+        self.room_types: dict[int, tuple[int, str]] = {}  # id -> (hotel_id, name)
+        self.sessions: dict[tuple[Any, Any, Any], int] = {}  # (hotel, checkin, checkout) -> id
+        # session_id -> [(id, room_type_id, content_hash, created_at)], so lookups
+        # do not slow down as benchmark loops add sessions
+        self.room_availabilities: dict[int, list[tuple[int, int, str | None, str]]] = {}
+        self.statements = 0
+        self.commits = 0
+        self._next_id = 0
+
+    def new_id(self) -> int:
+        """Next auto-increment ID (shared by every table)."""
+        self._next_id += 1
+        return self._next_id
+
+    def connect(self) -> "InMemoryConnection":
+        """Open a connection to this database."""
+        return InMemoryConnection(self)
+
+
+class InMemoryConnection:
+    """Connection with the subset of MySQLConnection the repositories use."""
+
+    def __init__(self, database: InMemoryDatabase) -> None:
+        """Initialize the connection."""
+        self.database = database
+
+    def cursor(self, dictionary: bool = False) -> "InMemoryCursor":
+        """Return a new cursor."""
+        return InMemoryCursor(self.database, dictionary)
+
+    def commit(self) -> None:
+        """Count the commit (statements are applied immediately)."""
+        self.database.commits += 1
+
+    def rollback(self) -> None:
+        """Rollbacks are not supported: a failing statement raises instead."""
+
+    def is_connected(self) -> bool:
+        """The in-memory database is always reachable."""
+        return True
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InMemoryCursor:
+    """Cursor dispatching on the statements of the repositories."""
+
+    def __init__(self, database: InMemoryDatabase, dictionary: bool) -> None:
+        """Initialize the cursor."""
+        self.db = database
+        self.dictionary = dictionary
+        self.lastrowid: int | None = None
+        self.rowcount = 0
+        self._rows: list[Any] = []
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> None:
+        """Run one repository statement.
+
+        Raises:
+            NotImplementedError: For statements the stand-in does not know.
+        """
+        db = self.db
+        db.statements += 1
+        statement = " ".join(sql.split())
+        self._rows = []
+
+        if statement.startswith("SELECT id, name FROM room_types"):
+            hotel_id = params[0]
+            self._rows = [
+                (room_type_id, name)
+                for room_type_id, (owner, name) in db.room_types.items()
+                if owner == hotel_id
+            ]
+        elif statement.startswith("SELECT id FROM room_types"):
+            hotel_id, name = params
+            self._rows = [
+                (room_type_id,)
+                for room_type_id, (owner, stored) in db.room_types.items()
+                if owner == hotel_id and stored.lower() == name.lower()
+            ][:1]
+        elif statement.startswith("INSERT INTO room_types"):
+            for start in range(0, len(params), 5):
+                self.lastrowid = db.new_id()
+                db.room_types[self.lastrowid] = (params[start], params[start + 1])
+            self.rowcount = len(params) // 5
+        elif statement.startswith("INSERT INTO scrape_sessions"):
+            key = (params[0], params[2], params[3])
+            if "ON DUPLICATE KEY UPDATE" in statement and key in db.sessions:
+                self.lastrowid, self.rowcount = db.sessions[key], 2
+            else:
+                # create() passes hotel_id, proxy_id, checkin_date, checkout_date first too
+                self.lastrowid, self.rowcount = db.new_id(), 1
+                db.sessions[key] = self.lastrowid
+        elif statement.startswith("SELECT id FROM scrape_sessions"):
+            session_id = db.sessions.get(tuple(params))
+            self._rows = [(session_id,)] if session_id is not None else []
+        elif statement.startswith("UPDATE scrape_sessions"):
+            self.rowcount = 1
+        elif statement.startswith("INSERT INTO room_availabilities"):
+            width = 10 if "content_hash" in statement.split("VALUES")[0] else 9
+            for start in range(0, len(params), width):
+                content_hash = params[start + 9] if width == 10 else None
+                db.room_availabilities.setdefault(params[start], []).append(
+                    (db.new_id(), params[start + 1], content_hash, params[start + 7])
+                )
+            self.rowcount = len(params) // width
+        elif statement.startswith("SELECT ra.room_type_id, ra.content_hash"):
+            # Rows are stored in ID order: the last one of each room type wins
+            latest = {
+                room_type_id: content_hash
+                for _, room_type_id, content_hash, _ in db.room_availabilities.get(params[0], [])
+            }
+            self._rows = list(latest.items())
+        elif statement.startswith("UPDATE room_availabilities ra"):
+            # Every row sharing the created_at of the last row of its room type
+            rows = db.room_availabilities.get(params[0], [])
+            pairs = {(params[i], params[i + 1]) for i in range(3, len(params), 2)}
+            snapshot = {room_type_id: created_at for _, room_type_id, _, created_at in rows}
+            self.rowcount = sum(
+                1
+                for _, room_type_id, content_hash, created_at in rows
+                if snapshot[room_type_id] == created_at and (room_type_id, content_hash) in pairs
+            )
+        else:
+            raise NotImplementedError(f"Statement not supported by the stand-in: {statement[:80]}")
+
+    def fetchone(self) -> Any:
+        """Return the first result row, or None."""
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self) -> list[Any]:
+        """Return every result row."""
+        return list(self._rows)
+
+    def close(self) -> None:
+        """Nothing to release."""
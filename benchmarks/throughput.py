@@ -0,0 +1,126 @@
+"""End-to-end throughput of the Selenium scraping path against the local stand-in.
+
+Starts a BookingStandInServer, points the scraper at it and scrapes a number
+of pages with the regular worker pool (real Chrome, no database: scraped
+pages are discarded instead of saved). Reports pages per minute, browser
+start cost and the time spent waiting for pages, from the stage timings.
+
+Run it with ``python -m src.main benchmark``, e.g.:
+
+    python -m src.main benchmark --pages 30 --workers 2 --latency 0.3
+"""
+
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any
+
+from benchmarks.booking_server import BookingStandInServer, ServerBehavior
+from src.application.result_writer import ResultWriter
+from src.application.worker_pool import ScrapeWorkerPool
+from src.config.settings import settings
+from src.domain.models import ScrapeJob, ScrapeResult
+from src.utils.timing import run_timings
+
+
+class _DiscardingWriter(ResultWriter):
+    """Result writer that counts the scraped pages and drops them."""
+
+    def __init__(self) -> None:
+        super().__init__(threads=1)
+        self.discarded = 0
+
+    def start(self) -> None:
+        """No writer threads are needed."""
+
+    def submit(self, result: ScrapeResult) -> None:
+        """Count the page instead of saving it."""
+        self.discarded += 1
+
+    def close(self) -> None:
+        """Nothing to drain."""
+
+
+@contextmanager
+def _overridden_settings(**values: Any) -> Iterator[None]:
+    """Temporarily change global settings."""
+    saved = {name: getattr(settings, name) for name in values}
+    for name, value in values.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(settings, name, value)
+
+
+def build_benchmark_jobs(pages: int, slugs: list[str]) -> list[ScrapeJob]:
+    """Jobs cycling over the given hotel slugs with consecutive check-in dates."""
+    start = date(2030, 1, 1)
+    jobs = []
+    for index in range(pages):
+        checkin = start + timedelta(days=index // len(slugs))
+        slug = slugs[index % len(slugs)]
+        jobs.append(
+            ScrapeJob(
+                hotel_id=index % len(slugs) + 1,
+                hotel_name=slug,
+                hotel_slug=slug,
+                currency="EUR",
+                checkin_date=checkin.isoformat(),
+                checkout_date=(checkin + timedelta(days=1)).isoformat(),
+            )
+        )
+    return jobs
+
+
+def run_throughput(
+    pages: int = 30, workers: int = 1, behavior: ServerBehavior | None = None
+) -> dict[str, Any]:
+    """Scrape pages from a local stand-in server and measure the run.
+
+    Chrome profiles go to a temporary directory, so the template warmed up
+    against the stand-in never replaces the one used for Booking.com.
+
+    Args:
+        pages: Pages to scrape.
+        workers: Concurrent workers.
+        behavior: Faults and delays injected by the server.
+
+    Returns:
+        Dictionary with pages, workers, elapsed seconds, pages_per_minute,
+        succeeded and failed pages, server response counts and the stage
+        timings of the run (count/total/p50/p95/max per stage).
+    """
+    behavior = behavior or ServerBehavior()
+    profile_root = tempfile.mkdtemp(prefix="bookeando-bench-")
+    writer = _DiscardingWriter()
+    try:
+        with (
+            BookingStandInServer(behavior) as server,
+            _overridden_settings(booking_base_url=server.url, chrome_profile_root=profile_root),
+        ):
+            jobs = build_benchmark_jobs(pages, server.default_pages)
+            run_timings.reset()
+            started = time.monotonic()
+            pool = ScrapeWorkerPool(workers=workers, delay_between_jobs=False, result_writer=writer)
+            outcomes = pool.run(jobs)
+            elapsed = time.monotonic() - started
+            server_stats = dict(server.stats)
+    finally:
+        shutil.rmtree(profile_root, ignore_errors=True)
+
+    succeeded = sum(1 for _, results in outcomes if results.get("queued"))
+    return {
+        "pages": pages,
+        "workers": workers,
+        "elapsed_seconds": round(elapsed, 3),
+        "pages_per_minute": round(succeeded / elapsed * 60, 2) if elapsed else 0.0,
+        "succeeded": succeeded,
+        "failed": len(outcomes) - succeeded,
+        "server": server_stats,
+        "stages": run_timings.summary(),
+    }
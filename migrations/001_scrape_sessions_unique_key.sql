@@ -0,0 +1,56 @@
+-- ============================================================================
+-- 001 - Unique key on scrape_sessions (hotel_id, checkin_date, checkout_date)
+-- ============================================================================
+-- Required by ScrapeSessionRepository.upsert (INSERT ... ON DUPLICATE KEY
+-- UPDATE). Run once before enabling DB_SESSION_UPSERT:
+--
+--   mysql -h $DB_HOST -u $DB_USER -p $DB_NAME < migrations/001_scrape_sessions_unique_key.sql
+--
+-- Duplicated sessions (left behind by concurrent runs) are merged into the
+-- lowest id, which is the one the previous find_existing() lookup kept
+-- updating. Their room availabilities are moved to the kept session.
+-- ============================================================================
+
+-- 1. room_types_found column (older schemas may not have it)
+SET @has_column := (
+    SELECT COUNT(*) FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'scrape_sessions'
+      AND COLUMN_NAME = 'room_types_found'
+);
+SET @ddl := IF(
+    @has_column = 0,
+    'ALTER TABLE scrape_sessions ADD COLUMN room_types_found INT NULL DEFAULT 0',
+    'SELECT 1'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- 2. Merge duplicated sessions into the lowest id
+CREATE TEMPORARY TABLE scrape_session_duplicates AS
+SELECT s.id AS duplicate_id, k.keep_id
+FROM scrape_sessions s
+JOIN (
+    SELECT hotel_id, checkin_date, checkout_date, MIN(id) AS keep_id
+    FROM scrape_sessions
+    GROUP BY hotel_id, checkin_date, checkout_date
+    HAVING COUNT(*) > 1
+) k
+  ON k.hotel_id = s.hotel_id
+ AND k.checkin_date = s.checkin_date
+ AND k.checkout_date = s.checkout_date
+WHERE s.id <> k.keep_id;
+
+UPDATE room_availabilities ra
+JOIN scrape_session_duplicates d ON d.duplicate_id = ra.scrape_session_id
+SET ra.scrape_session_id = d.keep_id;
+
+DELETE s FROM scrape_sessions s
+JOIN scrape_session_duplicates d ON d.duplicate_id = s.id;
+
+DROP TEMPORARY TABLE scrape_session_duplicates;
+
+-- 3. Unique key used by the upsert
+ALTER TABLE scrape_sessions
+    ADD UNIQUE KEY uniq_scrape_sessions_hotel_dates (hotel_id, checkin_date, checkout_date);
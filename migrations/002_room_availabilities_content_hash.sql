@@ -0,0 +1,66 @@
+-- ============================================================================
+-- 002 - Content hash on room_availabilities for delta storage
+-- ============================================================================
+-- Required by DB_DELTA_STORAGE. Each row stores the hash of the snapshot of
+-- its room type (all rows of that room type in one capture). When a new
+-- capture has the same hash as the last stored one, no rows are inserted and
+-- the updated_at of the stored rows is bumped instead. Run once:
+--
+--   mysql -h $DB_HOST -u $DB_USER -p $DB_NAME < migrations/002_room_availabilities_content_hash.sql
+--
+-- Existing rows keep a NULL hash, so the first capture after the migration
+-- writes every room type once more. Prices become nullable: a room type that
+-- drops out of the page is recorded with one row without prices.
+-- ============================================================================
+
+-- 1. content_hash column
+SET @has_column := (
+    SELECT COUNT(*) FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'room_availabilities'
+      AND COLUMN_NAME = 'content_hash'
+);
+SET @ddl := IF(
+    @has_column = 0,
+    'ALTER TABLE room_availabilities ADD COLUMN content_hash CHAR(16) NULL',
+    'SELECT 1'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- 2. Index used to find the last snapshot of each room type and to bump it
+SET @has_index := (
+    SELECT COUNT(*) FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'room_availabilities'
+      AND INDEX_NAME = 'idx_room_availabilities_session_type'
+);
+SET @ddl := IF(
+    @has_index = 0,
+    'ALTER TABLE room_availabilities ADD INDEX idx_room_availabilities_session_type '
+    '(scrape_session_id, room_type_id, content_hash)',
+    'SELECT 1'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- 3. Nullable prices (keeps the current column types)
+SET @ddl := (
+    SELECT IFNULL(
+        CONCAT(
+            'ALTER TABLE room_availabilities ',
+            GROUP_CONCAT(CONCAT('MODIFY ', COLUMN_NAME, ' ', COLUMN_TYPE, ' NULL') SEPARATOR ', ')
+        ),
+        'SELECT 1'
+    )
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'room_availabilities'
+      AND COLUMN_NAME IN ('base_price', 'final_price')
+      AND IS_NULLABLE = 'NO'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
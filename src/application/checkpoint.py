@@ -0,0 +1,152 @@
+"""Durable progress journal for resuming interrupted scraping runs."""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, TextIO
+
+from src.domain.models import ScrapeJob, ScrapeResult
+from src.utils.timezone import now_argentina
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal:
+    """Append-only journal of the jobs completed in the current run.
+
+    The first line identifies the run (``run_id``, usually the run date); each
+    following line records one completed (hotel_id, checkin, checkout) job and
+    is fsynced before returning, so progress survives OOM kills and reboots.
+    A final ``finished`` line marks the run as complete.
+    """
+
+    def __init__(self, path: Path, run_id: str, completed: set[tuple[int, str, str]]) -> None:
+        """Initialize the journal. Use RunJournal.open() instead.
+
+        Args:
+            path: Journal file path.
+            run_id: Identifier of the run.
+            completed: Keys of the jobs already completed.
+        """
+        self.path = path
+        self.run_id = run_id
+        self.completed = completed
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+
+    @classmethod
+    def open(cls, path: str | Path, run_id: str, resume: bool = False) -> "RunJournal":
+        """Open the journal for a run.
+
+        With ``resume``, the completed jobs of an unfinished journal with the
+        same run_id are loaded. Otherwise (or if the journal belongs to another
+        run or is finished) a new journal is started.
+
+        Args:
+            path: Journal file path.
+            run_id: Identifier of the run (e.g. the run date).
+            resume: Whether to continue the previous run.
+
+        Returns:
+            Opened journal.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        completed: set[tuple[int, str, str]] = set()
+        if resume and path.exists():
+            header, completed, finished = cls._read(path)
+            if header.get("run_id") != run_id:
+                logger.warning(
+                    f"Checkpoint {path} belongs to run {header.get('run_id')!r}, "
+                    f"starting a new run {run_id!r}"
+                )
+                completed = set()
+            elif finished:
+                logger.info(f"Checkpoint {path} is from a finished run, starting over")
+                completed = set()
+            else:
+                journal = cls(path, run_id, completed)
+                journal._file = open(path, "a", encoding="utf-8")
+                if not cls._ends_with_newline(path):
+                    # Terminate a record cut by a crash before appending
+                    journal._file.write("\n")
+                logger.info(f"Resuming run {run_id}: {len(completed)} jobs already completed")
+                return journal
+
+        journal = cls(path, run_id, set())
+        journal._file = open(path, "w", encoding="utf-8")
+        journal._append({"run_id": run_id, "started_at": now_argentina().isoformat()})
+        return journal
+
+    def is_done(self, job: ScrapeJob) -> bool:
+        """Whether the job was completed earlier in this run."""
+        return job.key in self.completed
+
+    def mark_done(self, job: ScrapeJob | ScrapeResult) -> None:
+        """Durably record a completed job or saved scrape result (thread-safe)."""
+        hotel_id, checkin, checkout = job.key
+        with self._lock:
+            if job.key in self.completed:
+                return
+            self.completed.add(job.key)
+            self._append({"hotel_id": hotel_id, "checkin": checkin, "checkout": checkout})
+
+    def finish(self) -> None:
+        """Mark the run as complete and close the journal."""
+        with self._lock:
+            self._append({"finished": True, "finished_at": now_argentina().isoformat()})
+        self.close()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Write one record and force it to disk."""
+        if self._file is None:
+            raise RuntimeError("Journal is closed")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        """Whether the file is empty or its last byte is a newline."""
+        with open(path, "rb") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    @staticmethod
+    def _read(path: Path) -> tuple[dict[str, Any], set[tuple[int, str, str]], bool]:
+        """Read a journal, tolerating a truncated last line.
+
+        Returns:
+            Tuple of (header, completed job keys, finished flag).
+        """
+        header: dict[str, Any] = {}
+        completed: set[tuple[int, str, str]] = set()
+        finished = False
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring corrupt checkpoint line {line_number} in {path}")
+                    continue
+                if "run_id" in record:
+                    header = record
+                elif record.get("finished"):
+                    finished = True
+                elif "hotel_id" in record:
+                    completed.add(
+                        (int(record["hotel_id"]), str(record["checkin"]), str(record["checkout"]))
+                    )
+        return header, completed, finished
@@ -0,0 +1,308 @@
+"""Persistence of scraped pages: scrape session plus room availabilities."""
+
+import logging
+from dataclasses import replace
+from typing import Any
+
+import mysql.connector
+from mysql.connector import MySQLConnection
+
+from src.config.settings import settings
+from src.domain.exceptions import DatabaseQueryError
+from src.domain.models import RoomAvailability, ScrapeResult
+from src.infrastructure.database.repositories import (
+    RoomRepository,
+    ScrapeSessionRepository,
+    normalize_room_name,
+)
+from src.infrastructure.database.room_type_cache import RoomTypeCache, room_type_cache
+from src.infrastructure.database.snapshot_cache import (
+    SnapshotCache,
+    SnapshotDelta,
+    snapshot_cache,
+)
+from src.utils.timing import timed
+
+logger = logging.getLogger(__name__)
+
+
+def new_results() -> dict[str, Any]:
+    """Return an empty results dictionary."""
+    return {
+        "sessions_created": 0,
+        "sessions_updated": 0,
+        "room_availabilities_created": 0,
+        "room_availabilities_unchanged": 0,
+        "errors": [],
+    }
+
+
+class ResultPersister:
+    """Saves scrape results with the repositories of one connection.
+
+    With settings.db_delta_storage, only the room types whose content changed
+    since the last stored snapshot of the session are inserted; unchanged ones
+    just get their updated_at bumped.
+    """
+
+    def __init__(
+        self,
+        connection: MySQLConnection,
+        room_types: RoomTypeCache | None = None,
+        snapshots: SnapshotCache | None = None,
+        skip_stale: bool = False,
+    ):
+        """Initialize the persister.
+
+        Args:
+            connection: Database connection.
+            room_types: Room type cache (defaults to the process-wide cache).
+            snapshots: Snapshot hash cache (defaults to the process-wide cache).
+            skip_stale: Do not save results whose session is already stored
+                with the same or a newer capture_date (used when replaying
+                old results); they are reported with ``stale=True``.
+        """
+        self.conn = connection
+        self.skip_stale = skip_stale
+        self.room_types = room_types or room_type_cache
+        self.snapshots = snapshots or snapshot_cache
+        self.room_repo = RoomRepository(connection)
+        self.session_repo = ScrapeSessionRepository(connection)
+
+    @timed("db_write")
+    def persist(
+        self, result: ScrapeResult, results: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Save one scrape result, committing each step.
+
+        Room type and room availability errors are reported in the results;
+        a failure saving the session is raised.
+
+        Args:
+            result: Scrape result to save.
+            results: Results dictionary to update (a new one by default).
+
+        Returns:
+            Results dictionary: sessions_created, sessions_updated,
+            room_availabilities_created, errors.
+
+        Raises:
+            DatabaseQueryError: If the session cannot be saved.
+        """
+        if results is None:
+            results = new_results()
+
+        if self.skip_stale and self.session_repo.has_newer_capture(result.session):
+            results["stale"] = True
+            return results
+
+        session_id = self._save_session(self.session_repo, result, results)
+        rows_to_save = self._resolve_rows(result, results)
+
+        try:
+            delta = self._write_rows(
+                self.session_repo,
+                session_id,
+                rows_to_save,
+                results,
+                complete=self._is_complete(result, rows_to_save),
+            )
+            if delta is not None:
+                self.snapshots.store(delta)
+        except DatabaseQueryError as e:
+            error_msg = f"Error saving room availabilities for session {session_id}: {str(e)}"
+            results["errors"].append(error_msg)
+            logger.error(error_msg)
+
+        return results
+
+    @timed("db_write_batch")
+    def persist_batch(self, batch: list[ScrapeResult]) -> list[dict[str, Any]]:
+        """Save several scrape results in a single transaction.
+
+        Room types are resolved first (the cache commits new room types on
+        its own), then every session and its rows are written and committed
+        once. If the transaction fails, it is rolled back and the results are
+        saved one by one, so a bad result does not lose the rest of the batch.
+
+        Args:
+            batch: Scrape results to save.
+
+        Returns:
+            One results dictionary per scrape result, in batch order. Results
+            that could not be saved carry ``failed=True``, stale ones (see
+            skip_stale) ``stale=True``.
+        """
+        repo = ScrapeSessionRepository(self.conn, autocommit=False)
+        outcomes = [new_results() for _ in batch]
+        if self.skip_stale:
+            for result, results in zip(batch, outcomes, strict=True):
+                if repo.has_newer_capture(result.session):
+                    results["stale"] = True
+        rows_per_result = [
+            [] if results.get("stale") else self._resolve_rows(result, results)
+            for result, results in zip(batch, outcomes, strict=True)
+        ]
+
+        deltas: list[SnapshotDelta] = []
+        try:
+            for result, rows, results in zip(batch, rows_per_result, outcomes, strict=True):
+                if results.get("stale"):
+                    continue
+                session_id = self._save_session(repo, result, results)
+                delta = self._write_rows(
+                    repo,
+                    session_id,
+                    rows,
+                    results,
+                    complete=self._is_complete(result, rows),
+                )
+                if delta is not None:
+                    deltas.append(delta)
+            self.conn.commit()
+            for delta in deltas:
+                self.snapshots.store(delta)
+            return outcomes
+        except (DatabaseQueryError, mysql.connector.Error) as e:
+            try:
+                self.conn.rollback()
+            except mysql.connector.Error:
+                pass
+            logger.warning(f"Batch of {len(batch)} results failed ({e}), saving one by one")
+
+        return [self._persist_or_fail(result) for result in batch]
+
+    def _persist_or_fail(self, result: ScrapeResult) -> dict[str, Any]:
+        """Save one result, turning any error into a failed results dictionary."""
+        try:
+            return self.persist(result)
+        except Exception as e:
+            hotel_id, checkin_date, _ = result.key
+            error_msg = f"Error saving date {checkin_date} for hotel {hotel_id}: {str(e)}"
+            logger.error(error_msg)
+            results = new_results()
+            results["errors"].append(error_msg)
+            results["failed"] = True
+            return results
+
+    def _write_rows(
+        self,
+        repo: ScrapeSessionRepository,
+        session_id: int,
+        rows: list[RoomAvailability],
+        results: dict[str, Any],
+        complete: bool = False,
+    ) -> SnapshotDelta | None:
+        """Write the room availabilities of a session and count them in results.
+
+        With delta storage, room types that dropped out of a complete capture
+        are recorded as unavailable (see SnapshotCache.diff).
+
+        Returns:
+            The delta to store in the snapshot cache once committed, or None
+            when delta storage is disabled.
+
+        Raises:
+            DatabaseQueryError: If a write fails.
+        """
+        if not settings.db_delta_storage:
+            results["room_availabilities_created"] = repo.create_room_availabilities_bulk(
+                session_id, rows
+            )
+            return None
+
+        delta = self.snapshots.diff(repo, session_id, rows, complete=complete)
+        results["room_availabilities_created"] = repo.create_room_availabilities_bulk(
+            session_id, delta.rows_to_insert, delta.content_hashes
+        )
+        repo.touch_room_availabilities(session_id, delta.unchanged)
+        results["room_availabilities_unchanged"] = delta.unchanged_rows
+        if delta.unchanged_rows:
+            logger.debug(
+                f"Session {session_id}: {delta.unchanged_rows} unchanged rows not rewritten"
+            )
+        if delta.unavailable:
+            logger.debug(
+                f"Session {session_id}: room types {delta.unavailable} no longer offered, "
+                "recorded as unavailable"
+            )
+        return delta
+
+    @staticmethod
+    def _is_complete(result: ScrapeResult, rows: list[RoomAvailability]) -> bool:
+        """Whether the rows to save hold every room type offered on the page.
+
+        An empty capture (room table not found, no room rows parsed) or one
+        with unresolved rows is not complete, so no room type missing from it
+        is recorded as unavailable.
+        """
+        return result.complete and bool(rows) and len(rows) == len(result.room_availabilities)
+
+    def _resolve_rows(
+        self, result: ScrapeResult, results: dict[str, Any]
+    ) -> list[RoomAvailability]:
+        """Resolve the room type of every row; unresolved rows are reported and skipped."""
+        hotel_id = result.session.hotel_id
+        try:
+            room_type_ids = self.room_types.resolve(
+                self.room_repo,
+                hotel_id,
+                (room.room_type_name for room in result.room_availabilities),
+            )
+        except DatabaseQueryError as e:
+            error_msg = f"Error resolving room types for hotel {hotel_id}: {str(e)}"
+            results["errors"].append(error_msg)
+            logger.error(error_msg)
+            return []
+
+        rows_to_save: list[RoomAvailability] = []
+        for room_availability in result.room_availabilities:
+            room_type_id = room_type_ids.get(normalize_room_name(room_availability.room_type_name))
+            if room_type_id is None:
+                error_msg = (
+                    f"Error processing room {room_availability.room_type_name}: "
+                    "Room name cannot be empty"
+                )
+                results["errors"].append(error_msg)
+                logger.error(f"Error processing room for hotel {hotel_id}: {error_msg}")
+                continue
+            rows_to_save.append(replace(room_availability, room_type_id=room_type_id))
+        return rows_to_save
+
+    @staticmethod
+    def _save_session(
+        repo: ScrapeSessionRepository, result: ScrapeResult, results: dict[str, Any]
+    ) -> int:
+        """Create or update the scrape session and count it in results.
+
+        Args:
+            repo: Session repository (autocommit or part of a batch transaction).
+            result: Scrape result whose session is saved.
+            results: Results dictionary to update.
+
+        Returns:
+            Session ID.
+        """
+        session = result.session
+        hotel_id = session.hotel_id
+
+        if settings.db_session_upsert:
+            session_id, created = repo.upsert(session, result.request_params)
+        else:
+            # Check if session exists
+            existing_session_id = repo.find_existing(
+                hotel_id, session.checkin_date, session.checkout_date
+            )
+            if existing_session_id:
+                repo.update(existing_session_id, session, result.request_params)
+                session_id, created = existing_session_id, False
+            else:
+                session_id, created = repo.create(session, result.request_params), True
+
+        if created:
+            results["sessions_created"] = 1
+            logger.debug("Created new scrape session %s for hotel %s", session_id, hotel_id)
+        else:
+            results["sessions_updated"] = 1
+            logger.debug("Updated existing scrape session %s for hotel %s", session_id, hotel_id)
+        return session_id
@@ -0,0 +1,163 @@
+"""Background writer persisting scrape results off the scraping threads."""
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from src.application.persist_results import ResultPersister, new_results
+from src.application.spool import ResultSpool
+from src.config.settings import settings
+from src.domain.models import ScrapeResult
+from src.infrastructure.database.connection import db_connection
+from src.infrastructure.metrics.prometheus import metrics
+
+logger = logging.getLogger(__name__)
+
+PersistCallback = Callable[[ScrapeResult, dict[str, Any]], None]
+
+_STOP = object()
+
+
+class ResultWriter:
+    """Producer/consumer pipeline between scrapers and MySQL.
+
+    Scrapers submit() results to a bounded queue and go on with the next
+    page; writer threads take up to ``batch_size`` queued results at a time
+    and save them in one transaction with a pooled connection. submit()
+    blocks while the queue is full (backpressure), and close() drains the
+    queue before stopping the writers. Results that cannot be saved go to the
+    ResultSpool, if any.
+    """
+
+    def __init__(
+        self,
+        threads: int | None = None,
+        queue_size: int | None = None,
+        batch_size: int | None = None,
+        on_persisted: PersistCallback | None = None,
+        spool: ResultSpool | None = None,
+    ) -> None:
+        """Initialize the writer (threads are started by start()).
+
+        Args:
+            threads: Writer threads (defaults to settings.db_writer_threads, min 1).
+            queue_size: Maximum queued results (defaults to settings.db_writer_queue_size).
+            batch_size: Results saved per transaction
+                (defaults to settings.db_writer_batch_size).
+            on_persisted: Optional callback invoked (from a writer thread) with
+                each result and its results dictionary once it has been saved
+                or has failed (``failed=True``) or been spooled (``spooled=True``).
+            spool: Optional local spool for results that cannot be saved.
+        """
+        self.threads = max(1, threads or settings.db_writer_threads)
+        self.batch_size = max(1, batch_size or settings.db_writer_batch_size)
+        self.on_persisted = on_persisted
+        self.spool = spool
+        self._queue: queue.Queue[Any] = queue.Queue(
+            maxsize=max(1, queue_size or settings.db_writer_queue_size)
+        )
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the writer threads."""
+        for writer_id in range(1, self.threads + 1):
+            thread = threading.Thread(
+                target=self._writer_loop, name=f"db-writer-{writer_id}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, result: ScrapeResult) -> None:
+        """Queue a result for saving, blocking while the queue is full.
+
+        Args:
+            result: Scrape result to save.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("ResultWriter is closed")
+        self._queue.put(result)
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued results."""
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        """Save every queued result, then stop the writer threads."""
+        if self._closed:
+            return
+        self._closed = True
+        # One stop marker per thread, queued after every submitted result
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _writer_loop(self) -> None:
+        """Take batches from the queue until a stop marker is found."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch: list[ScrapeResult] = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[ScrapeResult]) -> None:
+        """Save a batch and report each outcome."""
+        try:
+            with db_connection() as conn:
+                outcomes = ResultPersister(conn).persist_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} scrape results: {e}")
+            metrics.record_error(e)
+            outcomes = []
+            for result in batch:
+                results = new_results()
+                results["errors"].append(
+                    f"Error saving date {result.session.checkin_date} "
+                    f"for hotel {result.session.hotel_id}: {str(e)}"
+                )
+                results["failed"] = True
+                outcomes.append(results)
+
+        if self.spool is not None:
+            for result, results in zip(batch, outcomes, strict=True):
+                if not results.get("failed"):
+                    continue
+                try:
+                    self.spool.append(result, error=results["errors"][-1])
+                except OSError as e:
+                    logger.error(f"Failed to spool scrape result {result.key}: {e}")
+                    continue
+                results["failed"] = False
+                results["spooled"] = True
+
+        logger.debug(f"Saved batch of {len(batch)} scrape results ({self.pending} queued)")
+        if self.on_persisted is None:
+            return
+        for result, results in zip(batch, outcomes, strict=True):
+            try:
+                self.on_persisted(result, results)
+            except Exception as e:
+                logger.warning(f"on_persisted callback failed: {e}")
@@ -0,0 +1,88 @@
+"""Deterministic split of the hotels between machines (``--shard INDEX/COUNT``)."""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.domain.models import Hotel
+
+_SHARD_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+_MASK_64 = (1 << 64) - 1
+
+
+def jump_consistent_hash(key: int, buckets: int) -> int:
+    """Map a key to one of ``buckets`` buckets (Lamping & Veach jump consistent hash).
+
+    Growing from N to N+1 buckets only moves keys into the new bucket, about
+    1/(N+1) of them; every other key keeps its bucket.
+
+    Args:
+        key: Non-negative integer key (reduced to 64 bits).
+        buckets: Number of buckets.
+
+    Returns:
+        Bucket number in [0, buckets).
+
+    Raises:
+        ValueError: If buckets < 1.
+    """
+    if buckets < 1:
+        raise ValueError("buckets must be >= 1")
+    key &= _MASK_64
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * 2862933555777941757 + 1) & _MASK_64
+        candidate = int((bucket + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return bucket
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of ``count`` disjoint slices of the hotels, numbered from 0."""
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1:
+            raise ValueError("shard count must be >= 1")
+        if not 0 <= self.index < self.count:
+            raise ValueError(f"shard index must be between 0 and {self.count - 1}")
+
+    @classmethod
+    def parse(cls, text: str) -> "Shard":
+        """Parse ``INDEX/COUNT`` (e.g. ``0/4``).
+
+        Raises:
+            ValueError: If the text is malformed or the index is out of range.
+        """
+        match = _SHARD_RE.match(text)
+        if match is None:
+            raise ValueError(f"invalid shard {text!r}, expected INDEX/COUNT (e.g. 0/4)")
+        return cls(int(match.group(1)), int(match.group(2)))
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    @property
+    def suffix(self) -> str:
+        """File name suffix of this shard's local state (e.g. ``shard-0-of-4``)."""
+        return f"shard-{self.index}-of-{self.count}"
+
+    def owns(self, hotel_id: int) -> bool:
+        """Whether the hotel is scraped by this shard."""
+        return jump_consistent_hash(hotel_id, self.count) == self.index
+
+    def select(self, hotels: list[Hotel]) -> list[Hotel]:
+        """The hotels of this shard, in their original order."""
+        return [hotel for hotel in hotels if self.owns(hotel.id)]
+
+    def path_for(self, path: str | Path) -> Path:
+        """Per-shard variant of a local state file (checkpoint, spool).
+
+        ``checkpoints/run.jsonl`` becomes ``checkpoints/run.shard-0-of-4.jsonl``,
+        so shards sharing a machine or a disk do not overwrite each other.
+        """
+        path = Path(path)
+        return path.with_name(f"{path.stem}.{self.suffix}{path.suffix}")
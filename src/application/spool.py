@@ -0,0 +1,170 @@
+"""Local spool of scrape results that could not be saved to MySQL."""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.application.persist_results import ResultPersister
+from src.config.settings import settings
+from src.domain.models import ScrapeResult
+from src.infrastructure.database.connection import db_connection
+from src.utils.timezone import now_argentina
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSpool:
+    """Append-only JSONL file of scrape results waiting to be saved.
+
+    Each line holds one ScrapeResult (see ScrapeResult.to_dict) and is
+    fsynced before returning, so a page that was already paid for survives
+    a database outage and a crash. replay() loads the spool into MySQL.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the spool (the file is created on the first append).
+
+        Args:
+            path: Spool file path.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def append(self, result: ScrapeResult, error: str = "") -> None:
+        """Durably add a result to the spool (thread-safe).
+
+        Args:
+            result: Scrape result that could not be saved.
+            error: Why it could not be saved, kept for reference.
+        """
+        record = {
+            "spooled_at": now_argentina().isoformat(),
+            "error": error,
+            "result": result.to_dict(),
+        }
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        hotel_id, checkin_date, _ = result.key
+        logger.warning(f"Spooled result of hotel {hotel_id} for {checkin_date} to {self.path}")
+
+    def load(self, path: Path | None = None) -> list[ScrapeResult]:
+        """Read the spooled results, skipping corrupt lines.
+
+        Args:
+            path: File to read (defaults to the spool file).
+
+        Returns:
+            Spooled results in the order they were written.
+        """
+        path = path or self.path
+        if not path.exists():
+            return []
+
+        results: list[ScrapeResult] = []
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    results.append(ScrapeResult.from_dict(json.loads(line)["result"]))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    logger.warning(f"Ignoring corrupt spool line {line_number} in {path}")
+        return results
+
+    def replay(self, batch_size: int | None = None) -> dict[str, Any]:
+        """Save the spooled results to MySQL.
+
+        The spool is first moved aside, so results spooled meanwhile by a
+        running scraper are not lost; results that fail again are appended
+        back to the spool. The leftover of an interrupted replay is replayed
+        in the same call, together with the current spool. Sessions are saved
+        with the same create/update (or upsert) logic as a live run, except
+        that results older than the stored capture of their hotel and dates
+        are skipped, so a late replay never overwrites fresher data.
+
+        Args:
+            batch_size: Results saved per transaction
+                (defaults to settings.db_writer_batch_size).
+
+        Returns:
+            Dictionary with replayed, failed, stale (skipped), sessions_created,
+            sessions_updated, room_availabilities_created and errors.
+        """
+        batch_size = max(1, batch_size or settings.db_writer_batch_size)
+        stats: dict[str, Any] = {
+            "replayed": 0,
+            "failed": 0,
+            "stale": 0,
+            "sessions_created": 0,
+            "sessions_updated": 0,
+            "room_availabilities_created": 0,
+            "errors": [],
+        }
+
+        replaying = self.path.with_name(self.path.name + ".replaying")
+        with self._lock:
+            if replaying.exists():
+                # Leftover of an interrupted replay: the current spool is replayed with it
+                if self.path.exists():
+                    self._merge_into(replaying)
+            elif self.path.exists():
+                os.replace(self.path, replaying)
+            else:
+                return stats
+
+        results = self.load(replaying)
+        logger.info(f"Replaying {len(results)} spooled results from {self.path}")
+
+        for start in range(0, len(results), batch_size):
+            batch = results[start : start + batch_size]
+            try:
+                with db_connection() as conn:
+                    outcomes = ResultPersister(conn, skip_stale=True).persist_batch(batch)
+            except Exception as e:
+                outcomes = [{"failed": True, "errors": [str(e)]} for _ in batch]
+
+            for result, outcome in zip(batch, outcomes, strict=True):
+                if outcome.get("failed"):
+                    stats["failed"] += 1
+                    self.append(result, error=outcome["errors"][-1])
+                elif outcome.get("stale"):
+                    stats["stale"] += 1
+                    hotel_id, checkin_date, _ = result.key
+                    logger.info(
+                        f"Skipped spooled result of hotel {hotel_id} for {checkin_date}: "
+                        "a newer capture is already saved"
+                    )
+                else:
+                    stats["replayed"] += 1
+                    stats["sessions_created"] += outcome.get("sessions_created", 0)
+                    stats["sessions_updated"] += outcome.get("sessions_updated", 0)
+                    stats["room_availabilities_created"] += outcome.get(
+                        "room_availabilities_created", 0
+                    )
+                stats["errors"].extend(outcome.get("errors", []))
+
+        replaying.unlink()
+        return stats
+
+    def _merge_into(self, target: Path) -> None:
+        """Append the spool file to target and remove it (caller holds the lock)."""
+        with open(self.path, "rb") as src:
+            data = src.read()
+        with open(target, "rb+") as dst:
+            if dst.seek(0, os.SEEK_END) > 0:
+                dst.seek(-1, os.SEEK_END)
+                if dst.read(1) != b"\n":
+                    # Terminate a record cut by a crash before appending
+                    dst.write(b"\n")
+            dst.write(data)
+            dst.flush()
+            os.fsync(dst.fileno())
+        self.path.unlink()
@@ -6,16 +6,15 @@ from typing import Any
 
 from mysql.connector import MySQLConnection
 
+from src.application.persist_results import ResultPersister, new_results
 from src.config.settings import settings
-from src.domain.exceptions import DatabaseConnectionError, DatabaseQueryError, ScrapingError
-from src.domain.models import ScrapeSession
-from src.infrastructure.database.connection import get_db_connection
-from src.infrastructure.database.repositories import (
-    HotelRepository,
-    RoomRepository,
-    ScrapeSessionRepository,
-)
+from src.domain.exceptions import DatabaseConnectionError, ScrapingError
+from src.domain.models import ScrapeResult, ScrapeSession
+from src.infrastructure.database.room_type_cache import RoomTypeCache
 from src.infrastructure.scraping.booking_scraper import BookingScraper
+from src.infrastructure.scraping.browser_pool import BrowserPool
+from src.infrastructure.scraping.scraper_session import ScraperSession
+from src.utils.timing import span
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +22,30 @@ logger = logging.getLogger(__name__)
 class UpdatePricesService:
     """Service for updating hotel prices through scraping."""
 
-    def __init__(self, connection: MySQLConnection, proxy: str | None = None) -> None:
+    def __init__(
+        self,
+        connection: MySQLConnection | None,
+        proxy: str | None = None,
+        scraper_session: ScraperSession | BrowserPool | None = None,
+        room_types: RoomTypeCache | None = None,
+    ) -> None:
         """Initialize the service.
 
         Args:
-            connection: Database connection.
+            connection: Database connection, or None when the service is only
+                used to scrape (see scrape()) and results are saved elsewhere.
             proxy: Optional proxy URL.
+            scraper_session: Optional caller-owned session or browser pool
+                providing long-lived scrapers. When omitted, a new browser is
+                started for every call.
+            room_types: Room type cache (defaults to the process-wide cache).
         """
         self.conn = connection
         self.proxy = proxy
-        self.hotel_repo = HotelRepository(connection)
-        self.room_repo = RoomRepository(connection)
-        self.session_repo = ScrapeSessionRepository(connection)
+        self.scraper_session = scraper_session
+        self.persister = (
+            ResultPersister(connection, room_types=room_types) if connection is not None else None
+        )
 
     def update_hotel_prices(
         self,
@@ -69,127 +80,151 @@ class UpdatePricesService:
             ScrapingError: If scraping fails.
             DatabaseQueryError: If database operations fail.
         """
+        if self.persister is None:
+            raise DatabaseConnectionError("UpdatePricesService needs a connection to save results")
+
+        scrape_result, results = self.scrape(
+            hotel_id=hotel_id,
+            hotel_url=hotel_url,
+            checkin_date=checkin_date,
+            checkout_date=checkout_date,
+            adults=adults,
+            children=children,
+            currency=currency,
+            extraction_mode=extraction_mode,
+            proxy_id=proxy_id,
+        )
+        if scrape_result is None:
+            return results
+
+        try:
+            self.persister.persist(scrape_result, results)
+        except Exception as e:
+            error_msg = f"Error updating prices for hotel {hotel_id}: {str(e)}"
+            results["errors"].append(error_msg)
+            logger.error(error_msg)
+            raise ScrapingError(error_msg) from e
+
+        logger.info(
+            f"Completed scraping for hotel {hotel_id} - "
+            f"Created {results['room_availabilities_created']} room availabilities"
+        )
+        return results
+
+    def scrape(
+        self,
+        hotel_id: int,
+        hotel_url: str,
+        checkin_date: str,
+        checkout_date: str,
+        adults: int = 1,
+        children: int = 0,
+        currency: str | None = None,
+        extraction_mode: str = "daily",
+        proxy_id: int | None = None,
+    ) -> tuple[ScrapeResult | None, dict[str, Any]]:
+        """Scrape one page without touching the database.
+
+        Args:
+            hotel_id: Hotel ID.
+            hotel_url: Hotel URL on Booking.com.
+            checkin_date: Check-in date (YYYY-MM-DD).
+            checkout_date: Check-out date (YYYY-MM-DD).
+            adults: Number of adults.
+            children: Number of children.
+            currency: Currency code (defaults to settings.booking_currency).
+            extraction_mode: Extraction mode ('daily' or 'restriction').
+            proxy_id: Optional proxy ID.
+
+        Returns:
+            Tuple of (scrape result to persist, or None if scraping failed;
+            results dictionary with the scraping errors and ``rooms_scraped``).
+
+        Raises:
+            ScrapingError: If the scraper raises unexpectedly.
+        """
         if currency is None:
             currency = settings.booking_currency
 
-        results = {
-            "sessions_created": 0,
-            "sessions_updated": 0,
-            "room_availabilities_created": 0,
-            "errors": [],
-        }
+        results = new_results()
 
-        logger.info(
-            f"Starting scraping for hotel {hotel_id} - "
-            f"Check-in: {checkin_date} to Check-out: {checkout_date}"
+        logger.debug(
+            "Starting scraping for hotel %s - Check-in: %s to Check-out: %s",
+            hotel_id,
+            checkin_date,
+            checkout_date,
         )
 
         # Scrape hotel data
-        scraper = BookingScraper(proxy=self.proxy)
-        try:
-            scraped_data = scraper.scrape_hotel(
-                hotel_url=hotel_url,
-                checkin_date=checkin_date,
-                checkout_date=checkout_date,
-                adults=adults,
-                children=children,
-                currency=currency,
-            )
-
-            if not scraped_data.success:
-                error_msg = scraped_data.error_message or "Unknown scraping error"
-                results["errors"].append(error_msg)
-                logger.error(f"Scraping failed for hotel {hotel_id}: {error_msg}")
-                return results
-
-            # Create or update scrape session
-            session = ScrapeSession(
-                hotel_id=hotel_id,
-                checkin_date=checkin_date,
-                checkout_date=checkout_date,
-                capture_date=scraped_data.capture_date,
-                url_requested=hotel_url,
-                adults=adults,
-                children=children,
-                currency=currency,
-                success=True,
-                room_types_found=len(scraped_data.room_availabilities),
-                proxy_id=proxy_id,
-            )
-
-            request_params = {
-                "checkin_date": checkin_date,
-                "checkout_date": checkout_date,
-                "adults": adults,
-                "children": children,
-                "currency": currency,
-                "extraction_mode": extraction_mode,
-            }
-
-            # Check if session exists
-            existing_session_id = self.session_repo.find_existing(
-                hotel_id, checkin_date, checkout_date
-            )
-
-            if existing_session_id:
-                # Update existing session
-                self.session_repo.update(existing_session_id, session, request_params)
-                results["sessions_updated"] = 1
-                session_id = existing_session_id
-                logger.info(
-                    f"Updated existing scrape session {session_id} for hotel {hotel_id}"
-                )
+        with span("browser_acquire"):
+            if self.scraper_session is not None:
+                scraper = self.scraper_session.acquire()
             else:
-                # Create new session
-                session_id = self.session_repo.create(session, request_params)
-                results["sessions_created"] = 1
-                logger.info(
-                    f"Created new scrape session {session_id} for hotel {hotel_id}"
+                scraper = BookingScraper(proxy=self.proxy)
+        scrape_failed = True
+        try:
+            with span("scrape"):
+                scraped_data = scraper.scrape_hotel(
+                    hotel_url=hotel_url,
+                    checkin_date=checkin_date,
+                    checkout_date=checkout_date,
+                    adults=adults,
+                    children=children,
+                    currency=currency,
                 )
-
-            # Save room availabilities
-            for room_availability in scraped_data.room_availabilities:
-                try:
-                    # Find or create room type
-                    room_type_id = self.room_repo.find_or_create(
-                        hotel_id=hotel_id,
-                        room_name=room_availability.room_type_name,
-                        description="",
-                    )
-
-                    # Create room availability
-                    self.session_repo.create_room_availability(
-                        scrape_session_id=session_id,
-                        room_type_id=room_type_id,
-                        availability=room_availability.availability,
-                        base_price=room_availability.base_price,
-                        final_price=room_availability.final_price,
-                        offer=room_availability.offer,
-                        non_refundable=room_availability.non_refundable,
-                    )
-
-                    results["room_availabilities_created"] += 1
-                except Exception as e:
-                    error_msg = (
-                        f"Error processing room {room_availability.room_type_name}: {str(e)}"
-                    )
-                    results["errors"].append(error_msg)
-                    logger.error(f"Error processing room for hotel {hotel_id}: {e}")
-
-            logger.info(
-                f"Completed scraping for hotel {hotel_id} - "
-                f"Created {results['room_availabilities_created']} room availabilities"
-            )
-
+            scrape_failed = not scraped_data.success
         except Exception as e:
             error_msg = f"Error updating prices for hotel {hotel_id}: {str(e)}"
             results["errors"].append(error_msg)
             logger.error(error_msg)
             raise ScrapingError(error_msg) from e
         finally:
-            scraper.close()
+            if self.scraper_session is not None:
+                self.scraper_session.release(scraper, failed=scrape_failed)
+            else:
+                scraper.close()
 
-        return results
+        if not scraped_data.success:
+            error_msg = scraped_data.error_message or "Unknown scraping error"
+            results["errors"].append(error_msg)
+            logger.error(f"Scraping failed for hotel {hotel_id}: {error_msg}")
+            return None, results
+
+        results["rooms_scraped"] = len(scraped_data.room_availabilities)
+
+        # Create or update scrape session
+        session = ScrapeSession(
+            hotel_id=hotel_id,
+            checkin_date=checkin_date,
+            checkout_date=checkout_date,
+            capture_date=scraped_data.capture_date,
+            url_requested=hotel_url,
+            adults=adults,
+            children=children,
+            currency=currency,
+            success=True,
+            room_types_found=len(scraped_data.room_availabilities),
+            proxy_id=proxy_id,
+        )
+
+        request_params = {
+            "checkin_date": checkin_date,
+            "checkout_date": checkout_date,
+            "adults": adults,
+            "children": children,
+            "currency": currency,
+            "extraction_mode": extraction_mode,
+        }
+
+        return (
+            ScrapeResult(
+                session,
+                request_params,
+                scraped_data.room_availabilities,
+                complete=scraped_data.complete,
+            ),
+            results,
+        )
 
     def update_hotel_for_date_range(
         self,
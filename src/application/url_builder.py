@@ -79,8 +79,9 @@ def build_booking_url(
     # - sr_pri_blocks
 
     # Build URL with country code and language code in slug
-    # Format: https://www.booking.com/hotel/{country_code}/{hotel_slug}.{language_code}.html
-    base_url = f"https://www.booking.com/hotel/{country_code}/{hotel_slug}.{language_code}.html"
+    # Format: {booking_base_url}/hotel/{country_code}/{hotel_slug}.{language_code}.html
+    site = settings.booking_base_url.rstrip("/")
+    base_url = f"{site}/hotel/{country_code}/{hotel_slug}.{language_code}.html"
     
     # Use urlencode with quote_via=quote_plus to properly encode special characters
     query_string = urlencode(params, quote_via=quote_plus, safe="")
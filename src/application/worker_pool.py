@@ -0,0 +1,333 @@
+"""Concurrent worker pool for scraping jobs."""
+
+import logging
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.application.persist_results import ResultPersister
+from src.application.result_writer import ResultWriter
+from src.application.spool import ResultSpool
+from src.application.update_prices import UpdatePricesService
+from src.application.url_builder import build_booking_url
+from src.config.settings import settings
+from src.domain.models import ScrapeJob, ScrapeResult
+from src.infrastructure.database.connection import db_connection
+from src.infrastructure.metrics.prometheus import metrics
+from src.infrastructure.scraping.browser_pool import BrowserPool
+from src.infrastructure.scraping.scraper_session import ScraperSession
+from src.utils.timing import job_timings, record, span
+
+logger = logging.getLogger(__name__)
+
+JobOutcome = tuple[ScrapeJob, dict[str, Any]]
+
+
+def empty_results() -> dict[str, Any]:
+    """Return an empty results dictionary as produced by UpdatePricesService."""
+    return {
+        "sessions_created": 0,
+        "sessions_updated": 0,
+        "room_availabilities_created": 0,
+        "errors": [],
+    }
+
+
+class ScrapeWorker:
+    """Independent scraper worker owning its own browser and proxy.
+
+    Database connections are borrowed from the shared pool for each job. When
+    a BrowserPool is given, browsers are borrowed from it instead. When a
+    ResultWriter is given, scraped pages are handed to it and the worker moves
+    on without waiting for the database. Pages that cannot be saved go to the
+    ResultSpool, if any.
+    """
+
+    def __init__(
+        self,
+        worker_id: int,
+        proxy: str | None = None,
+        browser_pool: BrowserPool | None = None,
+        result_writer: ResultWriter | None = None,
+        spool: ResultSpool | None = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            worker_id: Worker number (1-based), used in logs.
+            proxy: Optional proxy URL used for every job of this worker.
+            browser_pool: Optional shared browser pool (owned by the caller).
+            result_writer: Optional background writer (owned by the caller).
+            spool: Optional local spool for pages that cannot be saved.
+        """
+        self.worker_id = worker_id
+        self.proxy = proxy
+        self.browser_pool = browser_pool
+        self.result_writer = result_writer
+        self.spool = spool
+        self.scraper_session: ScraperSession | BrowserPool = (
+            browser_pool if browser_pool is not None else ScraperSession(proxy=proxy)
+        )
+
+    def run_job(self, job: ScrapeJob) -> dict[str, Any]:
+        """Scrape one job and persist the results.
+
+        With a result writer, the scraped page is queued for saving and the
+        returned results carry ``queued=True`` instead of the saved counts.
+        With a spool, a page that cannot be saved is spooled (``spooled=True``).
+
+        Args:
+            job: Job to process.
+
+        Returns:
+            Results dictionary: sessions_created, sessions_updated,
+            room_availabilities_created, errors (plus ``queued`` or
+            ``spooled`` when the page was not saved yet).
+
+        Raises:
+            Exception: Any error raised while connecting, scraping or saving.
+        """
+        # Build URL with all required parameters
+        hotel_url = build_booking_url(
+            hotel_slug=job.hotel_slug,
+            checkin=job.checkin_date,
+            checkout=job.checkout_date,
+            currency=job.currency,
+            adults=1,
+            children=0,
+        )
+        params: dict[str, Any] = {
+            "hotel_id": job.hotel_id,
+            "hotel_url": hotel_url,
+            "checkin_date": job.checkin_date,
+            "checkout_date": job.checkout_date,
+            "adults": 1,
+            "children": 0,
+            "currency": job.currency,
+            "extraction_mode": "daily",
+            "proxy_id": None,
+        }
+
+        # The page is scraped before borrowing a connection, which is only held to save it
+        service = UpdatePricesService(None, proxy=self.proxy, scraper_session=self.scraper_session)
+        scrape_result, results = service.scrape(**params)
+        if scrape_result is None:
+            return results
+
+        if self.result_writer is not None:
+            # Blocks while the writer queue is full
+            self.result_writer.submit(scrape_result)
+            results["queued"] = True
+            return results
+
+        self._save(scrape_result, results)
+        return results
+
+    def _save(self, scrape_result: ScrapeResult, results: dict[str, Any]) -> None:
+        """Save a scraped page, spooling it locally if the database fails.
+
+        Raises:
+            Exception: Any error raised while saving, when there is no spool.
+        """
+        hotel_id, checkin_date, _ = scrape_result.key
+        try:
+            with db_connection() as conn:
+                ResultPersister(conn).persist(scrape_result, results)
+        except Exception as e:
+            if self.spool is None:
+                raise
+            metrics.record_error(e)
+            error_msg = f"Error saving date {checkin_date} for hotel {hotel_id}: {str(e)}"
+            logger.error(error_msg)
+            results["errors"].append(error_msg)
+            self.spool.append(scrape_result, error=str(e))
+            results["spooled"] = True
+            return
+
+        logger.info(
+            f"Completed scraping for hotel {hotel_id} - "
+            f"Created {results['room_availabilities_created']} room availabilities"
+        )
+
+    def process(self, job: ScrapeJob) -> dict[str, Any]:
+        """Run a job, turning any exception into an error entry in the results.
+
+        Args:
+            job: Job to process.
+
+        Returns:
+            Results dictionary (never raises). When the job raised, the
+            dictionary carries ``failed=True``. ``timings`` holds the seconds
+            spent in each stage of the job.
+        """
+        with job_timings() as timings:
+            try:
+                with span("job"):
+                    results = self.run_job(job)
+            except Exception as e:
+                error_msg = (
+                    f"Error processing date {job.checkin_date} for hotel {job.hotel_id}: {str(e)}"
+                )
+                logger.error(error_msg)
+                metrics.record_error(e)
+                results = empty_results()
+                results["errors"].append(error_msg)
+                results["failed"] = True
+
+        results["timings"] = {stage: round(seconds, 3) for stage, seconds in timings.items()}
+        logger.debug(
+            "Job timings for hotel %s on %s",
+            job.hotel_id,
+            job.checkin_date,
+            extra={
+                "event": "job_timings",
+                "hotel_id": job.hotel_id,
+                "checkin_date": job.checkin_date,
+                "worker_id": self.worker_id,
+                "timings": results["timings"],
+            },
+        )
+        return results
+
+    def close(self) -> None:
+        """Release the resources owned by this worker."""
+        if self.browser_pool is None:
+            self.scraper_session.close()
+
+
+class ScrapeWorkerPool:
+    """Fans scraping jobs out to a bounded pool of independent workers."""
+
+    def __init__(
+        self,
+        workers: int,
+        proxy_provider: Callable[[], str | None] | None = None,
+        on_job_done: Callable[[ScrapeWorker, ScrapeJob, dict[str, Any]], None] | None = None,
+        delay_between_jobs: bool = True,
+        browser_pool_size: int | None = None,
+        result_writer: ResultWriter | None = None,
+        spool: ResultSpool | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            workers: Maximum number of concurrent workers.
+            proxy_provider: Callable returning the proxy for each new worker
+                (or for each new browser when a browser pool is used).
+            on_job_done: Optional callback invoked (from the worker thread) after each job.
+            delay_between_jobs: Whether each worker waits a random delay between its jobs.
+            browser_pool_size: Warm browsers shared by the workers; 0 gives each
+                worker its own browser (defaults to settings.browser_pool_size).
+            result_writer: Optional started background writer the workers hand
+                their scraped pages to (owned by the caller).
+            spool: Optional local spool for pages that cannot be saved.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.proxy_provider = proxy_provider
+        self.on_job_done = on_job_done
+        self.delay_between_jobs = delay_between_jobs
+        self.browser_pool_size = (
+            settings.browser_pool_size if browser_pool_size is None else browser_pool_size
+        )
+        self.browser_pool: BrowserPool | None = None
+        self.result_writer = result_writer
+        self.spool = spool
+
+    def run(self, jobs: list[ScrapeJob]) -> list[JobOutcome]:
+        """Process all jobs and wait for the workers to finish.
+
+        Args:
+            jobs: Jobs to process.
+
+        Returns:
+            List of (job, results) tuples in the original job order.
+        """
+        job_queue: queue.Queue[tuple[int, ScrapeJob]] = queue.Queue()
+        for index, job in enumerate(jobs):
+            job_queue.put((index, job))
+
+        worker_count = min(self.workers, len(jobs))
+        # Each worker collects its own outcomes; they are merged once all threads finish
+        outcomes: list[list[tuple[int, JobOutcome]]] = [[] for _ in range(worker_count)]
+        threads = [
+            threading.Thread(
+                target=self._worker_loop,
+                args=(worker_id, job_queue, outcomes[worker_id - 1]),
+                name=f"scrape-worker-{worker_id}",
+                daemon=True,
+            )
+            for worker_id in range(1, worker_count + 1)
+        ]
+
+        if self.browser_pool_size > 0 and worker_count:
+            self.browser_pool = BrowserPool(
+                size=self.browser_pool_size, proxy_provider=self.proxy_provider
+            )
+            self.browser_pool.start()
+
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            if self.browser_pool is not None:
+                self.browser_pool.close()
+                self.browser_pool = None
+
+        merged = sorted(
+            (item for worker_outcomes in outcomes for item in worker_outcomes),
+            key=lambda item: item[0],
+        )
+        return [outcome for _, outcome in merged]
+
+    def _worker_loop(
+        self,
+        worker_id: int,
+        job_queue: "queue.Queue[tuple[int, ScrapeJob]]",
+        outcomes: list[tuple[int, JobOutcome]],
+    ) -> None:
+        """Pull jobs from the queue until it is empty."""
+        proxy = None
+        # With a browser pool, each browser gets its proxy when it is started
+        if self.proxy_provider is not None and self.browser_pool is None:
+            try:
+                proxy = self.proxy_provider()
+            except Exception as e:
+                logger.warning(f"Worker {worker_id}: failed to get proxy ({e}), using none")
+
+        worker = ScrapeWorker(
+            worker_id,
+            proxy=proxy,
+            browser_pool=self.browser_pool,
+            result_writer=self.result_writer,
+            spool=self.spool,
+        )
+        try:
+            while True:
+                try:
+                    index, job = job_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                results = worker.process(job)
+                outcomes.append((index, (job, results)))
+
+                if self.on_job_done is not None:
+                    try:
+                        self.on_job_done(worker, job, results)
+                    except Exception as e:
+                        logger.warning(f"Worker {worker_id}: on_job_done callback failed: {e}")
+
+                # Random delay between requests of the same worker
+                if self.delay_between_jobs and not job_queue.empty():
+                    delay = random.randint(settings.scraping_delay_min, settings.scraping_delay_max)
+                    time.sleep(delay)
+                    record("delay", delay)
+        finally:
+            worker.close()
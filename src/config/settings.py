@@ -19,17 +19,43 @@ class Settings(BaseSettings):
     db_password: str = ""
     db_name: str = "bookeando-f4"
     db_port: int = 3306
+    db_pool_size: int = 5  # Raised automatically to workers + 1
+    db_pool_timeout: float = 30.0  # Seconds to wait for a free pooled connection
+    db_pool_health_check_idle: float = 5.0  # Ping pooled connections idle at least this long
+    db_session_upsert: bool = True  # Turned off at startup if migrations/001 is missing
+    db_delta_storage: bool = False  # Needs migrations/002; turned off at startup if missing
+    db_writer_threads: int = 0  # Background writer threads (0 = save inside each scrape job)
+    db_writer_queue_size: int = 50  # Scraped pages waiting to be saved before scrapers block
+    db_writer_batch_size: int = 20  # Scraped pages saved per transaction
+    spool_file: str = "spool/results.jsonl"  # Pages that could not be saved (empty = off)
 
     # Logging Configuration
     log_level: str = "INFO"
     log_format: str = "json"  # 'json' or 'text'
     log_file: str = "logs/scraper.log"
+    log_async: bool = True  # Format and write logs on a background thread
+    log_max_bytes: int = 50 * 1024 * 1024  # Rotate the log file at this size (0 = never)
+    log_backup_count: int = 5  # Rotated log files to keep
+    log_row_sample_rate: float = 0.05  # Share of scrapes whose rows are logged (DEBUG level only)
+
+    # Metrics Configuration
+    metrics_textfile: str = ""  # node_exporter textfile-collector file, e.g. *.prom (empty = off)
+    metrics_interval: float = 15.0  # Seconds between metrics file rewrites during a run
 
     # Scraping Configuration
     scraping_delay_min: int = 7
     scraping_delay_max: int = 20
-    scraping_timeout: int = 30
+    scraping_timeout: int = 30  # Page load timeout (seconds); slower loads are stopped
     headless_mode: bool = False  # Set to True for servers, False to see browser
+    scraper_session_max_pages: int = 25  # Pages per browser before recycling (1 = one per page)
+    browser_pool_size: int = 0  # Warm browsers shared by the workers (0 = one browser per worker)
+    browser_pool_max_memory_mb: int = 1500  # Recycle browsers above this RSS (0 = no check)
+    browser_pool_acquire_timeout: float = 300.0  # Seconds to wait for a free browser
+    scraper_ready_stable_ms: int = 500  # Rows unchanged this long = page ready
+    scraper_ready_poll_ms: int = 100
+    scraper_ready_max_wait: float = 5.0  # Hard cap (seconds) for the rows readiness wait
+    scraper_extraction_mode: str = "webelement"  # 'webelement', 'script' or 'html' (offline parse)
+    checkpoint_file: str = "checkpoints/run_journal.jsonl"  # Completed jobs, used by --resume
 
     # Chrome Configuration
     chrome_debug_port: int = 0
@@ -37,10 +63,20 @@ class Settings(BaseSettings):
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
+    chromedriver_path: str = ""  # Empty = resolved once per process with webdriver-manager
+    chrome_profile_template: bool = True  # Clone a prepared profile (consent accepted) per driver
+    chrome_profile_template_max_age_hours: int = 24  # Rebuild the template after this age
+    chrome_profile_root: str = ""  # Empty = <system temp dir>/bookeando-chrome; tmpfs is opt-in
+    chrome_page_load_strategy: str = "eager"  # 'normal', 'eager' (DOM ready) or 'none'
+    chrome_script_timeout: int = 10  # Timeout (seconds) for execute_script calls
+    chrome_block_profile: str = "balanced"  # 'off', 'balanced' or 'minimal' (see network_blocking)
+    chrome_block_extra_patterns: str = ""  # Extra comma separated URL patterns to block
+    chrome_network_usage: bool = False  # Log requests/bytes per page (Chrome performance log)
 
 
 
     # Booking.com URL Configuration
+    booking_base_url: str = "https://www.booking.com"  # Or a local stand-in (benchmark mode)
     booking_currency: str = "EUR"  # Default currency for Booking.com URLs
     booking_country_code: str = "ar"  # Country code (ar, es, etc.)
     booking_language_code: str = "es"  # Language code (es, en, etc.)
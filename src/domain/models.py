@@ -1,6 +1,6 @@
 """Domain models (dataclasses)."""
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -53,8 +53,8 @@ class RoomAvailability:
 
     room_type_id: int
     room_type_name: str
-    base_price: float
-    final_price: float
+    base_price: float | None  # None when the room type is recorded as unavailable
+    final_price: float | None
     availability: int | None
     offer: str | None = None
     non_refundable: bool = False
@@ -121,6 +121,10 @@ class ScrapedHotelData:
     adults: int = 1
     children: int = 0
     currency: str = "EUR"
+    wait_seconds: float = 0.0  # Time spent waiting for the page to be ready
+    network_bytes: int = 0  # Bytes transferred by the page (0 if not measured)
+    network_bytes_saved: int = 0  # Estimated bytes saved by request blocking
+    complete: bool = False  # Room table found and room rows parsed: the page lists every room
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -137,3 +141,59 @@ class ScrapedHotelData:
             "success": self.success,
         }
 
+
+@dataclass(frozen=True)
+class ScrapeJob:
+    """A single (hotel, checkin, checkout) scraping job."""
+
+    hotel_id: int
+    hotel_name: str
+    hotel_slug: str
+    currency: str
+    checkin_date: str
+    checkout_date: str
+
+    @property
+    def key(self) -> tuple[int, str, str]:
+        """Identity of the job: (hotel_id, checkin_date, checkout_date)."""
+        return (self.hotel_id, self.checkin_date, self.checkout_date)
+
+
+@dataclass
+class ScrapeResult:
+    """A scraped page ready to be persisted: its session and room rows."""
+
+    session: ScrapeSession
+    request_params: dict[str, Any]
+    room_availabilities: list[RoomAvailability] = field(default_factory=list)
+    complete: bool = False  # See ScrapedHotelData.complete
+
+    @property
+    def key(self) -> tuple[int, str, str]:
+        """Identity of the scraped job: (hotel_id, checkin_date, checkout_date)."""
+        return (self.session.hotel_id, self.session.checkin_date, self.session.checkout_date)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (see from_dict)."""
+        session = asdict(self.session)
+        session["capture_date"] = self.session.capture_date.isoformat()
+        return {
+            "session": session,
+            "request_params": self.request_params,
+            "room_availabilities": [asdict(room) for room in self.room_availabilities],
+            "complete": self.complete,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScrapeResult":
+        """Create ScrapeResult from a dictionary produced by to_dict."""
+        session = dict(data["session"])
+        session["capture_date"] = datetime.fromisoformat(session["capture_date"])
+        return cls(
+            session=ScrapeSession(**session),
+            request_params=data.get("request_params", {}),
+            room_availabilities=[
+                RoomAvailability(**room) for room in data.get("room_availabilities", [])
+            ],
+            complete=data.get("complete", False),
+        )
@@ -1,12 +1,21 @@
 """Database connection management."""
 
+import logging
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, cast
+
 import mysql.connector
 from mysql.connector import MySQLConnection
-from typing import Any
 
 from src.config.settings import settings
 from src.domain.exceptions import DatabaseConnectionError
 
+logger = logging.getLogger(__name__)
+
 
 def get_db_connection() -> MySQLConnection:
     """Create a new database connection.
@@ -14,11 +23,224 @@ def get_db_connection() -> MySQLConnection:
     Returns:
         MySQL connection object.
 
+    Raises:
+        DatabaseConnectionError: If connection fails.
+    """
+    return _connect(settings.db_connection_params)
+
+
+def _connect(params: dict[str, Any]) -> MySQLConnection:
+    """Open a connection with mysql.connector.connect().
+
     Raises:
         DatabaseConnectionError: If connection fails.
     """
     try:
-        return mysql.connector.connect(**settings.db_connection_params)
+        # connect() is typed as possibly returning a PooledMySQLConnection, which
+        # only happens when pool_* arguments are given
+        return cast(MySQLConnection, mysql.connector.connect(**params))
     except mysql.connector.Error as e:
         raise DatabaseConnectionError(f"Failed to connect to database: {e}") from e
 
+
+class ConnectionPool:
+    """Thread-safe pool of MySQL connections.
+
+    Connections are opened lazily up to ``size``, reused LIFO and
+    health-checked (ping) on borrow when they have been idle for a while.
+    Borrowing blocks up to ``timeout`` seconds when every connection is in use.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        timeout: float = 30.0,
+        health_check_idle: float = 5.0,
+        connect_params: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            size: Maximum number of open connections.
+            timeout: Seconds to wait for a free connection.
+            health_check_idle: Ping connections idle for at least this many seconds.
+            connect_params: mysql.connector.connect parameters
+                (defaults to settings.db_connection_params).
+        """
+        if size < 1:
+            raise ValueError("Pool size must be >= 1")
+        self.size = size
+        self.timeout = timeout
+        self.health_check_idle = health_check_idle
+        self.connect_params = connect_params or settings.db_connection_params
+        self._idle: queue.LifoQueue[tuple[MySQLConnection, float]] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self) -> MySQLConnection:
+        """Borrow a healthy connection from the pool.
+
+        Returns:
+            MySQL connection, to be given back with release().
+
+        Raises:
+            DatabaseConnectionError: If no connection is available in time or
+                a new connection cannot be opened.
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise DatabaseConnectionError(
+                f"No database connection available after {self.timeout}s "
+                f"(pool size {self.size})"
+            )
+
+        try:
+            while True:
+                try:
+                    conn, last_used = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+
+                if self._is_healthy(conn, last_used):
+                    return conn
+                self._discard(conn)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: MySQLConnection, discard: bool = False) -> None:
+        """Give a connection back to the pool.
+
+        Args:
+            conn: Connection returned by acquire().
+            discard: Close the connection instead of keeping it for reuse.
+        """
+        try:
+            if not discard:
+                try:
+                    # Never hand over a connection with a pending transaction
+                    if conn.in_transaction:
+                        conn.rollback()
+                    self._idle.put((conn, time.monotonic()))
+                    return
+                except Exception as e:
+                    logger.debug(f"Discarding pooled connection: {e}")
+            self._discard(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[MySQLConnection]:
+        """Borrow a connection for the duration of a with-block.
+
+        Yields:
+            MySQL connection.
+        """
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except Exception:
+            # Do not hand the connection out again if the error broke it
+            broken = not self._is_connected(conn)
+            raise
+        finally:
+            self.release(conn, discard=broken)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    def _connect(self) -> MySQLConnection:
+        """Open a new connection for the pool."""
+        return _connect(self.connect_params)
+
+    @staticmethod
+    def _is_connected(conn: MySQLConnection) -> bool:
+        """Whether the connection is still usable."""
+        try:
+            return bool(conn.is_connected())
+        except Exception:
+            return False
+
+    def _is_healthy(self, conn: MySQLConnection, last_used: float) -> bool:
+        """Check an idle connection before handing it out."""
+        if time.monotonic() - last_used < self.health_check_idle:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.debug(f"Pooled connection failed health check: {e}")
+            return False
+
+    @staticmethod
+    def _discard(conn: MySQLConnection) -> None:
+        """Close a connection, ignoring errors."""
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _create_pool(size: int | None = None) -> ConnectionPool:
+    """Build a pool from settings."""
+    return ConnectionPool(
+        size=size or settings.db_pool_size,
+        timeout=settings.db_pool_timeout,
+        health_check_idle=settings.db_pool_health_check_idle,
+    )
+
+
+def init_connection_pool(size: int | None = None) -> ConnectionPool:
+    """Create the process-wide connection pool, replacing any previous one.
+
+    Args:
+        size: Pool size (defaults to settings.db_pool_size).
+
+    Returns:
+        The new pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = _create_pool(size)
+        return _pool
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _create_pool()
+        return _pool
+
+
+def close_connection_pool() -> None:
+    """Close the idle connections of the process-wide pool."""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+
+
+@contextmanager
+def db_connection() -> Iterator[MySQLConnection]:
+    """Borrow a connection from the process-wide pool.
+
+    Yields:
+        MySQL connection, returned to the pool when the block exits.
+
+    Raises:
+        DatabaseConnectionError: If no connection can be obtained.
+    """
+    with get_connection_pool().connection() as conn:
+        yield conn
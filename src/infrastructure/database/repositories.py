@@ -1,14 +1,23 @@
 """Database repositories for domain entities."""
 
 import json
-from typing import Any
+from typing import Any, cast
 
 import mysql.connector
 from mysql.connector import MySQLConnection
 
 from src.domain.exceptions import DatabaseQueryError
-from src.domain.models import Hotel, Room, ScrapeSession
+from src.domain.models import Hotel, Room, RoomAvailability, ScrapeSession
 from src.utils.timezone import now_argentina_str
+from src.utils.timing import timed
+
+# Maximum rows per multi-row INSERT statement
+BULK_INSERT_CHUNK_SIZE = 500
+
+
+def normalize_room_name(name: str) -> str:
+    """Normalize a room type name for case-insensitive lookups."""
+    return name.strip().lower()
 
 
 class HotelRepository:
@@ -69,6 +78,69 @@ class HotelRepository:
             cur.close()
 
 
+class SchemaRepository:
+    """Inspects the current database schema (information_schema)."""
+
+    def __init__(self, connection: MySQLConnection):
+        """Initialize repository with database connection.
+
+        Args:
+            connection: MySQL connection object.
+        """
+        self.conn = connection
+
+    def has_unique_key(self, table: str, columns: tuple[str, ...]) -> bool:
+        """Whether the table has a unique key on exactly these columns.
+
+        Args:
+            table: Table name.
+            columns: Key columns (in any order).
+
+        Returns:
+            True if such a unique key (or primary key) exists.
+
+        Raises:
+            DatabaseQueryError: If query fails.
+        """
+        cur = self.conn.cursor()
+        try:
+            cur.execute(
+                """SELECT INDEX_NAME, COLUMN_NAME
+                    FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND NON_UNIQUE = 0""",
+                (table,),
+            )
+            rows = cast(list[tuple[str, str]], cur.fetchall())
+            keys: dict[str, set[str]] = {}
+            for index_name, column_name in rows:
+                keys.setdefault(index_name, set()).add(column_name.lower())
+            return {column.lower() for column in columns} in keys.values()
+        except mysql.connector.Error as e:
+            raise DatabaseQueryError(f"Failed to inspect keys of {table}: {e}") from e
+        finally:
+            cur.close()
+
+    def has_column(self, table: str, column: str, nullable: bool = False) -> bool:
+        """Whether the table has the column (accepting NULL, with nullable).
+
+        Raises:
+            DatabaseQueryError: If query fails.
+        """
+        query = """SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s"""
+        if nullable:
+            query += " AND IS_NULLABLE = 'YES'"
+        cur = self.conn.cursor()
+        try:
+            cur.execute(query, (table, column))
+            row = cur.fetchone()
+            return bool(row and row[0])
+        except mysql.connector.Error as e:
+            raise DatabaseQueryError(f"Failed to inspect columns of {table}: {e}") from e
+        finally:
+            cur.close()
+
+
 class RoomRepository:
     """Repository for Room entities."""
 
@@ -80,6 +152,7 @@ class RoomRepository:
         """
         self.conn = connection
 
+    @timed("db_room_types")
     def find_or_create(self, hotel_id: int, room_name: str, description: str = "") -> int:
         """Find or create a room type.
 
@@ -125,18 +198,96 @@ class RoomRepository:
         finally:
             cur.close()
 
+    @timed("db_room_types")
+    def fetch_by_hotel(self, hotel_id: int) -> dict[str, int]:
+        """Fetch every room type of a hotel in one query.
+
+        Args:
+            hotel_id: Hotel ID.
+
+        Returns:
+            Dictionary of normalized room name -> room type ID. When a name is
+            duplicated, the lowest ID wins.
+
+        Raises:
+            DatabaseQueryError: If query fails.
+        """
+        cur = self.conn.cursor()
+        try:
+            cur.execute(
+                "SELECT id, name FROM room_types WHERE hotel_id=%s ORDER BY id",
+                (hotel_id,),
+            )
+            rows = cast(list[tuple[int, str | None]], cur.fetchall())
+            room_types: dict[str, int] = {}
+            for room_type_id, name in rows:
+                room_types.setdefault(normalize_room_name(name or ""), room_type_id)
+            return room_types
+        except mysql.connector.Error as e:
+            raise DatabaseQueryError(f"Failed to fetch room types: {e}") from e
+        finally:
+            cur.close()
+
+    @timed("db_room_types")
+    def create_many(self, hotel_id: int, room_names: list[str], description: str = "") -> None:
+        """Create several room types with a single INSERT.
+
+        Args:
+            hotel_id: Hotel ID.
+            room_names: Room type names to create.
+            description: Description for every new room type.
+
+        Raises:
+            DatabaseQueryError: If insert fails.
+        """
+        if not room_names:
+            return
+
+        cur = self.conn.cursor()
+        try:
+            now = now_argentina_str()
+            placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(room_names))
+            params: list[Any] = []
+            for name in room_names:
+                params.extend((hotel_id, name, description, now, now))
+            cur.execute(
+                "INSERT INTO room_types (hotel_id, name, description, created_at, updated_at) "
+                f"VALUES {placeholders}",
+                tuple(params),
+            )
+            self.conn.commit()
+        except mysql.connector.Error as e:
+            self.conn.rollback()
+            raise DatabaseQueryError(f"Failed to create room types: {e}") from e
+        finally:
+            cur.close()
+
 
 class ScrapeSessionRepository:
     """Repository for ScrapeSession entities."""
 
-    def __init__(self, connection: MySQLConnection):
+    def __init__(self, connection: MySQLConnection, autocommit: bool = True):
         """Initialize repository with database connection.
 
         Args:
             connection: MySQL connection object.
+            autocommit: Commit (or roll back) after each write. When False the
+                caller owns the transaction and must commit or roll back.
         """
         self.conn = connection
+        self.autocommit = autocommit
+
+    def _commit(self) -> None:
+        """Commit the write unless the caller owns the transaction."""
+        if self.autocommit:
+            self.conn.commit()
 
+    def _rollback(self) -> None:
+        """Roll back the failed write unless the caller owns the transaction."""
+        if self.autocommit:
+            self.conn.rollback()
+
+    @timed("db_session")
     def find_existing(
         self, hotel_id: int, checkin_date: str, checkout_date: str
     ) -> int | None:
@@ -166,6 +317,40 @@ class ScrapeSessionRepository:
         finally:
             cur.close()
 
+    @timed("db_session")
+    def has_newer_capture(self, session: ScrapeSession) -> bool:
+        """Whether the stored session of the same hotel and dates was captured at or after this one.
+
+        Args:
+            session: ScrapeSession about to be saved.
+
+        Returns:
+            True if saving the session would replace a newer (or the same) capture.
+
+        Raises:
+            DatabaseQueryError: If query fails.
+        """
+        cur = self.conn.cursor()
+        try:
+            cur.execute(
+                """SELECT 1 FROM scrape_sessions
+                    WHERE hotel_id = %s AND checkin_date = %s AND checkout_date = %s
+                      AND capture_date >= %s
+                    LIMIT 1""",
+                (
+                    session.hotel_id,
+                    session.checkin_date,
+                    session.checkout_date,
+                    session.to_dict()["capture_date"],
+                ),
+            )
+            return cur.fetchone() is not None
+        except mysql.connector.Error as e:
+            raise DatabaseQueryError(f"Failed to check scrape session capture date: {e}") from e
+        finally:
+            cur.close()
+
+    @timed("db_session")
     def create(self, session: ScrapeSession, request_params: dict[str, Any]) -> int:
         """Create a new scrape session.
 
@@ -211,6 +396,9 @@ class ScrapeSessionRepository:
                 ),
             )
             new_id = cur.lastrowid
+            if new_id is None:
+                self._rollback()
+                raise DatabaseQueryError("Failed to create scrape session: no session ID returned")
 
             # Try to update additional fields if they exist
             try:
@@ -221,14 +409,88 @@ class ScrapeSessionRepository:
             except mysql.connector.Error:
                 pass  # Field may not exist
 
-            self.conn.commit()
+            self._commit()
             return new_id
         except mysql.connector.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise DatabaseQueryError(f"Failed to create scrape session: {e}") from e
         finally:
             cur.close()
 
+    @timed("db_session")
+    def upsert(self, session: ScrapeSession, request_params: dict[str, Any]) -> tuple[int, bool]:
+        """Create or update the session of (hotel_id, checkin_date, checkout_date).
+
+        Single INSERT ... ON DUPLICATE KEY UPDATE statement, which requires the
+        unique key added by migrations/001_scrape_sessions_unique_key.sql.
+
+        Args:
+            session: ScrapeSession domain object.
+            request_params: Request parameters to store as JSON.
+
+        Returns:
+            Tuple of (session ID, created) where created is False when an
+            existing session was updated.
+
+        Raises:
+            DatabaseQueryError: If the statement fails.
+        """
+        cur = self.conn.cursor()
+        try:
+            session_dict = session.to_dict()
+            capture_date = session_dict["capture_date"]
+            request_params_json = json.dumps(request_params, ensure_ascii=False)
+
+            cur.execute(
+                """INSERT INTO scrape_sessions
+                    (hotel_id, proxy_id, checkin_date, checkout_date, adults, children, currency,
+                     capture_date, url_requested, response_status, request_params, error_message,
+                     success, notes, room_types_found, created_at, updated_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                    id=LAST_INSERT_ID(id), proxy_id=VALUES(proxy_id),
+                    capture_date=VALUES(capture_date), adults=VALUES(adults),
+                    children=VALUES(children), currency=VALUES(currency),
+                    url_requested=VALUES(url_requested), response_status=VALUES(response_status),
+                    request_params=VALUES(request_params), error_message=VALUES(error_message),
+                    success=VALUES(success), notes=VALUES(notes),
+                    room_types_found=VALUES(room_types_found), updated_at=VALUES(updated_at)""",
+                (
+                    session_dict["hotel_id"],
+                    session_dict["proxy_id"],
+                    session_dict["checkin_date"],
+                    session_dict["checkout_date"],
+                    session_dict["adults"],
+                    session_dict["children"],
+                    session_dict["currency"],
+                    capture_date,
+                    session_dict["url_requested"],
+                    None,  # response_status
+                    request_params_json,
+                    session_dict["error_message"],
+                    session_dict["success"],
+                    None,  # notes
+                    session_dict["room_types_found"],
+                    capture_date,
+                    capture_date,
+                ),
+            )
+            # Affected rows: 1 = inserted, 2 = existing row updated
+            created = cur.rowcount == 1
+            session_id = cur.lastrowid
+            if session_id is None:
+                self._rollback()
+                raise DatabaseQueryError("Failed to upsert scrape session: no session ID returned")
+
+            self._commit()
+            return session_id, created
+        except mysql.connector.Error as e:
+            self._rollback()
+            raise DatabaseQueryError(f"Failed to upsert scrape session: {e}") from e
+        finally:
+            cur.close()
+
+    @timed("db_session")
     def update(
         self, session_id: int, session: ScrapeSession, request_params: dict[str, Any]
     ) -> None:
@@ -280,13 +542,14 @@ class ScrapeSessionRepository:
             except mysql.connector.Error:
                 pass  # Field may not exist
 
-            self.conn.commit()
+            self._commit()
         except mysql.connector.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise DatabaseQueryError(f"Failed to update scrape session: {e}") from e
         finally:
             cur.close()
 
+    @timed("db_rooms")
     def create_room_availability(
         self,
         scrape_session_id: int,
@@ -331,10 +594,172 @@ class ScrapeSessionRepository:
                     now,
                 ),
             )
-            self.conn.commit()
+            self._commit()
         except mysql.connector.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise DatabaseQueryError(f"Failed to create room availability: {e}") from e
         finally:
             cur.close()
 
+    @timed("db_rooms")
+    def create_room_availabilities_bulk(
+        self,
+        session_id: int,
+        rows: list[RoomAvailability],
+        content_hashes: dict[int, str] | None = None,
+    ) -> int:
+        """Create all room availability records of a session in one transaction.
+
+        Rows are written with multi-row INSERT statements (chunked for very
+        large pages) and committed once.
+
+        Args:
+            session_id: Scrape session ID.
+            rows: Room availabilities with room_type_id already resolved.
+            content_hashes: Optional snapshot hash per room type ID, stored in
+                the content_hash column (see migrations/002).
+
+        Returns:
+            Number of records created.
+
+        Raises:
+            DatabaseQueryError: If the insert fails (nothing is written).
+        """
+        if not rows:
+            return 0
+
+        columns = (
+            "scrape_session_id, room_type_id, room_available_count, offer, base_price, "
+            "final_price, non_refundable, created_at, updated_at"
+        )
+        row_placeholder = "(%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+        if content_hashes is not None:
+            columns += ", content_hash"
+            row_placeholder = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+        cur = self.conn.cursor()
+        try:
+            now = now_argentina_str()
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                chunk = rows[start : start + BULK_INSERT_CHUNK_SIZE]
+                placeholders = ", ".join([row_placeholder] * len(chunk))
+                params: list[Any] = []
+                for row in chunk:
+                    params.extend(
+                        (
+                            session_id,
+                            row.room_type_id,
+                            row.availability,
+                            row.offer,
+                            row.base_price,
+                            row.final_price,
+                            1 if row.non_refundable else 0,
+                            now,
+                            now,
+                        )
+                    )
+                    if content_hashes is not None:
+                        params.append(content_hashes.get(row.room_type_id))
+                cur.execute(
+                    f"INSERT INTO room_availabilities ({columns}) VALUES {placeholders}",
+                    tuple(params),
+                )
+            self._commit()
+            return len(rows)
+        except mysql.connector.Error as e:
+            self._rollback()
+            raise DatabaseQueryError(f"Failed to create room availabilities: {e}") from e
+        finally:
+            cur.close()
+
+    @timed("db_snapshot_lookup")
+    def fetch_latest_content_hashes(self, session_id: int) -> dict[int, str | None]:
+        """Get the content hash of the last stored snapshot of each room type.
+
+        Args:
+            session_id: Scrape session ID.
+
+        Returns:
+            Dictionary of room type ID -> content hash (None for rows written
+            before migrations/002).
+
+        Raises:
+            DatabaseQueryError: If query fails.
+        """
+        cur = self.conn.cursor()
+        try:
+            cur.execute(
+                """SELECT ra.room_type_id, ra.content_hash
+                    FROM room_availabilities ra
+                    JOIN (
+                        SELECT room_type_id, MAX(id) AS last_id
+                        FROM room_availabilities
+                        WHERE scrape_session_id = %s
+                        GROUP BY room_type_id
+                    ) latest ON latest.last_id = ra.id""",
+                (session_id,),
+            )
+            rows = cast(list[tuple[int, str | None]], cur.fetchall())
+            return {int(room_type_id): content_hash for room_type_id, content_hash in rows}
+        except mysql.connector.Error as e:
+            raise DatabaseQueryError(f"Failed to fetch room availability hashes: {e}") from e
+        finally:
+            cur.close()
+
+    @timed("db_rooms")
+    def touch_room_availabilities(self, session_id: int, content_hashes: dict[int, str]) -> int:
+        """Bump updated_at of the last stored snapshot of room types seen again unchanged.
+
+        Every row of the last snapshot is touched: the rows of a room type
+        written together with its latest row (same created_at, as set by
+        create_room_availabilities_bulk). Rows of older snapshots with the
+        same hash keep their updated_at.
+
+        Args:
+            session_id: Scrape session ID.
+            content_hashes: Content hash per room type ID of the unchanged snapshots.
+
+        Returns:
+            Number of rows updated.
+
+        Raises:
+            DatabaseQueryError: If update fails.
+        """
+        if not content_hashes:
+            return 0
+
+        conditions = " OR ".join(
+            ["(ra.room_type_id = %s AND ra.content_hash = %s)"] * len(content_hashes)
+        )
+        params: list[Any] = [session_id, now_argentina_str(), session_id]
+        for room_type_id, content_hash in content_hashes.items():
+            params.extend((room_type_id, content_hash))
+
+        cur = self.conn.cursor()
+        try:
+            # DISTINCT keeps the derived table materialized, as MySQL requires
+            # when it reads the table being updated
+            cur.execute(
+                f"""UPDATE room_availabilities ra
+                    JOIN (
+                        SELECT DISTINCT last_row.room_type_id, last_row.created_at
+                        FROM room_availabilities last_row
+                        JOIN (
+                            SELECT room_type_id, MAX(id) AS last_id
+                            FROM room_availabilities
+                            WHERE scrape_session_id = %s
+                            GROUP BY room_type_id
+                        ) latest ON latest.last_id = last_row.id
+                    ) snapshot ON snapshot.room_type_id = ra.room_type_id
+                        AND snapshot.created_at = ra.created_at
+                    SET ra.updated_at = %s
+                    WHERE ra.scrape_session_id = %s AND ({conditions})""",
+                tuple(params),
+            )
+            self._commit()
+            return cur.rowcount
+        except mysql.connector.Error as e:
+            self._rollback()
+            raise DatabaseQueryError(f"Failed to update room availabilities: {e}") from e
+        finally:
+            cur.close()
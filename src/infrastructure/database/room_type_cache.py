@@ -0,0 +1,82 @@
+"""Per-hotel room type cache shared by every worker of the process."""
+
+import logging
+import threading
+from collections.abc import Iterable
+
+from src.infrastructure.database.repositories import RoomRepository, normalize_room_name
+
+logger = logging.getLogger(__name__)
+
+
+class RoomTypeCache:
+    """Resolves room type names to IDs with one preload query per hotel.
+
+    All room types of a hotel are loaded the first time the hotel is seen and
+    kept in memory keyed by normalized name. Missing names are inserted in one
+    batch and the hotel is re-read afterwards.
+
+    Resolution is serialized per hotel, so concurrent workers of the process
+    never insert the same new room twice. If another process inserts a
+    duplicate at the same moment, the re-read keeps the lowest ID for the
+    name, so every process converges on the same room type.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._room_types: dict[int, dict[str, int]] = {}
+        self._hotel_locks: dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def resolve(
+        self, repo: RoomRepository, hotel_id: int, room_names: Iterable[str]
+    ) -> dict[str, int]:
+        """Return the room type ID of every name, creating the missing ones.
+
+        Args:
+            repo: Repository bound to the caller's connection.
+            hotel_id: Hotel ID.
+            room_names: Room type names (empty names are ignored).
+
+        Returns:
+            Dictionary of normalized room name -> room type ID.
+
+        Raises:
+            DatabaseQueryError: If loading or creating room types fails.
+        """
+        wanted: dict[str, str] = {}
+        for name in room_names:
+            if name.strip():
+                wanted.setdefault(normalize_room_name(name), name.strip())
+
+        with self._hotel_lock(hotel_id):
+            known = self._room_types.get(hotel_id)
+            if known is None:
+                known = repo.fetch_by_hotel(hotel_id)
+                self._room_types[hotel_id] = known
+                logger.debug(f"Loaded {len(known)} room types for hotel {hotel_id}")
+
+            missing = [name for key, name in wanted.items() if key not in known]
+            if missing:
+                repo.create_many(hotel_id, missing)
+                known.update(repo.fetch_by_hotel(hotel_id))
+                logger.info(f"Created {len(missing)} room types for hotel {hotel_id}")
+
+            return {key: known[key] for key in wanted if key in known}
+
+    def invalidate(self, hotel_id: int | None = None) -> None:
+        """Forget the cached room types of one hotel, or of every hotel."""
+        with self._lock:
+            if hotel_id is None:
+                self._room_types.clear()
+            else:
+                self._room_types.pop(hotel_id, None)
+
+    def _hotel_lock(self, hotel_id: int) -> threading.Lock:
+        """Return the lock serializing resolution for a hotel."""
+        with self._lock:
+            return self._hotel_locks.setdefault(hotel_id, threading.Lock())
+
+
+# Process-wide cache shared by every worker
+room_type_cache = RoomTypeCache()
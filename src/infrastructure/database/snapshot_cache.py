@@ -0,0 +1,161 @@
+"""Per-session room availability snapshot hashes, for delta storage."""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+
+from src.domain.models import RoomAvailability
+from src.infrastructure.database.repositories import ScrapeSessionRepository
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(rows: list[RoomAvailability]) -> str:
+    """Hash the stored fields of the rows of one room type.
+
+    Row order does not matter; the room type name is not included since the
+    rows are already grouped by room type ID.
+
+    Args:
+        rows: Room availabilities of one room type in one capture.
+
+    Returns:
+        16 hex characters hash.
+    """
+    values = sorted(
+        (
+            row.availability if row.availability is not None else -1,
+            row.offer or "",
+            round(row.base_price, 2) if row.base_price is not None else -1,
+            round(row.final_price, 2) if row.final_price is not None else -1,
+            row.non_refundable,
+        )
+        for row in rows
+    )
+    payload = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# Content hash of the row that marks a room type as no longer offered on the page
+UNAVAILABLE_HASH = content_hash([])
+
+
+def unavailable_row(room_type_id: int) -> RoomAvailability:
+    """Row recording that a room type dropped out of the page (e.g. sold out).
+
+    It becomes the last stored snapshot of the room type, so readers do not
+    keep seeing the previous prices as available. It has no prices (NULL, see
+    migrations/002) and its content hash is UNAVAILABLE_HASH.
+    """
+    return RoomAvailability(
+        room_type_id=room_type_id,
+        room_type_name="",
+        base_price=None,
+        final_price=None,
+        availability=0,
+    )
+
+
+@dataclass
+class SnapshotDelta:
+    """What to write for one session, as computed by SnapshotCache.diff()."""
+
+    session_id: int
+    rows_to_insert: list[RoomAvailability] = field(default_factory=list)
+    content_hashes: dict[int, str] = field(default_factory=dict)  # Every room type written
+    unchanged: dict[int, str] = field(default_factory=dict)  # Room types to bump
+    unchanged_rows: int = 0
+    unavailable: list[int] = field(default_factory=list)  # Room types that dropped out
+
+
+class SnapshotCache:
+    """Content hash of the last stored snapshot per (session, room type).
+
+    Hashes of a session are loaded with one query the first time the session
+    is seen and kept in memory. The cache is only updated through store(),
+    which callers invoke once their transaction has been committed, so a
+    rolled-back write is never mistaken for stored data.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._hashes: dict[int, dict[int, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def diff(
+        self,
+        repo: ScrapeSessionRepository,
+        session_id: int,
+        rows: list[RoomAvailability],
+        complete: bool = False,
+    ) -> SnapshotDelta:
+        """Split the rows of a capture into changed and unchanged room types.
+
+        Room types stored for the session but missing from a complete capture
+        get an unavailable_row(), unless their last snapshot already is one.
+
+        Args:
+            repo: Repository bound to the caller's connection.
+            session_id: Scrape session ID.
+            rows: Room availabilities with room_type_id resolved.
+            complete: Whether rows hold the whole page. For an empty capture
+                or one with unresolved rows, missing room types are not marked
+                unavailable.
+
+        Returns:
+            Delta with the rows to insert and the unchanged room types.
+
+        Raises:
+            DatabaseQueryError: If loading the stored hashes fails.
+        """
+        with self._lock:
+            known = self._hashes.get(session_id)
+        if known is None:
+            known = repo.fetch_latest_content_hashes(session_id)
+            with self._lock:
+                self._hashes[session_id] = known
+
+        by_room_type: dict[int, list[RoomAvailability]] = {}
+        for row in rows:
+            by_room_type.setdefault(row.room_type_id, []).append(row)
+
+        delta = SnapshotDelta(session_id=session_id)
+        for room_type_id, room_rows in by_room_type.items():
+            row_hash = content_hash(room_rows)
+            delta.content_hashes[room_type_id] = row_hash
+            if known.get(room_type_id) == row_hash:
+                delta.unchanged[room_type_id] = row_hash
+                delta.unchanged_rows += len(room_rows)
+            else:
+                delta.rows_to_insert.extend(room_rows)
+
+        if complete and rows:
+            for room_type_id, stored_hash in known.items():
+                if room_type_id in by_room_type:
+                    continue
+                delta.content_hashes[room_type_id] = UNAVAILABLE_HASH
+                if stored_hash == UNAVAILABLE_HASH:
+                    delta.unchanged[room_type_id] = UNAVAILABLE_HASH
+                else:
+                    delta.rows_to_insert.append(unavailable_row(room_type_id))
+                    delta.unavailable.append(room_type_id)
+        return delta
+
+    def store(self, delta: SnapshotDelta) -> None:
+        """Record a committed delta as the last stored snapshot."""
+        with self._lock:
+            self._hashes.setdefault(delta.session_id, {}).update(delta.content_hashes)
+
+    def invalidate(self, session_id: int | None = None) -> None:
+        """Forget the hashes of one session, or of every session."""
+        with self._lock:
+            if session_id is None:
+                self._hashes.clear()
+            else:
+                self._hashes.pop(session_id, None)
+
+
+# Process-wide cache shared by every worker and writer thread
+snapshot_cache = SnapshotCache()
@@ -1,13 +1,27 @@
 """Structured logging setup."""
 
+import atexit
+import copy
+import io
 import json
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from src.config.settings import settings
 
+# Write buffer of the log file in async mode; flushed whenever the queue is idle
+LOG_FILE_BUFFER_BYTES = 64 * 1024
+
+# Attributes every LogRecord has; anything else was passed with extra=
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+_listener: QueueListener | None = None
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
@@ -21,19 +35,139 @@ class JSONFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
 
-        # Add exception info if present
+        # Add exception info if present (already rendered when queued)
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
+
+        # Add extra fields: logger.info(..., extra={...}) sets them as record attributes
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                log_data[key] = value
+        if isinstance(log_data.get("extra"), dict):
+            log_data.update(log_data.pop("extra"))
+
+        return json.dumps(log_data, ensure_ascii=False, default=str)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Size-rotated file handler that does not flush after every record.
+
+    Records accumulate in the file buffer and are flushed by the queue
+    listener when it runs out of records, on ERROR records, on rollover and
+    on close. The file size is tracked from the bytes written, so deciding
+    on a rollover neither seeks the file (which would flush it) nor formats
+    the record a second time.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        buffer_size: int = LOG_FILE_BUFFER_BYTES,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            filename: Log file path.
+            max_bytes: Rotate when the file would exceed this size (0 = never).
+            backup_count: Rotated files to keep.
+            buffer_size: Write buffer size in bytes.
+        """
+        self.buffer_size = buffer_size
+        self.bytes_written = 0
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+
+    def _open(self) -> io.TextIOWrapper:
+        """Open the log file with a large write buffer."""
+        stream = cast(
+            io.TextIOWrapper,
+            open(
+                self.baseFilename,
+                self.mode,
+                buffering=self.buffer_size,
+                encoding=self.encoding,
+                errors=self.errors,
+            ),
+        )
+        self.bytes_written = os.path.getsize(self.baseFilename)
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format and write a record, flushing only for errors."""
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode("utf-8"))
+            if self.stream is None:
+                self.stream = self._open()
+            rollover = self.maxBytes > 0 and self.bytes_written + size > self.maxBytes
+            if rollover and self.bytes_written > 0:
+                self.doRollover()
+            self.stream.write(msg)
+            self.bytes_written += size
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _QueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Make the record safe to queue without formatting it.
+
+        Only the message arguments and the traceback are rendered here (they
+        may reference objects that change or are not picklable); JSON encoding
+        and the final formatting happen on the listener thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry."""
 
-        # Add extra fields
-        if hasattr(record, "extra") and isinstance(record.extra, dict):
-            log_data.update(record.extra)
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Get the next record, flushing buffered output before waiting."""
+        records = cast("queue.Queue[logging.LogRecord]", self.queue)
+        try:
+            return records.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return records.get(block)
 
-        return json.dumps(log_data, ensure_ascii=False)
+
+def _build_formatter() -> logging.Formatter:
+    """Formatter for the configured log format."""
+    if settings.log_format == "json":
+        return JSONFormatter()
+    return logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
 
 
 def setup_logging() -> None:
-    """Configure structured logging based on settings."""
+    """Configure structured logging based on settings.
+
+    With settings.log_async, loggers only put records on a queue; a listener
+    thread formats them and writes the console and the buffered, size-rotated
+    log file. Call shutdown_logging() (also registered with atexit) to flush
+    pending records.
+    """
+    shutdown_logging()
+
     # Create logs directory if it doesn't exist
     log_file_path = Path(settings.log_file)
     if log_file_path.parent:
@@ -46,32 +180,58 @@ def setup_logging() -> None:
     # Remove existing handlers
     root_logger.handlers.clear()
 
+    handlers: list[logging.Handler] = []
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-
-    if settings.log_format == "json":
-        console_handler.setFormatter(JSONFormatter())
-    else:
-        console_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
-        )
-
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(_build_formatter())
+    handlers.append(console_handler)
 
     # File handler
     if settings.log_file:
-        file_handler = logging.FileHandler(settings.log_file, encoding="utf-8")
-        file_handler.setLevel(logging.DEBUG)
-
-        if settings.log_format == "json":
-            file_handler.setFormatter(JSONFormatter())
+        file_handler: logging.Handler
+        if settings.log_async:
+            file_handler = BufferedRotatingFileHandler(
+                settings.log_file,
+                max_bytes=settings.log_max_bytes,
+                backup_count=settings.log_backup_count,
+            )
         else:
-            file_handler.setFormatter(
-                logging.Formatter(
-                    "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-                )
+            file_handler = RotatingFileHandler(
+                settings.log_file,
+                maxBytes=settings.log_max_bytes,
+                backupCount=settings.log_backup_count,
+                encoding="utf-8",
             )
-
-        root_logger.addHandler(file_handler)
-
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_build_formatter())
+        handlers.append(file_handler)
+
+    if not settings.log_async:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        return
+
+    global _listener
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    root_logger.addHandler(_QueueHandler(log_queue))
+    _listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Write the queued records and stop the listener thread (async mode)."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+        # The console handler is left open: it writes to sys.stdout
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,389 @@
+"""Prometheus metrics written to a node_exporter textfile-collector file."""
+
+import logging
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets (seconds) for page loads, extraction and database writes
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value in the text exposition format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: LabelKey) -> str:
+    """Render ``{name="value",...}`` (empty string without labels)."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    """Base class of a metric family with optional labels."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name.
+            help_text: HELP line of the metric.
+            labels: Label names; every sample must give a value for each one.
+        """
+        self.name = name
+        self.help_text = help_text
+        self.label_names = labels
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelKey:
+        """Label values in declaration order."""
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Sample lines of the metric."""
+
+    def render(self) -> list[str]:
+        """HELP, TYPE and sample lines of the metric."""
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        """Initialize the counter (see _Metric)."""
+        super().__init__(name, help_text, labels)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter of the given labels."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Current value of the given labels."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        """Sample lines of the counter."""
+        with self._lock:
+            values = sorted(self._values.items())
+        if not values and not self.label_names:
+            values = [((), 0.0)]
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, optionally read from a callback."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        """Initialize the gauge (unlabelled)."""
+        super().__init__(name, help_text)
+        self._value = 0.0
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        """Set the gauge value."""
+        with self._lock:
+            self._value = float(value)
+
+    def set_function(self, function: Callable[[], float] | None) -> None:
+        """Read the gauge from ``function()`` whenever it is rendered (None = stop)."""
+        with self._lock:
+            self._function = function
+
+    def value(self) -> float:
+        """Current gauge value."""
+        with self._lock:
+            function, value = self._function, self._value
+        if function is None:
+            return value
+        try:
+            return float(function())
+        except Exception as e:
+            logger.debug(f"Gauge {self.name} callback failed: {e}")
+            return value
+
+    def samples(self) -> list[str]:
+        """Sample line of the gauge."""
+        return [f"{self.name} {_format_value(self.value())}"]
+
+
+class Histogram(_Metric):
+    """Cumulative histogram of observed values."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name.
+            help_text: HELP line of the metric.
+            labels: Label names.
+            buckets: Sorted upper bounds (the +Inf bucket is implicit).
+        """
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label key: (per-bucket counts, [total count, sum])
+        self._series: dict[LabelKey, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Add an observation."""
+        key = self._key(labels)
+        with self._lock:
+            counts, totals = self._series.setdefault(key, ([0] * len(self.buckets), [0, 0.0]))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            totals[0] += 1
+            totals[1] += value
+
+    def samples(self) -> list[str]:
+        """Bucket, sum and count lines of every label set."""
+        with self._lock:
+            series = sorted(
+                (key, (list(counts), list(totals)))
+                for key, (counts, totals) in self._series.items()
+            )
+        lines = []
+        for key, (counts, (count, total)) in series:
+            for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                labels = _format_labels((*self.label_names, "le"), (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            inf_labels = _format_labels((*self.label_names, "le"), (*key, "+Inf"))
+            lines.append(f"{self.name}_bucket{inf_labels} {int(count)}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {int(count)}")
+        return lines
+
+
+class ScraperMetrics:
+    """Metrics of a scraper run."""
+
+    # Timing stages (see src.utils.timing) observed by each histogram
+    STAGE_HISTOGRAMS = {
+        "navigate": ("page_load_seconds", {}),
+        "extract": ("extraction_seconds", {}),
+        "chrome_startup": ("browser_start_seconds", {}),
+        "db_write": ("db_write_seconds", {"operation": "page"}),
+        "db_write_batch": ("db_write_seconds", {"operation": "batch"}),
+    }
+
+    def __init__(self) -> None:
+        """Create the metric families."""
+        self.pages_scraped = Counter(
+            "booking_scraper_pages_scraped_total", "Hotel pages scraped.", ("outcome",)
+        )
+        self.jobs_finished = Counter(
+            "booking_scraper_jobs_finished_total",
+            "Scrape jobs finished (saved, spooled or failed).",
+            ("outcome",),
+        )
+        self.sessions = Counter(
+            "booking_scraper_sessions_total", "Scrape sessions saved.", ("action",)
+        )
+        self.rooms_saved = Counter(
+            "booking_scraper_room_availabilities_saved_total", "Room availabilities inserted."
+        )
+        self.rooms_unchanged = Counter(
+            "booking_scraper_room_availabilities_unchanged_total",
+            "Room availabilities skipped by delta storage.",
+        )
+        self.errors = Counter(
+            "booking_scraper_errors_total", "Errors by exception class.", ("exception",)
+        )
+        self.page_load_seconds = Histogram(
+            "booking_scraper_page_load_seconds", "Time to load a hotel page."
+        )
+        self.extraction_seconds = Histogram(
+            "booking_scraper_extraction_seconds", "Time to extract the room table."
+        )
+        self.browser_start_seconds = Histogram(
+            "booking_scraper_browser_start_seconds", "Time to start Chrome."
+        )
+        self.db_write_seconds = Histogram(
+            "booking_scraper_db_write_seconds",
+            "Time to save one page or one batch of pages.",
+            ("operation",),
+        )
+        self.live_browsers = Gauge("booking_scraper_live_browsers", "Running Chrome instances.")
+        self.writer_queue_depth = Gauge(
+            "booking_scraper_writer_queue_depth", "Scraped pages waiting to be saved."
+        )
+        self.jobs_planned = Gauge("booking_scraper_jobs_planned", "Scrape jobs of the run.")
+        self.run_start_time = Gauge(
+            "booking_scraper_run_start_timestamp_seconds", "Unix time the run started."
+        )
+        self.last_update_time = Gauge(
+            "booking_scraper_last_update_timestamp_seconds", "Unix time of the last file update."
+        )
+
+    @property
+    def families(self) -> list[_Metric]:
+        """Every metric family, in output order."""
+        return [value for value in vars(self).values() if isinstance(value, _Metric)]
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Feed a timing stage into its histogram (other stages are ignored)."""
+        target = self.STAGE_HISTOGRAMS.get(stage)
+        if target is not None:
+            attribute, labels = target
+            getattr(self, attribute).observe(seconds, **labels)
+
+    def record_error(self, error: BaseException) -> None:
+        """Count an error by exception class."""
+        self.errors.inc(exception=type(error).__name__)
+
+    def record_results(self, results: dict[str, Any]) -> None:
+        """Count the saved sessions and rooms of a finished job.
+
+        Results still queued for the background writer are skipped: they are
+        counted when the writer reports them.
+        """
+        if results.get("queued"):
+            return
+        self.sessions.inc(results.get("sessions_created", 0), action="created")
+        self.sessions.inc(results.get("sessions_updated", 0), action="updated")
+        self.rooms_saved.inc(results.get("room_availabilities_created", 0))
+        self.rooms_unchanged.inc(results.get("room_availabilities_unchanged", 0))
+        if results.get("spooled"):
+            outcome = "spooled"
+        elif results.get("failed") or not (
+            results.get("sessions_created") or results.get("sessions_updated")
+        ):
+            outcome = "failed"
+        else:
+            outcome = "saved"
+        self.jobs_finished.inc(outcome=outcome)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self.families:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide scraper metrics
+metrics = ScraperMetrics()
+
+
+class TextfileExporter:
+    """Rewrites a textfile-collector file with the scraper metrics.
+
+    The file is written to a temporary name and renamed over the target, so
+    node_exporter never reads a partial file. A background thread rewrites it
+    every ``interval`` seconds until stop(), which writes it a last time.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        scraper_metrics: ScraperMetrics | None = None,
+        interval: float | None = None,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: Target file; node_exporter only reads files ending in .prom.
+            scraper_metrics: Metrics to export (defaults to the process-wide ones).
+            interval: Seconds between rewrites (defaults to settings.metrics_interval).
+        """
+        self.path = Path(path)
+        self.metrics = scraper_metrics or metrics
+        self.interval = settings.metrics_interval if interval is None else interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Write the file and start rewriting it periodically."""
+        self.write()
+        self._thread = threading.Thread(target=self._loop, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def write(self) -> bool:
+        """Atomically rewrite the metrics file.
+
+        Returns:
+            True if the file was written (errors are logged, not raised).
+        """
+        self.metrics.last_update_time.set(time.time())
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(self.metrics.render(), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to write metrics file {self.path}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+
+    def stop(self) -> None:
+        """Stop the background thread and write the final metrics."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write()
+
+    def _loop(self) -> None:
+        """Rewrite the file every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            self.write()
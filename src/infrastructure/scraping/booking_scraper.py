@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,8 +15,31 @@ from src.config.settings import settings
 from src.domain.exceptions import ScrapingError, ScrapingNetworkError, ScrapingTimeoutError
 from src.domain.models import RoomAvailability, ScrapedHotelData
 from src.domain.services import PriceService, TextExtractionService
+from src.infrastructure.metrics.prometheus import metrics
 from src.infrastructure.scraping.driver_factory import DriverFactory
+from src.infrastructure.scraping.network_blocking import NetworkUsage, summarize_performance_log
+from src.infrastructure.scraping.room_table import (
+    AVAILABILITY_FALLBACK_SELECTOR,
+    AVAILABILITY_SELECTOR,
+    BASE_PRICE_SELECTOR,
+    FALLBACK_PRICE_SELECTOR,
+    FINAL_PRICE_SELECTOR,
+    MIN_ROW_HTML_LENGTH,
+    NON_REFUNDABLE_MARKER,
+    OFFER_SELECTOR,
+    ROOM_TABLE_SCRIPT,
+    ROWS_READY_SCRIPT,
+    ROOM_TYPE_SELECTOR,
+    ROW_FIELD_SELECTORS,
+    ROW_SELECTORS,
+    TABLE_SELECTOR,
+    RoomRowData,
+    build_room_availabilities,
+    should_log_rows,
+)
+from src.infrastructure.scraping.room_table_parser import parse_room_rows
 from src.utils.timezone import now_argentina
+from src.utils.timing import record
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +61,8 @@ class BookingScraper:
         self.service = None
         self.temp_dir: str | None = None
         self.debug_port: int | None = None
+        self.pages_scraped = 0
+        self.row_selector: str | None = None  # Row selector that matched on the last page
         try:
             self.driver, self.temp_dir, self.debug_port = DriverFactory.create_driver(proxy=proxy)
         except Exception as e:
@@ -79,84 +105,73 @@ class BookingScraper:
 
         capture_date = now_argentina()
         room_availabilities: list[RoomAvailability] = []
+        wait_seconds = 0.0
+        network_usage = NetworkUsage()
+        self.pages_scraped += 1
+        self.row_selector = None
+        started = time.monotonic()
 
         try:
-            logger.info(f"🌐 Navegando a: {hotel_url}")
-            self.driver.get(hotel_url)
+            # Descartar el tráfico de la página anterior
+            self._read_network_usage()
+
+            logger.debug("🌐 Navegando a: %s", hotel_url)
+            try:
+                self.driver.get(hotel_url)
+            except TimeoutException:
+                # Recursos lentos: detener la carga y seguir con la espera de la tabla
+                logger.warning(
+                    f"[BookingScraper] Timeout de carga ({settings.scraping_timeout}s), "
+                    "deteniendo la carga de la página"
+                )
+                self._stop_page_load()
+
+            wait_started = time.monotonic()
+            navigate_seconds = wait_started - started
+            record("navigate", navigate_seconds)
 
             # Esperar a que cargue la página
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
 
-            time.sleep(3)
-
-            # Log del HTML para debugging
-            html_length = len(self.driver.page_source)
-            logger.info(f"[BookingScraper] HTML recibido - Longitud: {html_length} caracteres")
+            # Log del HTML para debugging (page_source es costoso: solo en DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[BookingScraper] HTML recibido - Longitud: %d caracteres",
+                    len(self.driver.page_source),
+                )
 
             # Esperar explícitamente a que la tabla de habitaciones aparezca
-            # Intentar múltiples selectores para diferentes países/idiomas
-            table_selectors = [
-                "table.hprt-table",
-                "table#hprt-table",
-                "table[class*='hprt-table']",
-            ]
-            
+            # Un solo wait con todos los selectores (diferentes países/idiomas)
             table_found = False
-            for selector in table_selectors:
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    table_found = True
-                    logger.info(f"[BookingScraper] Tabla encontrada con selector: {selector}")
-                    break
-                except Exception:
-                    continue
-            
-            if not table_found:
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, TABLE_SELECTOR))
+                )
+                table_found = True
+                logger.debug("[BookingScraper] Tabla encontrada con selector: %s", TABLE_SELECTOR)
+            except Exception:
                 logger.warning("[BookingScraper] No se encontró la tabla de habitaciones")
-            
-            # Esperar un poco más para que se carguen las filas dinámicamente
-            time.sleep(2)
-
-            # Buscar tabla de habitaciones - intentar múltiples estrategias
-            # Estrategia 1: Buscar en tbody (más específico)
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "table.hprt-table tbody tr, table#hprt-table tbody tr")
-            logger.info(f"[BookingScraper] Filas encontradas en tbody: {len(rows)}")
-            
-            # Estrategia 2: Si no encuentra con tbody, intentar sin tbody (fallback)
-            if not rows:
-                rows = self.driver.find_elements(By.CSS_SELECTOR, "table.hprt-table tr, table#hprt-table tr")
-                logger.info(f"[BookingScraper] Filas encontradas sin tbody: {len(rows)}")
-            
-            # Estrategia 3: Buscar por data-block-id directamente
-            if not rows:
-                rows = self.driver.find_elements(By.CSS_SELECTOR, "tr[data-block-id]")
-                logger.info(f"[BookingScraper] Filas encontradas por data-block-id: {len(rows)}")
-            
-            # Filtrar solo filas que tienen data-block-id (son filas de habitaciones reales)
-            # Excluir filas del header
-            filtered_rows = []
-            for row in rows:
-                row_class = row.get_attribute("class") or ""
-                data_block_id = row.get_attribute("data-block-id")
-                
-                # Excluir headers explícitamente
-                if "hprt-table-header" in row_class.lower():
-                    continue
-                
-                # Incluir si tiene data-block-id O si es una fila js-rt-block-row
-                if data_block_id or "js-rt-block-row" in row_class.lower():
-                    filtered_rows.append(row)
-                    logger.debug(f"[BookingScraper] Fila válida encontrada - data-block-id: {data_block_id}, class: {row_class}")
-            
-            rows = filtered_rows
-            row_count = len(rows)
-            logger.info(f"[BookingScraper] Filas válidas encontradas en tabla: {row_count}")
-            
-            if row_count == 0:
+
+            # Esperar a que las filas dinámicas dejen de cambiar (con tope máximo)
+            if table_found:
+                self._wait_for_rows_ready()
+
+            extract_started = time.monotonic()
+            wait_seconds = extract_started - wait_started
+            record("table_wait", wait_seconds)
+
+            # Extraer filas de la tabla de habitaciones
+            if settings.scraper_extraction_mode == "script":
+                rows = self._extract_rows_with_script()
+            elif settings.scraper_extraction_mode == "html":
+                rows = parse_room_rows(self.driver.page_source)
+                logger.debug("[BookingScraper] Filas encontradas (html): %d", len(rows))
+            else:
+                rows = self._extract_rows_with_webelements()
+
+            if not any(row.is_room_row for row in rows):
                 logger.warning("[BookingScraper] ⚠️ No se encontraron filas de habitaciones. Verificando HTML...")
                 # Intentar guardar HTML para debugging
                 try:
@@ -165,181 +180,28 @@ class BookingScraper:
                 except Exception:
                     pass
 
-            previous_room_name = ""
-            previous_availability = ""  # Match original: start as empty string
-            last_estudio_index = -1
-
-            for index, row in enumerate(rows):
-                try:
-                    # Verificar que la fila no sea del header
-                    row_class = row.get_attribute("class") or ""
-                    
-                    # Saltar solo si es explícitamente un header
-                    if "hprt-table-header" in row_class.lower():
-                        logger.debug(f"[BookingScraper] Saltando fila {index} - es header")
-                        continue
-                    
-                    row_html = row.get_attribute("innerHTML")
-                    
-                    # Si la fila está vacía o no tiene contenido relevante, saltar
-                    if not row_html or len(row_html.strip()) < 50:
-                        logger.debug(f"[BookingScraper] Saltando fila {index} - contenido vacío o muy corto")
-                        continue
-
-                    # Non-refundable detection
-                    if "no reembolsable" in row_html.lower():
-                        logger.info(
-                            f"[BookingScraper] No reembolsable | Hotel: {hotel_url} | "
-                            f"Fecha: {checkin_date} | Fila: {index}"
-                        )
-
-                    # Room name
-                    room_type_elements = row.find_elements(
-                        By.CSS_SELECTOR, "span.hprt-roomtype-icon-link"
-                    )
-                    room_type = room_type_elements[0].text.strip() if room_type_elements else ""
-
-                    # Si no tiene nombre, usar el de la iteración anterior
-                    if not room_type:
-                        room_type = previous_room_name
-                    else:
-                        previous_room_name = room_type
-
-                    # Precio base (tachado)
-                    base_price_elements = row.find_elements(
-                        By.CSS_SELECTOR, "div.bui-f-color-destructive.js-strikethrough-price"
-                    )
-                    base_price = (
-                        PriceService.clean_price(base_price_elements[0].text)
-                        if base_price_elements
-                        else 0.0
-                    )
-
-                    # Precio final
-                    final_price_elements = row.find_elements(
-                        By.CSS_SELECTOR, "span.prco-valign-middle-helper"
-                    )
-                    final_price = (
-                        PriceService.clean_price(final_price_elements[0].text)
-                        if final_price_elements
-                        else 0.0
-                    )
-
-                    # Fallback para precio final
-                    if not final_price:
-                        final_price_elements = row.find_elements(
-                            By.CSS_SELECTOR, "span.prc-no-css"
-                        )
-                        final_price = (
-                            PriceService.clean_price(final_price_elements[0].text)
-                            if final_price_elements
-                            else 0.0
-                        )
-
-                    # Oferta
-                    offer_elements = row.find_elements(
-                        By.CSS_SELECTOR,
-                        "div.c-deals-container > div > div:nth-child(2) > span > span > span",
-                    )
-                    offer = offer_elements[0].text.strip() if offer_elements else ""
-
-                    # Disponibilidad
-                    availability_elements = row.find_elements(
-                        By.CSS_SELECTOR,
-                        "li.bui-list__item.bui-text--color-destructive-dark div.bui-list__description",
-                    )
-                    availability = (
-                        TextExtractionService.extract_number(availability_elements[0].text)
-                        if availability_elements
-                        else None
-                    )
-
-                    if availability is None:
-                        availability_elements = row.find_elements(
-                            By.CSS_SELECTOR, "span.only_x_left.urgency_message_red"
-                        )
-                        availability_text = (
-                            availability_elements[0].text if availability_elements else ""
-                        )
-                        availability = TextExtractionService.extract_number(availability_text)
-
-                    # Si no tiene disponibilidad, usar la de la iteración anterior
-                    if availability is None:
-                        availability = previous_availability if previous_availability else None
-                    else:
-                        previous_availability = availability
-
-                    # No reembolsable
-                    no_reembolsable = "no reembolsable" in row_html.lower()
-
-                    logger.info(
-                        "[BookingScraper] Parser data dia a dia",
-                        extra={
-                            "roomType": room_type,
-                            "basePrice": base_price,
-                            "finalPrice": final_price,
-                            "offer": offer,
-                            "availability": availability,
-                            "checkin": checkin_date,
-                            "checkout": checkout_date,
-                            "date_actual": checkin_date,
-                        },
-                    )
-
-                    # Solo agregar si hay algún dato relevante
-                    if room_type or final_price or base_price:
-                        # Verificar si es una habitación "Estudio"
-                        is_estudio = "estudio" in room_type.lower()
-
-                        if is_estudio:
-                            # Si ya teníamos un "Estudio" anterior, remover el anterior
-                            if last_estudio_index >= 0:
-                                if last_estudio_index < len(room_availabilities):
-                                    removed_room = room_availabilities[last_estudio_index].room_type_name
-                                    room_availabilities.pop(last_estudio_index)
-                                    logger.info(
-                                        f"[BookingScraper] Eliminando 'Estudio' anterior | "
-                                        f"Hotel: {hotel_url} | Fecha: {checkin_date} | "
-                                        f"Habitación: {removed_room}"
-                                    )
-
-                            # Guardar la posición de este "Estudio"
-                            last_estudio_index = len(room_availabilities)
-
-                        room_availability = RoomAvailability(
-                            room_type_id=0,  # Will be set by repository
-                            room_type_name=room_type,
-                            base_price=base_price,
-                            final_price=final_price,
-                            availability=availability,
-                            offer=offer if offer else None,
-                            non_refundable=no_reembolsable,
-                        )
-
-                        room_availabilities.append(room_availability)
-
-                        # Log detallado de precios encontrados
-                        logger.info(
-                            f"[BookingScraper] 💰 RoomAvailability creado | "
-                            f"Habitación: {room_type} | "
-                            f"Precio Base: {base_price} | "
-                            f"Precio Final: {final_price} | "
-                            f"Fecha: {checkin_date}"
-                        )
-
-                        # Log cuando se detecta no reembolsable
-                        if no_reembolsable:
-                            logger.info(
-                                f"[BookingScraper] Habitación no reembolsable detectada | "
-                                f"Hotel: {hotel_url} | Fecha: {checkin_date} | Habitación: {room_type}"
-                            )
-
-                except Exception as e:
-                    logger.error(f"Error processing row {index}: {e}")
-                    continue
+            room_availabilities = build_room_availabilities(
+                rows, hotel_url, checkin_date, checkout_date, log_rows=should_log_rows()
+            )
+            extract_seconds = time.monotonic() - extract_started
+            record("extract", extract_seconds)
 
-            logger.info(
-                f"[BookingScraper] Data extracted - Total rooms: {len(room_availabilities)}"
+            network_usage = self._read_network_usage()
+            metrics.pages_scraped.inc(outcome="success")
+            self._log_summary(
+                hotel_url=hotel_url,
+                checkin_date=checkin_date,
+                checkout_date=checkout_date,
+                rows=rows,
+                room_availabilities=room_availabilities,
+                table_found=table_found,
+                timings={
+                    "navigate": navigate_seconds,
+                    "wait": wait_seconds,
+                    "extract": extract_seconds,
+                    "total": time.monotonic() - started,
+                },
+                network_usage=network_usage,
             )
 
             return ScrapedHotelData(
@@ -352,10 +214,16 @@ class BookingScraper:
                 adults=adults,
                 children=children,
                 currency=currency,
+                wait_seconds=wait_seconds,
+                network_bytes=network_usage.transferred_bytes,
+                network_bytes_saved=network_usage.estimated_saved_bytes,
+                complete=table_found and bool(room_availabilities),
             )
 
         except Exception as e:
             logger.error(f"General error in scrape_hotel: {e}")
+            metrics.pages_scraped.inc(outcome="failed")
+            metrics.record_error(e)
             return ScrapedHotelData(
                 hotel_url=hotel_url,
                 checkin_date=checkin_date,
@@ -367,8 +235,224 @@ class BookingScraper:
                 adults=adults,
                 children=children,
                 currency=currency,
+                wait_seconds=wait_seconds,
             )
 
+    def _log_summary(
+        self,
+        hotel_url: str,
+        checkin_date: str,
+        checkout_date: str,
+        rows: list[RoomRowData],
+        room_availabilities: list[RoomAvailability],
+        table_found: bool,
+        timings: dict[str, float],
+        network_usage: NetworkUsage,
+    ) -> None:
+        """Log the single INFO event describing a finished scrape."""
+        room_rows = sum(1 for row in rows if row.is_room_row)
+        summary: dict[str, Any] = {
+            "event": "scrape_summary",
+            "hotel_url": hotel_url,
+            "checkin": checkin_date,
+            "checkout": checkout_date,
+            "extraction_mode": settings.scraper_extraction_mode,
+            "table_found": table_found,
+            "row_selector": self.row_selector,
+            "rows_found": len(rows),
+            "room_rows": room_rows,
+            "rows_kept": len(room_availabilities),
+            "timings": {name: round(seconds, 3) for name, seconds in timings.items()},
+        }
+        if network_usage.requests:
+            summary["network"] = {
+                "requests": network_usage.requests,
+                "transferred_bytes": network_usage.transferred_bytes,
+                "blocked_requests": network_usage.blocked_requests,
+                "estimated_saved_bytes": network_usage.estimated_saved_bytes,
+                "blocked_by_type": dict(network_usage.blocked_by_type),
+            }
+        logger.info(
+            "[BookingScraper] Scrape %s %s: %d/%d rooms kept in %.2fs",
+            hotel_url,
+            checkin_date,
+            len(room_availabilities),
+            room_rows,
+            timings["total"],
+            extra=summary,
+        )
+
+    def _wait_for_rows_ready(self) -> float:
+        """Wait until the room rows stop changing, with a hard cap.
+
+        Returns as soon as the row count has been stable for
+        settings.scraper_ready_stable_ms, or the page reports no DOM mutation
+        in the table for that long, or settings.scraper_ready_max_wait elapses.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        assert self.driver is not None
+
+        started = time.monotonic()
+        deadline = started + settings.scraper_ready_max_wait
+        stable_window = settings.scraper_ready_stable_ms / 1000
+        poll_interval = settings.scraper_ready_poll_ms / 1000
+
+        last_count: int | None = None
+        stable_since = started
+        while True:
+            count, quiet_seconds = self._poll_rows_state()
+            now = time.monotonic()
+            if count != last_count:
+                last_count = count
+                stable_since = now
+
+            if count > 0 and (
+                now - stable_since >= stable_window
+                or (quiet_seconds is not None and quiet_seconds >= stable_window)
+            ):
+                break
+            if now >= deadline:
+                logger.debug("[BookingScraper] Tope de espera de filas alcanzado")
+                break
+            time.sleep(poll_interval)
+
+        return time.monotonic() - started
+
+    def _poll_rows_state(self) -> tuple[int, float | None]:
+        """Return (row count, seconds since last table mutation or None).
+
+        Rows are counted with the first of ROW_SELECTORS that matches any, as
+        the extraction does, so pages without a tbody are seen as ready too.
+        """
+        assert self.driver is not None
+
+        state = self.driver.execute_script(ROWS_READY_SCRIPT, TABLE_SELECTOR, ROW_SELECTORS)
+        if (
+            isinstance(state, list)
+            and len(state) == 2
+            and all(isinstance(value, (int, float)) for value in state)
+        ):
+            return int(state[0]), float(state[1]) / 1000
+
+        # Fallback when the script is not available: count rows directly, with the
+        # same selector fallback as the extraction
+        for selector in ROW_SELECTORS:
+            count = len(self.driver.find_elements(By.CSS_SELECTOR, selector))
+            if count:
+                return count, None
+        return 0, None
+
+    def _extract_rows_with_webelements(self) -> list[RoomRowData]:
+        """Read the room table row by row through WebElement lookups.
+
+        Fallback selectors are only queried when the primary one yields nothing.
+
+        Returns:
+            Raw rows in table order.
+        """
+        assert self.driver is not None
+
+        # Buscar tabla de habitaciones - intentar múltiples estrategias:
+        # tbody (más específico), sin tbody (fallback), data-block-id directamente
+        elements = []
+        for selector in ROW_SELECTORS:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            logger.debug("[BookingScraper] Filas encontradas con '%s': %d", selector, len(elements))
+            if elements:
+                self.row_selector = selector
+                break
+
+        rows: list[RoomRowData] = []
+        for index, element in enumerate(elements):
+            try:
+                row = RoomRowData(
+                    row_class=element.get_attribute("class") or "",
+                    data_block_id=element.get_attribute("data-block-id"),
+                )
+                # Filtrar solo filas de habitaciones reales (excluir headers)
+                if not row.is_room_row:
+                    rows.append(row)
+                    continue
+
+                row_html = element.get_attribute("innerHTML") or ""
+                row.html_length = len(row_html.strip())
+                if row.html_length < MIN_ROW_HTML_LENGTH:
+                    rows.append(row)
+                    continue
+
+                row.non_refundable = NON_REFUNDABLE_MARKER in row_html.lower()
+                row.room_type = self._first_text(element, ROOM_TYPE_SELECTOR)
+                row.base_price = self._first_text(element, BASE_PRICE_SELECTOR)
+                row.final_price = self._first_text(element, FINAL_PRICE_SELECTOR)
+                if not PriceService.clean_price(row.final_price):
+                    row.fallback_price = self._first_text(element, FALLBACK_PRICE_SELECTOR)
+                row.offer = self._first_text(element, OFFER_SELECTOR)
+                row.availability = self._first_text(element, AVAILABILITY_SELECTOR)
+                if TextExtractionService.extract_number(row.availability) is None:
+                    row.availability_fallback = self._first_text(
+                        element, AVAILABILITY_FALLBACK_SELECTOR
+                    )
+                rows.append(row)
+            except Exception as e:
+                logger.error(f"Error processing row {index}: {e}")
+                continue
+
+        return rows
+
+    def _extract_rows_with_script(self) -> list[RoomRowData]:
+        """Read the whole room table with a single in-page script.
+
+        Returns:
+            Raw rows in table order.
+
+        Raises:
+            ScrapingError: If the script does not return a list of rows.
+        """
+        assert self.driver is not None
+
+        payload = self.driver.execute_script(
+            ROOM_TABLE_SCRIPT, ROW_SELECTORS, ROW_FIELD_SELECTORS, NON_REFUNDABLE_MARKER
+        )
+        if not isinstance(payload, list):
+            raise ScrapingError(f"Unexpected room table payload: {type(payload).__name__}")
+
+        rows = [RoomRowData.from_dict(item) for item in payload if isinstance(item, dict)]
+        logger.debug("[BookingScraper] Filas encontradas (script): %d", len(rows))
+        return rows
+
+    def _stop_page_load(self) -> None:
+        """Stop loading the current page, keeping what was already rendered."""
+        assert self.driver is not None
+
+        try:
+            self.driver.execute_script("window.stop();")
+        except Exception as e:
+            logger.debug(f"[BookingScraper] window.stop() failed: {e}")
+
+    def _read_network_usage(self) -> NetworkUsage:
+        """Drain the Chrome performance log and summarize its network traffic.
+
+        Returns an empty NetworkUsage when performance logging is disabled
+        (settings.chrome_network_usage) or unsupported by the driver.
+        """
+        assert self.driver is not None
+
+        if not settings.chrome_network_usage:
+            return NetworkUsage()
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return NetworkUsage()
+        return summarize_performance_log(entries)
+
+    @staticmethod
+    def _first_text(element: Any, selector: str) -> str | None:
+        """Return the text of the first element matching selector, or None."""
+        found = element.find_elements(By.CSS_SELECTOR, selector)
+        return found[0].text if found else None
+
     def close(self) -> None:
         """Close the driver and clean up resources."""
         DriverFactory.cleanup_driver(self.driver, self.service, self.temp_dir)
@@ -0,0 +1,253 @@
+"""Warm pool of Chrome browsers shared by scrape jobs."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.config.settings import settings
+from src.domain.exceptions import ScrapingError
+from src.infrastructure.scraping.booking_scraper import BookingScraper
+from src.infrastructure.scraping.driver_factory import DriverFactory
+
+logger = logging.getLogger(__name__)
+
+# Browsers started for one acquire() that may fail the health check before giving up
+MAX_UNHEALTHY_STARTS = 2
+
+
+class BrowserPool:
+    """Bounded pool of pre-started BookingScraper browsers.
+
+    Exposes the same acquire()/release() interface as ScraperSession, so it
+    can be handed to UpdatePricesService. At most ``size`` browsers exist at
+    any time (idle, in use or starting). Browsers are health-checked on
+    checkout and recycled after ``max_pages`` pages, a failed scrape or when
+    their memory goes over ``max_memory_mb``. Recycling and the start of the
+    replacement browser happen in the background, off the job's critical path.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        proxy_provider: Callable[[], str | None] | None = None,
+        max_pages: int | None = None,
+        max_memory_mb: int | None = None,
+        acquire_timeout: float | None = None,
+    ) -> None:
+        """Initialize the pool (browsers are started by start() or on demand).
+
+        Args:
+            size: Maximum number of browsers.
+            proxy_provider: Callable returning the proxy for each new browser.
+            max_pages: Pages per browser before recycling
+                (defaults to settings.scraper_session_max_pages).
+            max_memory_mb: Recycle browsers whose processes use more resident
+                memory (defaults to settings.browser_pool_max_memory_mb, 0 = off).
+            acquire_timeout: Seconds to wait for a free browser
+                (defaults to settings.browser_pool_acquire_timeout).
+        """
+        if size < 1:
+            raise ValueError("Browser pool size must be >= 1")
+        self.size = size
+        self.proxy_provider = proxy_provider
+        self.max_pages = max(1, max_pages or settings.scraper_session_max_pages)
+        self.max_memory_mb = (
+            settings.browser_pool_max_memory_mb if max_memory_mb is None else max_memory_mb
+        )
+        self.acquire_timeout = (
+            settings.browser_pool_acquire_timeout if acquire_timeout is None else acquire_timeout
+        )
+        self.browsers_started = 0
+        self.browsers_recycled = 0
+
+        self._idle: list[BookingScraper] = []
+        self._alive = 0  # Idle + in use + starting
+        self._closed = False
+        self._cond = threading.Condition()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start every browser of the pool in parallel, in the background."""
+        for _ in range(self.size):
+            self._replenish()
+
+    def acquire(self) -> BookingScraper:
+        """Borrow a healthy browser, waiting if all of them are in use.
+
+        Returns:
+            A ready BookingScraper.
+
+        Raises:
+            ScrapingError: If no healthy browser is available in time or new
+                browsers keep failing the health check.
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        unhealthy_starts = 0
+        while True:
+            scraper = self._checkout(deadline)
+            started = scraper is None
+            if scraper is None:
+                # A slot was reserved for this caller: start a browser synchronously
+                scraper = self._spawn()
+            if self._is_healthy(scraper):
+                return scraper
+            logger.warning("BrowserPool: browser failed health check, replacing it")
+            self._retire(scraper, replace=False)
+            if started:
+                unhealthy_starts += 1
+            if unhealthy_starts >= MAX_UNHEALTHY_STARTS or time.monotonic() >= deadline:
+                raise ScrapingError(
+                    f"No healthy browser available ({unhealthy_starts} new browsers "
+                    "failed the health check)"
+                )
+
+    def release(self, scraper: BookingScraper, failed: bool = False) -> None:
+        """Give a browser back to the pool.
+
+        Args:
+            scraper: Scraper returned by acquire().
+            failed: Whether the scrape failed; the browser is then recycled.
+        """
+        reason = self._recycle_reason(scraper, failed)
+        if reason is None:
+            with self._cond:
+                if not self._closed:
+                    self._idle.append(scraper)
+                    self._cond.notify()
+                    return
+            reason = "pool closed"
+
+        logger.debug(f"BrowserPool: recycling browser after {reason}")
+        self._run_in_background(self._retire, scraper, True)
+
+    def close(self) -> None:
+        """Close idle browsers; browsers in use are closed when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for scraper in idle:
+            self._retire(scraper, replace=False)
+        for thread in list(self._threads):
+            thread.join(timeout=30)
+
+    def _checkout(self, deadline: float) -> BookingScraper | None:
+        """Take an idle browser, or reserve a slot (None) to start a new one."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise ScrapingError("Browser pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._alive < self.size:
+                    self._alive += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ScrapingError(
+                        f"No browser available after {self.acquire_timeout}s "
+                        f"(pool size {self.size})"
+                    )
+                self._cond.wait(remaining)
+
+    def _spawn(self) -> BookingScraper:
+        """Start a browser for a reserved slot, freeing the slot on failure."""
+        try:
+            scraper = BookingScraper(proxy=self._next_proxy())
+        except Exception:
+            with self._cond:
+                self._alive -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.browsers_started += 1
+        logger.debug(f"BrowserPool: browser #{self.browsers_started} started")
+        return scraper
+
+    def _next_proxy(self) -> str | None:
+        """Proxy for a new browser (None if there is no provider or it fails)."""
+        if self.proxy_provider is None:
+            return None
+        try:
+            return self.proxy_provider()
+        except Exception as e:
+            logger.warning(f"BrowserPool: failed to get proxy ({e}), using none")
+            return None
+
+    def _replenish(self) -> None:
+        """Start a browser in the background if there is a free slot."""
+        with self._cond:
+            if self._closed or self._alive >= self.size:
+                return
+            self._alive += 1
+        self._run_in_background(self._spawn_idle)
+
+    def _spawn_idle(self) -> None:
+        """Start a browser and add it to the idle list."""
+        try:
+            scraper = self._spawn()
+        except Exception as e:
+            logger.warning(f"BrowserPool: failed to pre-start browser: {e}")
+            return
+        with self._cond:
+            if not self._closed:
+                self._idle.append(scraper)
+                self._cond.notify()
+                return
+        self._retire(scraper, replace=False)
+
+    def _retire(self, scraper: BookingScraper, replace: bool) -> None:
+        """Close a browser, free its slot and optionally start a replacement."""
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.debug(f"BrowserPool: error closing browser: {e}")
+        with self._cond:
+            self._alive -= 1
+            self.browsers_recycled += 1
+            self._cond.notify()
+        if replace:
+            self._replenish()
+
+    def _recycle_reason(self, scraper: BookingScraper, failed: bool) -> str | None:
+        """Return why a released browser must be recycled, or None to keep it."""
+        if failed:
+            return "error"
+        if scraper.driver is None:
+            return "crash"
+        if scraper.pages_scraped >= self.max_pages:
+            return f"{scraper.pages_scraped} pages"
+        if self.max_memory_mb > 0 and scraper.temp_dir:
+            memory_mb = DriverFactory.get_browser_memory_mb(scraper.temp_dir)
+            if memory_mb is not None and memory_mb > self.max_memory_mb:
+                return f"{memory_mb:.0f} MB memory"
+        return None
+
+    @staticmethod
+    def _is_healthy(scraper: BookingScraper) -> bool:
+        """Cheap liveness check of the browser."""
+        if scraper.driver is None:
+            return False
+        try:
+            return bool(scraper.driver.execute_script("return 1") == 1)
+        except Exception as e:
+            logger.debug(f"BrowserPool: health check failed: {e}")
+            return False
+
+    def _run_in_background(self, target: Callable[..., None], *args: Any) -> None:
+        """Run target in a tracked daemon thread."""
+        thread = threading.Thread(target=target, args=args, name="browser-pool", daemon=True)
+        with self._cond:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+
+    def __enter__(self) -> "BrowserPool":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
@@ -1,11 +1,12 @@
 """Factory for creating Chrome WebDriver instances."""
 
+import logging
 import os
 import shutil
 import signal
 import socket
 import subprocess
-import tempfile
+import threading
 from typing import Any
 
 from selenium import webdriver
@@ -15,17 +16,148 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from src.config.settings import settings
 from src.domain.exceptions import ScrapingError
+from src.infrastructure.scraping.network_blocking import (
+    apply_block_profile,
+    get_block_profile,
+    parse_patterns,
+)
+from src.infrastructure.scraping.profile_template import (
+    ProfileStore,
+    default_profile_root,
+    warm_up_profile,
+)
+from src.utils.timing import span
+
+logger = logging.getLogger(__name__)
 
 
 class DriverFactory:
     """Factory for creating and managing Chrome WebDriver instances."""
 
+    # chromedriver binary, resolved once per process
+    _chromedriver_path: str | None = None
+    _chromedriver_lock = threading.Lock()
+
+    # Chrome profiles: prepared template and the clones handed to drivers
+    _profile_store: ProfileStore | None = None
+    _profile_dirs: set[str] = set()
+    _profile_lock = threading.Lock()
+    _template_lock = threading.Lock()
+    _template_failed = False
+
+    @classmethod
+    def resolve_chromedriver_path(cls) -> str:
+        """Return the chromedriver binary path, resolving it on first use.
+
+        Uses settings.chromedriver_path when set; otherwise asks
+        ChromeDriverManager once and falls back to a chromedriver on PATH
+        (hosts without internet).
+
+        Returns:
+            Path to the chromedriver executable.
+
+        Raises:
+            ScrapingError: If no chromedriver binary can be found.
+        """
+        with cls._chromedriver_lock:
+            if cls._chromedriver_path and os.path.exists(cls._chromedriver_path):
+                return cls._chromedriver_path
+
+            if settings.chromedriver_path:
+                path = settings.chromedriver_path
+                if not os.access(path, os.X_OK):
+                    raise ScrapingError(f"chromedriver_path is not executable: {path}")
+            else:
+                try:
+                    path = ChromeDriverManager().install()
+                except Exception as e:
+                    path = shutil.which("chromedriver") or ""
+                    if not path:
+                        raise ScrapingError(f"Failed to resolve chromedriver: {e}") from e
+                    logger.warning(f"ChromeDriverManager failed ({e}), using {path}")
+
+            logger.info(f"Using chromedriver: {path}")
+            cls._chromedriver_path = path
+            return path
+
+    @classmethod
+    def live_driver_count(cls) -> int:
+        """Number of drivers created and not yet cleaned up (one profile each)."""
+        with cls._profile_lock:
+            return len(cls._profile_dirs)
+
+    @classmethod
+    def get_profile_store(cls) -> ProfileStore:
+        """Return the store of Chrome profiles created by this factory."""
+        with cls._profile_lock:
+            if cls._profile_store is None:
+                root = settings.chrome_profile_root or default_profile_root()
+                cls._profile_store = ProfileStore(root)
+            return cls._profile_store
+
+    @classmethod
+    def ensure_profile_template(cls, proxy: str | None = None) -> bool:
+        """Build the Chrome profile template if it is missing or too old.
+
+        The template is built once per process at most (concurrent callers
+        wait for it); other processes sharing the profile root build their own
+        copy and publish it atomically (see ProfileStore). If building fails,
+        drivers use empty profiles.
+
+        Args:
+            proxy: Proxy used to open Booking while preparing the template.
+
+        Returns:
+            Whether a ready template is available.
+        """
+        store = cls.get_profile_store()
+        with cls._template_lock:
+            if store.template_ready(settings.chrome_profile_template_max_age_hours):
+                return True
+            if cls._template_failed:
+                return False
+
+            logger.info(f"Building Chrome profile template in {store.template_dir}")
+            driver = None
+            build_dir = None
+            try:
+                build_dir = store.new_template_build()
+                options, _ = DriverFactory._build_options(proxy, str(build_dir))
+                driver = DriverFactory._start_chrome(options, None)
+                consent = warm_up_profile(driver)
+                driver.quit()
+                driver = None
+                store.finish_template(build_dir)
+                logger.info(f"Chrome profile template ready (consent accepted: {consent})")
+                return True
+            except Exception as e:
+                cls._template_failed = True
+                if build_dir is not None:
+                    store.discard_template_build(build_dir)
+                logger.warning(
+                    f"Failed to build Chrome profile template, using empty profiles: {e}"
+                )
+                return False
+            finally:
+                if driver is not None:
+                    try:
+                        driver.quit()
+                    except Exception:
+                        pass
+
     @staticmethod
-    def create_driver(proxy: str | None = None) -> tuple[webdriver.Chrome, str, int]:
+    def create_driver(
+        proxy: str | None = None, block_profile: str | None = None
+    ) -> tuple[webdriver.Chrome, str, int]:
         """Create a Chrome WebDriver instance.
 
+        The profile (--user-data-dir) is a clone of the prepared template when
+        settings.chrome_profile_template is enabled, otherwise an empty one.
+
         Args:
             proxy: Optional proxy URL.
+            block_profile: Network block profile ('off', 'balanced', 'minimal').
+                Defaults to settings.chrome_block_profile.
 
         Returns:
             Tuple of (driver, temp_dir, debug_port).
@@ -33,7 +165,58 @@ class DriverFactory:
         Raises:
             ScrapingError: If driver creation fails.
         """
+        temp_dir = None
+        try:
+            # Use a unique profile directory for each instance, tracked by the factory
+            with span("chrome_profile"):
+                temp_dir = DriverFactory._new_profile_dir(proxy)
+            options, debug_port = DriverFactory._build_options(proxy, temp_dir)
+            with span("chrome_startup"):
+                driver = DriverFactory._start_chrome(options, block_profile)
+            return driver, temp_dir, debug_port
+        except Exception as e:
+            # Clean up temp directory if driver creation fails
+            if temp_dir:
+                DriverFactory._remove_profile_dir(temp_dir)
+            raise ScrapingError(f"Failed to create Chrome driver: {e}") from e
+
+    @staticmethod
+    def _new_profile_dir(proxy: str | None) -> str:
+        """Create and track the profile directory of a new driver."""
+        store = DriverFactory.get_profile_store()
+        from_template = bool(settings.chrome_profile_template) and (
+            DriverFactory.ensure_profile_template(proxy)
+        )
+        try:
+            temp_dir = store.new_profile(from_template=from_template)
+        except OSError as e:
+            if not from_template:
+                raise
+            logger.warning(f"Failed to clone Chrome profile template ({e}), using an empty profile")
+            temp_dir = store.new_profile(from_template=False)
+
+        with DriverFactory._profile_lock:
+            DriverFactory._profile_dirs.add(temp_dir)
+        return temp_dir
+
+    @staticmethod
+    def _remove_profile_dir(temp_dir: str) -> None:
+        """Delete a profile directory and stop tracking it."""
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        with DriverFactory._profile_lock:
+            DriverFactory._profile_dirs.discard(temp_dir)
+
+    @staticmethod
+    def _build_options(proxy: str | None, user_data_dir: str) -> tuple[Options, int]:
+        """Build the Chrome options.
+
+        Returns:
+            Tuple of (options, debug_port).
+        """
         options = Options()
+        # 'eager' returns from get() once the DOM is ready: the room table wait
+        # is the readiness signal, slow third-party assets no longer gate it
+        options.page_load_strategy = settings.chrome_page_load_strategy
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
@@ -43,6 +226,8 @@ class DriverFactory:
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
 
         # Use dynamic port to avoid conflicts
         sock = socket.socket()
@@ -51,9 +236,7 @@ class DriverFactory:
         sock.close()
         options.add_argument(f"--remote-debugging-port={debug_port}")
 
-        # Use unique temporary directory for each instance
-        temp_dir = tempfile.mkdtemp()
-        options.add_argument(f"--user-data-dir={temp_dir}")
+        options.add_argument(f"--user-data-dir={user_data_dir}")
 
         # Headless mode (configurable desde .env)
         if settings.headless_mode:
@@ -66,22 +249,39 @@ class DriverFactory:
             proxy_server = proxy.replace('http://', '').replace('https://', '').split('@')[-1]
             options.add_argument(f'--proxy-server={proxy_server}')
 
-        service = None
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.execute_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        # Performance log: lets the scraper report blocked requests and bytes per page.
+        # Only Network events are recorded, so chromedriver does not buffer the rest
+        if settings.chrome_network_usage:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option(
+                "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
             )
-            return driver, temp_dir, debug_port
-        except Exception as e:
-            # Clean up temp directory if driver creation fails
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                except Exception:
-                    pass
-            raise ScrapingError(f"Failed to create Chrome driver: {e}") from e
+
+        return options, debug_port
+
+    @staticmethod
+    def _start_chrome(options: Options, block_profile: str | None) -> webdriver.Chrome:
+        """Launch Chrome with the given options and configure the session."""
+        profile = get_block_profile(block_profile or settings.chrome_block_profile)
+
+        service = Service(DriverFactory.resolve_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(settings.scraping_timeout)
+        driver.set_script_timeout(settings.chrome_script_timeout)
+        driver.execute_script(
+            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        )
+        apply_block_profile(driver, profile, parse_patterns(settings.chrome_block_extra_patterns))
+        return driver
+
+    @staticmethod
+    def cleanup_stale_profiles() -> int:
+        """Remove profile clones left behind by processes that are gone.
+
+        Returns:
+            Number of directories removed.
+        """
+        return DriverFactory.get_profile_store().cleanup_stale()
 
     @staticmethod
     def cleanup_driver(
@@ -121,13 +321,50 @@ class DriverFactory:
                 except Exception:
                     pass
 
-        # Clean up temp directory
-        if temp_dir and os.path.exists(temp_dir):
+        # Clean up temp directory; stop tracking it even if it is already gone
+        if temp_dir:
+            if os.path.exists(temp_dir):
+                try:
+                    DriverFactory._kill_chrome_processes_by_temp_dir(temp_dir)
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                except Exception:
+                    pass
+            with DriverFactory._profile_lock:
+                DriverFactory._profile_dirs.discard(temp_dir)
+
+    @staticmethod
+    def get_browser_memory_mb(temp_dir: str) -> float | None:
+        """Resident memory of the Chrome processes using a profile (Linux only).
+
+        Args:
+            temp_dir: The browser's --user-data-dir.
+
+        Returns:
+            Total RSS in MB, or None if it cannot be measured.
+        """
+        try:
+            result = subprocess.run(
+                ["pgrep", "-f", f"--user-data-dir={temp_dir}"],
+                capture_output=True,
+                text=True,
+                timeout=2,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+        if result.returncode != 0:
+            return None
+
+        total_kb = 0
+        for pid in result.stdout.split():
             try:
-                DriverFactory._kill_chrome_processes_by_temp_dir(temp_dir)
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            except Exception:
-                pass
+                with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+                    for line in status:
+                        if line.startswith("VmRSS:"):
+                            total_kb += int(line.split()[1])
+                            break
+            except (OSError, ValueError):
+                continue
+        return total_kb / 1024
 
     @staticmethod
     def _kill_chrome_processes_by_temp_dir(temp_dir: str) -> None:
@@ -0,0 +1,212 @@
+"""Network request blocking profiles applied through the Chrome DevTools protocol."""
+
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Network.setBlockedURLs only matches URLs, so resource types are mapped to the
+# URL patterns that identify them ("*" is the only wildcard).
+RESOURCE_TYPE_PATTERNS: dict[str, tuple[str, ...]] = {
+    "Image": (
+        "*.jpg*",
+        "*.jpeg*",
+        "*.png*",
+        "*.gif*",
+        "*.webp*",
+        "*.avif*",
+        "*.svg*",
+        "*.ico*",
+        "*bstatic.com/xdata/images/*",
+    ),
+    "Font": ("*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"),
+    "Media": ("*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"),
+    "Stylesheet": ("*.css*",),
+}
+
+# Ads, analytics and session recording; none of them affect the room table
+TRACKER_PATTERNS: tuple[str, ...] = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*bat.bing.com*",
+    "*hotjar.com*",
+    "*criteo.com*",
+    "*criteo.net*",
+    "*taboola.com*",
+    "*scorecardresearch.com*",
+)
+
+# Average transfer size per resource type, used to estimate the bytes a
+# blocked request would have cost (blocked requests never report a size).
+AVERAGE_RESOURCE_BYTES: dict[str, int] = {
+    "Image": 40_000,
+    "Font": 35_000,
+    "Media": 500_000,
+    "Stylesheet": 30_000,
+    "Script": 60_000,
+    "XHR": 5_000,
+    "Fetch": 5_000,
+    "Other": 10_000,
+}
+
+
+@dataclass(frozen=True)
+class BlockProfile:
+    """Set of resource types and URL patterns blocked in the browser."""
+
+    name: str
+    resource_types: frozenset[str] = frozenset()
+    block_trackers: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the profile blocks anything."""
+        return bool(self.resource_types) or self.block_trackers
+
+    def url_patterns(self, extra_patterns: list[str] | None = None) -> list[str]:
+        """Build the Network.setBlockedURLs pattern list.
+
+        Args:
+            extra_patterns: Additional URL patterns to block.
+
+        Returns:
+            Patterns without duplicates, in a stable order.
+        """
+        patterns: list[str] = []
+        for resource_type in sorted(self.resource_types):
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        if self.block_trackers:
+            patterns.extend(TRACKER_PATTERNS)
+        patterns.extend(extra_patterns or [])
+        return list(dict.fromkeys(patterns))
+
+
+BLOCK_PROFILES: dict[str, BlockProfile] = {
+    "off": BlockProfile("off"),
+    # Images, fonts, media and trackers; stylesheets are kept
+    "balanced": BlockProfile(
+        "balanced",
+        resource_types=frozenset({"Image", "Font", "Media"}),
+        block_trackers=True,
+    ),
+    # Only what the room table needs: stylesheets are blocked too
+    "minimal": BlockProfile(
+        "minimal",
+        resource_types=frozenset({"Image", "Font", "Media", "Stylesheet"}),
+        block_trackers=True,
+    ),
+}
+
+
+def get_block_profile(name: str) -> BlockProfile:
+    """Return the block profile with the given name.
+
+    Args:
+        name: Profile name ('off', 'balanced' or 'minimal').
+
+    Returns:
+        BlockProfile instance.
+
+    Raises:
+        ValueError: If the profile does not exist.
+    """
+    try:
+        return BLOCK_PROFILES[name.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown Chrome block profile {name!r} (valid: {', '.join(BLOCK_PROFILES)})"
+        ) from None
+
+
+def parse_patterns(value: str) -> list[str]:
+    """Split a comma separated list of URL patterns."""
+    return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+
+
+def apply_block_profile(
+    driver: Any, profile: BlockProfile, extra_patterns: list[str] | None = None
+) -> list[str]:
+    """Enable request blocking on a Chrome driver.
+
+    Args:
+        driver: Chrome WebDriver (must support execute_cdp_cmd).
+        profile: Profile to apply.
+        extra_patterns: Additional URL patterns to block.
+
+    Returns:
+        Blocked URL patterns (empty when nothing is blocked).
+    """
+    patterns = profile.url_patterns(extra_patterns)
+    if not patterns:
+        return []
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    logger.debug(f"Chrome block profile '{profile.name}': {len(patterns)} URL patterns")
+    return patterns
+
+
+@dataclass
+class NetworkUsage:
+    """Network traffic of one page, read from the Chrome performance log."""
+
+    requests: int = 0
+    transferred_bytes: int = 0
+    blocked_by_type: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def blocked_requests(self) -> int:
+        """Number of requests blocked by the profile."""
+        return sum(self.blocked_by_type.values())
+
+    @property
+    def estimated_saved_bytes(self) -> int:
+        """Estimated bytes not downloaded thanks to blocking."""
+        return sum(
+            count * AVERAGE_RESOURCE_BYTES.get(resource_type, AVERAGE_RESOURCE_BYTES["Other"])
+            for resource_type, count in self.blocked_by_type.items()
+        )
+
+
+def summarize_performance_log(entries: Any) -> NetworkUsage:
+    """Summarize the Network events of a Chrome performance log.
+
+    Args:
+        entries: Entries returned by driver.get_log("performance").
+
+    Returns:
+        NetworkUsage with the requests sent, bytes transferred and requests
+        blocked (by resource type).
+    """
+    usage = NetworkUsage()
+    if not isinstance(entries, list):
+        return usage
+
+    request_types: dict[str, str] = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        method = message.get("method")
+        params = message.get("params") or {}
+        if method == "Network.requestWillBeSent":
+            usage.requests += 1
+            request_types[params.get("requestId", "")] = params.get("type") or "Other"
+        elif method == "Network.loadingFinished":
+            usage.transferred_bytes += int(params.get("encodedDataLength") or 0)
+        elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+            # "inspector" is the reason reported for Network.setBlockedURLs matches
+            resource_type = (
+                params.get("type") or request_types.get(params.get("requestId", "")) or "Other"
+            )
+            usage.blocked_by_type[resource_type] += 1
+    return usage
@@ -0,0 +1,208 @@
+"""Chrome profile template and per-driver profile clones."""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CONSENT_BUTTON_SELECTOR = "#onetrust-accept-btn-handler"
+TEMPLATE_READY_MARKER = ".template-ready"
+
+# Runtime state that must not be shared between browsers (locks, sockets)
+# or is only cache, so cloning stays cheap.
+CLONE_IGNORE_PATTERNS = (
+    "Singleton*",
+    "*.lock",
+    "LOCK",
+    "lockfile",
+    "DevToolsActivePort",
+    "Cache",
+    "Code Cache",
+    "GPUCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache",
+    "Service Worker",
+    "Crashpad",
+    "Crash Reports",
+)
+
+
+def default_profile_root() -> Path:
+    """Directory holding the template and the clones.
+
+    The system temporary directory. tmpfs (/dev/shm) is faster but only 64 MB
+    in Docker by default, too small for one profile and its cache per worker;
+    use it through settings.chrome_profile_root where it is large enough.
+    """
+    return Path(tempfile.gettempdir()) / "bookeando-chrome"
+
+
+class ProfileStore:
+    """Chrome --user-data-dir directories owned by this application.
+
+    ``template/`` is a prepared profile (first run done, consent accepted)
+    and ``clones/<pid>-<id>/`` are the per-driver copies. A template is built
+    in ``builds/<pid>-<id>/`` and moved into place with os.replace(), so
+    several scraper processes (e.g. --shard) never write to the same
+    directory. Clone and build names carry the owning process id, so stale
+    ones of dead processes can be removed without touching those of other
+    running scrapers.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Root directory (created on demand).
+        """
+        self.root = Path(root)
+        self.template_dir = self.root / "template"
+        self.clones_dir = self.root / "clones"
+        self.builds_dir = self.root / "builds"
+
+    def template_ready(self, max_age_hours: float) -> bool:
+        """Whether the template exists and is recent enough to reuse."""
+        marker = self.template_dir / TEMPLATE_READY_MARKER
+        try:
+            age = time.time() - marker.stat().st_mtime
+        except OSError:
+            return False
+        return age < max_age_hours * 3600
+
+    def new_template_build(self) -> Path:
+        """Return an empty directory, private to this process, to build a template in."""
+        path = self._own_dir(self.builds_dir)
+        path.mkdir(parents=True)
+        return path
+
+    def finish_template(self, build_dir: Path) -> None:
+        """Drop caches from a built template, mark it ready and publish it.
+
+        The previous template is moved aside and the build takes its place,
+        both with os.replace(). If another process publishes its template in
+        between, that one is kept and this build is discarded.
+        """
+        for name in CLONE_IGNORE_PATTERNS:
+            for path in build_dir.rglob(name):
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+        (build_dir / TEMPLATE_READY_MARKER).write_text(str(time.time()))
+
+        previous = self._own_dir(self.builds_dir)
+        try:
+            os.replace(self.template_dir, previous)
+        except FileNotFoundError:
+            pass
+        try:
+            os.replace(build_dir, self.template_dir)
+        except OSError as e:
+            logger.debug(f"Profile template: kept the one published by another process ({e})")
+            shutil.rmtree(build_dir, ignore_errors=True)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    def discard_template_build(self, build_dir: Path) -> None:
+        """Remove a template build that failed."""
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+    def new_profile(self, from_template: bool) -> str:
+        """Create the profile directory for a new driver.
+
+        Args:
+            from_template: Clone the template (must be ready) instead of
+                starting from an empty profile.
+
+        Returns:
+            Path of the new profile directory.
+        """
+        self.clones_dir.mkdir(parents=True, exist_ok=True)
+        path = self._own_dir(self.clones_dir)
+        if from_template:
+            shutil.copytree(
+                self.template_dir,
+                path,
+                ignore=shutil.ignore_patterns(*CLONE_IGNORE_PATTERNS, TEMPLATE_READY_MARKER),
+            )
+        else:
+            path.mkdir()
+        return str(path)
+
+    def cleanup_stale(self) -> int:
+        """Remove the clones and builds whose owning process is no longer running.
+
+        Returns:
+            Number of directories removed.
+        """
+        removed = 0
+        for parent in (self.clones_dir, self.builds_dir):
+            if not parent.is_dir():
+                continue
+            for path in parent.iterdir():
+                owner = path.name.split("-", 1)[0]
+                if owner.isdigit() and _process_alive(int(owner)):
+                    continue
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    @staticmethod
+    def _own_dir(parent: Path) -> Path:
+        """Unique path under parent named after this process."""
+        return parent / f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this id exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def template_warmup_url() -> str:
+    """Home page opened to prepare the profile template (settings.booking_base_url)."""
+    return settings.booking_base_url.rstrip("/") + "/"
+
+
+def warm_up_profile(driver: Any) -> bool:
+    """Do the first-run work of a profile: open Booking and accept the consent.
+
+    Args:
+        driver: Chrome driver using the template profile.
+
+    Returns:
+        Whether the consent banner was found and accepted.
+    """
+    try:
+        driver.get(template_warmup_url())
+    except Exception as e:
+        logger.debug(f"Profile template: warm-up page did not finish loading: {e}")
+
+    try:
+        button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, CONSENT_BUTTON_SELECTOR))
+        )
+        button.click()
+        # Let the consent cookie be written before the browser quits
+        time.sleep(1)
+        return True
+    except Exception:
+        logger.info("Profile template: consent banner not found, keeping profile as is")
+        return False
@@ -0,0 +1,279 @@
+"""Room table (hprt-table) row extraction and mapping to domain objects."""
+
+import logging
+import random
+from dataclasses import dataclass
+from typing import Any
+
+from src.config.settings import settings
+from src.domain.models import RoomAvailability
+from src.domain.services import PriceService, TextExtractionService
+
+logger = logging.getLogger(__name__)
+
+# Selectors shared by every extraction strategy
+TABLE_SELECTOR = "table.hprt-table, table#hprt-table, table[class*='hprt-table']"
+ROW_SELECTORS = [
+    "table.hprt-table tbody tr, table#hprt-table tbody tr",
+    "table.hprt-table tr, table#hprt-table tr",
+    "tr[data-block-id]",
+]
+ROOM_TYPE_SELECTOR = "span.hprt-roomtype-icon-link"
+BASE_PRICE_SELECTOR = "div.bui-f-color-destructive.js-strikethrough-price"
+FINAL_PRICE_SELECTOR = "span.prco-valign-middle-helper"
+FALLBACK_PRICE_SELECTOR = "span.prc-no-css"
+OFFER_SELECTOR = "div.c-deals-container > div > div:nth-child(2) > span > span > span"
+AVAILABILITY_SELECTOR = (
+    "li.bui-list__item.bui-text--color-destructive-dark div.bui-list__description"
+)
+AVAILABILITY_FALLBACK_SELECTOR = "span.only_x_left.urgency_message_red"
+
+NON_REFUNDABLE_MARKER = "no reembolsable"
+MIN_ROW_HTML_LENGTH = 50
+
+# Collects every row of the room table in a single WebDriver round trip.
+# Mirrors the per-row find_elements lookups of the WebElement strategy.
+ROOM_TABLE_SCRIPT = """
+const rowSelectors = arguments[0];
+const fields = arguments[1];
+let rows = [];
+for (const selector of rowSelectors) {
+    rows = document.querySelectorAll(selector);
+    if (rows.length) break;
+}
+const textOf = (row, selector) => {
+    const el = row.querySelector(selector);
+    return el ? (el.innerText || el.textContent || '') : null;
+};
+return Array.from(rows).map((row) => {
+    const html = row.innerHTML || '';
+    const data = {
+        row_class: row.getAttribute('class') || '',
+        data_block_id: row.getAttribute('data-block-id'),
+        html_length: html.trim().length,
+        non_refundable: html.toLowerCase().includes(arguments[2]),
+    };
+    for (const [name, selector] of Object.entries(fields)) {
+        data[name] = textOf(row, selector);
+    }
+    return data;
+});
+"""
+
+# Returns [row count, ms since the last DOM mutation inside the room table].
+# The MutationObserver is installed on the first call and moved to the table
+# once it exists.
+ROWS_READY_SCRIPT = """
+const table = document.querySelector(arguments[0]);
+const target = table || document.body;
+let state = window.__bkRowsReady;
+if (!state || state.target !== target) {
+    if (state) state.observer.disconnect();
+    state = {target: target, last: performance.now()};
+    state.observer = new MutationObserver(() => { state.last = performance.now(); });
+    state.observer.observe(target, {childList: true, subtree: true, characterData: true});
+    window.__bkRowsReady = state;
+}
+// Same selector fallback as ROOM_TABLE_SCRIPT: the first selector that matches rows
+let count = 0;
+for (const selector of arguments[1]) {
+    count = document.querySelectorAll(selector).length;
+    if (count) break;
+}
+return [count, performance.now() - state.last];
+"""
+
+ROW_FIELD_SELECTORS = {
+    "room_type": ROOM_TYPE_SELECTOR,
+    "base_price": BASE_PRICE_SELECTOR,
+    "final_price": FINAL_PRICE_SELECTOR,
+    "fallback_price": FALLBACK_PRICE_SELECTOR,
+    "offer": OFFER_SELECTOR,
+    "availability": AVAILABILITY_SELECTOR,
+    "availability_fallback": AVAILABILITY_FALLBACK_SELECTOR,
+}
+
+
+@dataclass
+class RoomRowData:
+    """Raw fields of one room table row, before cleaning.
+
+    Text fields are None when the element was not found in the row.
+    """
+
+    row_class: str = ""
+    data_block_id: str | None = None
+    html_length: int = 0
+    non_refundable: bool = False
+    room_type: str | None = None
+    base_price: str | None = None
+    final_price: str | None = None
+    fallback_price: str | None = None
+    offer: str | None = None
+    availability: str | None = None
+    availability_fallback: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RoomRowData":
+        """Create RoomRowData from the dictionary returned by ROOM_TABLE_SCRIPT."""
+        return cls(
+            row_class=data.get("row_class") or "",
+            data_block_id=data.get("data_block_id"),
+            html_length=int(data.get("html_length") or 0),
+            non_refundable=bool(data.get("non_refundable")),
+            room_type=data.get("room_type"),
+            base_price=data.get("base_price"),
+            final_price=data.get("final_price"),
+            fallback_price=data.get("fallback_price"),
+            offer=data.get("offer"),
+            availability=data.get("availability"),
+            availability_fallback=data.get("availability_fallback"),
+        )
+
+    @property
+    def is_room_row(self) -> bool:
+        """Whether the row is a real room row (not a header)."""
+        row_class = self.row_class.lower()
+        if "hprt-table-header" in row_class:
+            return False
+        return bool(self.data_block_id) or "js-rt-block-row" in row_class
+
+
+def should_log_rows() -> bool:
+    """Decide whether the row detail of one scrape is logged.
+
+    Row detail is DEBUG-only and sampled per scrape with
+    settings.log_row_sample_rate, so a DEBUG run does not log every row of
+    every page.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return False
+    return random.random() < settings.log_row_sample_rate
+
+
+def build_room_availabilities(
+    rows: list[RoomRowData],
+    hotel_url: str,
+    checkin_date: str,
+    checkout_date: str,
+    log_rows: bool = False,
+) -> list[RoomAvailability]:
+    """Map raw room table rows to RoomAvailability domain objects.
+
+    Rows without room name or availability inherit them from the previous row,
+    and only the last "Estudio" room of the table is kept.
+
+    Args:
+        rows: Raw rows in table order.
+        hotel_url: Hotel URL (used in logs).
+        checkin_date: Check-in date (YYYY-MM-DD).
+        checkout_date: Check-out date (YYYY-MM-DD).
+        log_rows: Log the detail of every row at DEBUG level (see should_log_rows).
+
+    Returns:
+        List of RoomAvailability objects.
+    """
+    room_rows = [row for row in rows if row.is_room_row]
+    logger.debug("[BookingScraper] Filas válidas encontradas en tabla: %d", len(room_rows))
+
+    room_availabilities: list[RoomAvailability] = []
+    previous_room_name = ""
+    previous_availability: int | None = None  # Reused by rows without availability
+    last_estudio_index = -1
+
+    for index, row in enumerate(room_rows):
+        try:
+            # Si la fila está vacía o no tiene contenido relevante, saltar
+            if row.html_length < MIN_ROW_HTML_LENGTH:
+                if log_rows:
+                    logger.debug(
+                        "[BookingScraper] Saltando fila %d - contenido vacío o muy corto", index
+                    )
+                continue
+
+            # Si no tiene nombre, usar el de la iteración anterior
+            room_type = (row.room_type or "").strip()
+            if not room_type:
+                room_type = previous_room_name
+            else:
+                previous_room_name = room_type
+
+            base_price = PriceService.clean_price(row.base_price)
+
+            # Precio final, con fallback
+            final_price = PriceService.clean_price(row.final_price)
+            if not final_price:
+                final_price = PriceService.clean_price(row.fallback_price)
+
+            offer = (row.offer or "").strip()
+
+            availability = TextExtractionService.extract_number(row.availability)
+            if availability is None:
+                availability = TextExtractionService.extract_number(row.availability_fallback or "")
+
+            # Si no tiene disponibilidad, usar la de la iteración anterior
+            if availability is None:
+                availability = previous_availability if previous_availability else None
+            else:
+                previous_availability = availability
+
+            if log_rows:
+                logger.debug(
+                    "[BookingScraper] Parser data dia a dia",
+                    extra={
+                        "roomType": room_type,
+                        "basePrice": base_price,
+                        "finalPrice": final_price,
+                        "offer": offer,
+                        "availability": availability,
+                        "checkin": checkin_date,
+                        "checkout": checkout_date,
+                        "date_actual": checkin_date,
+                    },
+                )
+
+            # Solo agregar si hay algún dato relevante
+            if not (room_type or final_price or base_price):
+                continue
+
+            # Si ya teníamos un "Estudio" anterior, remover el anterior
+            if "estudio" in room_type.lower():
+                if 0 <= last_estudio_index < len(room_availabilities):
+                    removed_room = room_availabilities.pop(last_estudio_index).room_type_name
+                    logger.debug(
+                        "[BookingScraper] Eliminando 'Estudio' anterior | "
+                        "Hotel: %s | Fecha: %s | Habitación: %s",
+                        hotel_url,
+                        checkin_date,
+                        removed_room,
+                    )
+                last_estudio_index = len(room_availabilities)
+
+            room_availabilities.append(
+                RoomAvailability(
+                    room_type_id=0,  # Will be set by repository
+                    room_type_name=room_type,
+                    base_price=base_price,
+                    final_price=final_price,
+                    availability=availability,
+                    offer=offer if offer else None,
+                    non_refundable=row.non_refundable,
+                )
+            )
+
+            if log_rows:
+                logger.debug(
+                    "[BookingScraper] 💰 RoomAvailability creado | Habitación: %s | "
+                    "Precio Base: %s | Precio Final: %s | Fecha: %s | No reembolsable: %s",
+                    room_type,
+                    base_price,
+                    final_price,
+                    checkin_date,
+                    row.non_refundable,
+                )
+
+        except Exception as e:
+            logger.error(f"Error processing row {index}: {e}")
+            continue
+
+    return room_availabilities
@@ -0,0 +1,321 @@
+"""Offline room table parser working on the page HTML string.
+
+Uses the same selectors as the live scraper, applied to a lightweight tree
+built with the standard library HTML parser, so parsing needs no browser
+round trips and can be tested and parallelized as plain CPU work.
+"""
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+from src.domain.models import RoomAvailability
+from src.infrastructure.scraping.room_table import (
+    NON_REFUNDABLE_MARKER,
+    ROW_FIELD_SELECTORS,
+    ROW_SELECTORS,
+    RoomRowData,
+    build_room_availabilities,
+)
+
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+RAW_TEXT_TAGS = frozenset({"script", "style"})
+
+
+class Element:
+    """Minimal DOM element."""
+
+    __slots__ = ("tag", "attrs", "classes", "parent", "children", "inner_start", "inner_end")
+
+    def __init__(self, tag: str, attrs: dict[str, str], parent: "Element | None") -> None:
+        """Initialize the element."""
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = frozenset(attrs.get("class", "").split())
+        self.parent = parent
+        self.children: list[Element | str] = []
+        self.inner_start = 0
+        self.inner_end = 0
+
+    @property
+    def element_children(self) -> list["Element"]:
+        """Child elements (text nodes excluded)."""
+        return [child for child in self.children if isinstance(child, Element)]
+
+    def iter_descendants(self) -> "list[Element]":
+        """All descendant elements in document order."""
+        result: list[Element] = []
+        stack = list(reversed(self.element_children))
+        while stack:
+            element = stack.pop()
+            result.append(element)
+            stack.extend(reversed(element.element_children))
+        return result
+
+    @property
+    def text(self) -> str:
+        """Text content with whitespace collapsed, like WebElement.text."""
+        parts: list[str] = []
+        stack: list[Element | str] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            elif node.tag not in RAW_TEXT_TAGS:
+                stack.extend(reversed(node.children))
+        return " ".join("".join(parts).split())
+
+    def select(self, selector: str) -> list["Element"]:
+        """Return descendants matching a CSS selector (comma lists allowed)."""
+        groups = [_parse_selector(part) for part in selector.split(",")]
+        return [
+            element
+            for element in self.iter_descendants()
+            if any(_matches(element, group) for group in groups)
+        ]
+
+    def select_first(self, selector: str) -> "Element | None":
+        """Return the first descendant matching a CSS selector, or None."""
+        groups = [_parse_selector(part) for part in selector.split(",")]
+        for element in self.iter_descendants():
+            if any(_matches(element, group) for group in groups):
+                return element
+        return None
+
+
+class _TreeBuilder(HTMLParser):
+    """Build an Element tree, recording inner HTML offsets."""
+
+    def __init__(self, html: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        self.root = Element("#document", {}, None)
+        self.stack: list[Element] = [self.root]
+        self.line_offsets = [0]
+        for match in re.finditer("\n", html):
+            self.line_offsets.append(match.end())
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        parent = self.stack[-1]
+        element = Element(tag, {name: value or "" for name, value in attrs}, parent)
+        start_tag = self.get_starttag_text() or ""
+        element.inner_start = self._offset() + len(start_tag)
+        element.inner_end = element.inner_start
+        parent.children.append(element)
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        parent = self.stack[-1]
+        element = Element(tag, {name: value or "" for name, value in attrs}, parent)
+        element.inner_start = element.inner_end = self._offset()
+        parent.children.append(element)
+
+    def handle_endtag(self, tag: str) -> None:
+        # Close up to the matching open element; ignore stray end tags
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                end = self._offset()
+                for element in self.stack[depth:]:
+                    element.inner_end = end
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self.stack[-1].children.append(data)
+
+    def close(self) -> None:
+        super().close()
+        for element in self.stack[1:]:
+            element.inner_end = len(self.html)
+
+
+@dataclass
+class _Compound:
+    """Compound selector, e.g. ``div.a.b[x]:nth-child(2)``."""
+
+    tag: str | None = None
+    element_id: str | None = None
+    classes: list[str] = field(default_factory=list)
+    attributes: list[str] = field(default_factory=list)
+    nth_child: int | None = None
+
+
+_TOKEN_RE = re.compile(
+    r"(?P<tag>^[a-zA-Z][\w-]*|^\*)|\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)"
+    r"|\[(?P<attr>[\w-]+)\]|:nth-child\((?P<nth>\d+)\)"
+)
+_SELECTOR_CACHE: dict[str, list[tuple[str, _Compound]]] = {}
+
+
+def _parse_selector(selector: str) -> list[tuple[str, _Compound]]:
+    """Parse a selector into (combinator, compound) pairs, left to right.
+
+    Supported: tag, .class, #id, [attr], :nth-child(n), descendant and ``>``.
+    """
+    selector = selector.strip()
+    cached = _SELECTOR_CACHE.get(selector)
+    if cached is not None:
+        return cached
+
+    parts: list[tuple[str, _Compound]] = []
+    combinator = " "
+    for token in selector.replace(">", " > ").split():
+        if token == ">":
+            combinator = ">"
+            continue
+        compound = _Compound()
+        position = 0
+        for match in _TOKEN_RE.finditer(token):
+            if match.start() != position:
+                raise ValueError(f"Unsupported selector: {selector}")
+            position = match.end()
+            if match.group("tag"):
+                compound.tag = None if match.group("tag") == "*" else match.group("tag").lower()
+            elif match.group("cls"):
+                compound.classes.append(match.group("cls"))
+            elif match.group("id"):
+                compound.element_id = match.group("id")
+            elif match.group("attr"):
+                compound.attributes.append(match.group("attr"))
+            else:
+                compound.nth_child = int(match.group("nth"))
+        if position != len(token):
+            raise ValueError(f"Unsupported selector: {selector}")
+        parts.append((combinator, compound))
+        combinator = " "
+
+    _SELECTOR_CACHE[selector] = parts
+    return parts
+
+
+def _matches_compound(element: Element, compound: _Compound) -> bool:
+    if compound.tag is not None and element.tag != compound.tag:
+        return False
+    if compound.element_id is not None and element.attrs.get("id") != compound.element_id:
+        return False
+    if any(cls not in element.classes for cls in compound.classes):
+        return False
+    if any(attr not in element.attrs for attr in compound.attributes):
+        return False
+    if compound.nth_child is not None:
+        parent = element.parent
+        if parent is None:
+            return False
+        siblings = parent.element_children
+        if siblings.index(element) + 1 != compound.nth_child:
+            return False
+    return True
+
+
+def _matches(element: Element, parts: list[tuple[str, _Compound]], index: int = -1) -> bool:
+    """Match element against parts[:index+1], right to left."""
+    if index < 0:
+        index += len(parts)
+    combinator, compound = parts[index]
+    if not _matches_compound(element, compound):
+        return False
+    if index == 0:
+        return True
+
+    ancestor = element.parent
+    if combinator == ">":
+        return (
+            ancestor is not None
+            and ancestor.tag != "#document"
+            and _matches(ancestor, parts, index - 1)
+        )
+    while ancestor is not None and ancestor.tag != "#document":
+        if _matches(ancestor, parts, index - 1):
+            return True
+        ancestor = ancestor.parent
+    return False
+
+
+def parse_html(html: str) -> Element:
+    """Parse an HTML string into an Element tree.
+
+    Args:
+        html: Page HTML.
+
+    Returns:
+        Document root element.
+    """
+    builder = _TreeBuilder(html)
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def parse_room_rows(html: str) -> list[RoomRowData]:
+    """Extract the raw room table rows from the page HTML.
+
+    Args:
+        html: Page HTML (e.g. driver.page_source).
+
+    Returns:
+        Raw rows in table order.
+    """
+    document = parse_html(html)
+
+    elements: list[Element] = []
+    for selector in ROW_SELECTORS:
+        elements = document.select(selector)
+        if elements:
+            break
+
+    rows: list[RoomRowData] = []
+    for element in elements:
+        row_html = html[element.inner_start : element.inner_end]
+        data: dict[str, object] = {
+            "row_class": element.attrs.get("class", ""),
+            "data_block_id": element.attrs.get("data-block-id"),
+            "html_length": len(row_html.strip()),
+            "non_refundable": NON_REFUNDABLE_MARKER in row_html.lower(),
+        }
+        for name, selector in ROW_FIELD_SELECTORS.items():
+            found = element.select_first(selector)
+            data[name] = found.text if found is not None else None
+        rows.append(RoomRowData.from_dict(data))
+    return rows
+
+
+def parse_room_table(
+    html: str,
+    hotel_url: str = "",
+    checkin_date: str = "",
+    checkout_date: str = "",
+) -> list[RoomAvailability]:
+    """Parse the room table of a Booking.com hotel page.
+
+    Args:
+        html: Page HTML.
+        hotel_url: Hotel URL (used in logs).
+        checkin_date: Check-in date (used in logs).
+        checkout_date: Check-out date (used in logs).
+
+    Returns:
+        List of RoomAvailability objects, same rules as BookingScraper.scrape_hotel.
+    """
+    return build_room_availabilities(parse_room_rows(html), hotel_url, checkin_date, checkout_date)
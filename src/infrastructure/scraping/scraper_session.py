@@ -0,0 +1,75 @@
+"""Long-lived scraper session shared across several pages."""
+
+import logging
+from typing import Any
+
+from src.config.settings import settings
+from src.infrastructure.scraping.booking_scraper import BookingScraper
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperSession:
+    """Owns a reusable BookingScraper and recycles it after N pages or an error.
+
+    Launching Chrome (driver, temp profile, debug port) is expensive, so the
+    same browser is reused for consecutive pages. It is closed and replaced on
+    the next acquire() once it has scraped ``max_pages`` pages or after a
+    failed scrape.
+    """
+
+    def __init__(self, proxy: str | None = None, max_pages: int | None = None) -> None:
+        """Initialize the session.
+
+        Args:
+            proxy: Optional proxy URL for the browsers of this session.
+            max_pages: Pages per browser before recycling
+                (defaults to settings.scraper_session_max_pages).
+        """
+        self.proxy = proxy
+        self.max_pages = max(1, max_pages or settings.scraper_session_max_pages)
+        self.scraper: BookingScraper | None = None
+        self.browsers_started = 0
+
+    def acquire(self) -> BookingScraper:
+        """Return the current scraper, starting a new browser if needed.
+
+        Returns:
+            A ready BookingScraper.
+
+        Raises:
+            ScrapingError: If the browser cannot be started.
+        """
+        if self.scraper is None or self.scraper.driver is None:
+            self.scraper = BookingScraper(proxy=self.proxy)
+            self.browsers_started += 1
+            logger.debug(f"ScraperSession: browser #{self.browsers_started} started")
+        return self.scraper
+
+    def release(self, scraper: BookingScraper, failed: bool = False) -> None:
+        """Give the scraper back after a page.
+
+        Args:
+            scraper: Scraper returned by acquire().
+            failed: Whether the scrape failed; the browser is then recycled.
+        """
+        if failed or scraper.pages_scraped >= self.max_pages:
+            reason = "error" if failed else f"{scraper.pages_scraped} pages"
+            logger.debug(f"ScraperSession: recycling browser after {reason}")
+            scraper.close()
+            if scraper is self.scraper:
+                self.scraper = None
+
+    def close(self) -> None:
+        """Close the current browser, if any."""
+        if self.scraper is not None:
+            self.scraper.close()
+            self.scraper = None
+
+    def __enter__(self) -> "ScraperSession":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
@@ -4,20 +4,34 @@ import argparse
 import logging
 import random
 import subprocess
+import threading
 import time
 from datetime import timedelta
+from pathlib import Path
+from typing import Any
 
 from src.utils.timezone import now_argentina
-from pathlib import Path
 
-from src.application.update_prices import UpdatePricesService
-from src.application.url_builder import build_booking_url
+from src.application.checkpoint import RunJournal
+from src.application.result_writer import ResultWriter
+from src.application.sharding import Shard
+from src.application.spool import ResultSpool
 from src.application.weekend_detector import detect_weekend_extractions
+from src.application.worker_pool import ScrapeWorker, ScrapeWorkerPool, empty_results
 from src.config.settings import settings
 from src.domain.exceptions import DatabaseConnectionError
-from src.infrastructure.database.connection import get_db_connection
-from src.infrastructure.database.repositories import HotelRepository
+from src.domain.models import Hotel, ScrapeJob, ScrapeResult
+from src.infrastructure.database.connection import (
+    close_connection_pool,
+    db_connection,
+    init_connection_pool,
+)
+from src.infrastructure.database.repositories import HotelRepository, SchemaRepository
 from src.infrastructure.logging.setup import setup_logging
+from src.infrastructure.metrics.prometheus import TextfileExporter, metrics
+from src.infrastructure.scraping.browser_pool import BrowserPool
+from src.infrastructure.scraping.driver_factory import DriverFactory
+from src.utils.timing import add_listener, record, run_timings
 
 logger = logging.getLogger(__name__)
 
@@ -44,43 +58,411 @@ def kill_chrome_processes() -> None:
         logger.warning(f"Error killing Chrome processes: {e}")
 
 
-def cleanup_old_temp_dirs(max_age_hours: int = 24) -> None:
-    """Clean up old temporary directories that may have been left behind."""
-    try:
-        import glob
-        import os
-        import shutil
-
-        temp_base = Path.cwd() / "tmp"
-        if not temp_base.exists():
-            return
-
-        cleaned = 0
-        now = time.time()
-        max_age_seconds = max_age_hours * 3600
-
-        for temp_dir in glob.glob(str(temp_base / "tmp*")):
-            try:
-                # Verify it's a directory
-                if os.path.isdir(temp_dir) and temp_dir != str(temp_base):
-                    # Check directory age
-                    dir_age = now - os.path.getmtime(temp_dir)
-                    if dir_age > max_age_seconds:
-                        # Verify it's a Chrome temp directory (contains Default)
-                        if os.path.exists(os.path.join(temp_dir, "Default")):
-                            shutil.rmtree(temp_dir, ignore_errors=True)
-                            cleaned += 1
-                            logger.debug(f"Old temporary directory removed: {temp_dir}")
-            except Exception as e:
-                logger.debug(f"Error checking directory {temp_dir}: {e}")
-                continue
+def cleanup_old_temp_dirs() -> None:
+    """Remove Chrome profile directories left behind by previous runs.
 
+    Only the profiles created by DriverFactory under its profile root are
+    considered, and those of processes still running are kept.
+    """
+    try:
+        cleaned = DriverFactory.cleanup_stale_profiles()
         if cleaned > 0:
             logger.info(f"Temporary directory cleanup: {cleaned} directories removed")
     except Exception as e:
         logger.warning(f"Error cleaning old temporary directories: {e}")
 
 
+def select_proxy() -> str | None:
+    """Pick a random proxy from the database.
+
+    Returns:
+        Proxy URL or None if no proxy is available or the lookup fails.
+    """
+    try:
+        with db_connection() as conn_proxy:
+            hotel_repo = HotelRepository(conn_proxy)
+            return hotel_repo.get_random_proxy()
+    except DatabaseConnectionError as e:
+        logger.warning(f"Failed to get proxy: {e}, continuing without proxy")
+        return None
+
+
+def check_schema_support() -> None:
+    """Turn off the database features whose migration has not been applied.
+
+    The session upsert needs the unique key of migrations/001; without it
+    every run would insert duplicated sessions, so the find-then-create path
+    is used instead. Delta storage needs the content_hash column and the
+    nullable prices of migrations/002; without them every save would fail,
+    so all rows are inserted instead.
+    """
+    if not settings.db_session_upsert and not settings.db_delta_storage:
+        return
+    with db_connection() as conn:
+        schema = SchemaRepository(conn)
+        if settings.db_session_upsert and not schema.has_unique_key(
+            "scrape_sessions", ("hotel_id", "checkin_date", "checkout_date")
+        ):
+            logger.warning(
+                "scrape_sessions has no unique key on (hotel_id, checkin_date, checkout_date): "
+                "run migrations/001_scrape_sessions_unique_key.sql. "
+                "Saving sessions with find-then-create instead of the upsert"
+            )
+            settings.db_session_upsert = False
+        if settings.db_delta_storage and not (
+            schema.has_column("room_availabilities", "content_hash")
+            and schema.has_column("room_availabilities", "base_price", nullable=True)
+            and schema.has_column("room_availabilities", "final_price", nullable=True)
+        ):
+            logger.warning(
+                "room_availabilities has no content_hash column or nullable prices: "
+                "run migrations/002_room_availabilities_content_hash.sql. "
+                "Delta storage is off, every room availability is inserted"
+            )
+            settings.db_delta_storage = False
+
+
+def build_jobs(hotels: list[Hotel], dates: list[dict[str, str]]) -> list[ScrapeJob]:
+    """Build the (hotel, checkin, checkout) jobs for a run.
+
+    Hotels without URL are skipped with a warning.
+
+    Args:
+        hotels: Hotels to process.
+        dates: List of {'checkin': ..., 'checkout': ...} dictionaries.
+
+    Returns:
+        Jobs ordered by hotel, then by date.
+    """
+    jobs: list[ScrapeJob] = []
+    for hotel in hotels:
+        if not hotel.url:
+            logger.warning(f"Hotel {hotel.id} has no URL, skipping...")
+            continue
+
+        hotel_slug = hotel.slug or hotel.url.split("/")[-1].split(".")[0]
+        hotel_currency = hotel.currency or settings.booking_currency
+        for date_info in dates:
+            jobs.append(
+                ScrapeJob(
+                    hotel_id=hotel.id,
+                    hotel_name=hotel.name,
+                    hotel_slug=hotel_slug,
+                    currency=hotel_currency,
+                    checkin_date=date_info["checkin"],
+                    checkout_date=date_info["checkout"],
+                )
+            )
+    return jobs
+
+
+def accumulate_results(hotel_stats: dict[str, Any], results: dict[str, Any]) -> None:
+    """Add the results of one job to the per-hotel statistics."""
+    hotel_stats["sessions_created"] += results.get("sessions_created", 0)
+    hotel_stats["sessions_updated"] += results.get("sessions_updated", 0)
+    hotel_stats["room_availabilities_created"] += results.get("room_availabilities_created", 0)
+    hotel_stats["room_availabilities_unchanged"] = hotel_stats.get(
+        "room_availabilities_unchanged", 0
+    ) + results.get("room_availabilities_unchanged", 0)
+    if results.get("queued"):
+        hotel_stats["queued"] = hotel_stats.get("queued", 0) + 1
+    if results.get("spooled"):
+        hotel_stats["spooled"] = hotel_stats.get("spooled", 0) + 1
+    if results.get("errors"):
+        hotel_stats["errors"].extend(results["errors"])
+
+
+def merge_hotel_stats(total_stats: dict[str, Any], hotel_stats: dict[str, Any]) -> None:
+    """Accumulate per-hotel statistics in the global statistics."""
+    total_stats["hotels_processed"] += 1
+    total_stats["total_sessions_created"] += hotel_stats["sessions_created"]
+    total_stats["total_sessions_updated"] += hotel_stats["sessions_updated"]
+    total_stats["total_room_availabilities_created"] += hotel_stats[
+        "room_availabilities_created"
+    ]
+    total_stats["total_room_availabilities_unchanged"] += hotel_stats.get(
+        "room_availabilities_unchanged", 0
+    )
+    total_stats["total_spooled"] += hotel_stats.get("spooled", 0)
+    total_stats["total_errors"].extend(hotel_stats["errors"])
+
+
+def merge_persisted_stats(total_stats: dict[str, Any], persisted_stats: dict[str, Any]) -> None:
+    """Accumulate the statistics of the results saved by the background writer."""
+    total_stats["total_sessions_created"] += persisted_stats["sessions_created"]
+    total_stats["total_sessions_updated"] += persisted_stats["sessions_updated"]
+    total_stats["total_room_availabilities_created"] += persisted_stats[
+        "room_availabilities_created"
+    ]
+    total_stats["total_room_availabilities_unchanged"] += persisted_stats.get(
+        "room_availabilities_unchanged", 0
+    )
+    total_stats["total_spooled"] += persisted_stats.get("spooled", 0)
+    total_stats["total_errors"].extend(persisted_stats["errors"])
+
+
+def is_job_completed(results: dict[str, Any]) -> bool:
+    """Whether a job saved (or spooled) its scrape session and can be skipped on resume."""
+    if results.get("failed"):
+        return False
+    if results.get("spooled"):
+        return True
+    return bool(results.get("sessions_created") or results.get("sessions_updated"))
+
+
+def print_job_results(results: dict[str, Any], prefix: str = "") -> None:
+    """Print the outcome of a single job."""
+    if results.get("failed"):
+        print(f"    {prefix}❌ Error: {results['errors'][-1]}")
+        return
+
+    if results.get("queued"):
+        print(f"    {prefix}📥 Queued for saving | Rooms: {results.get('rooms_scraped', 0)}")
+        return
+
+    if results.get("spooled"):
+        print(f"    {prefix}💾 Database unavailable, spooled: {results['errors'][-1]}")
+        return
+
+    unchanged = results.get("room_availabilities_unchanged", 0)
+    print(
+        f"    {prefix}✅ Sessions: {results.get('sessions_created', 0)} created, "
+        f"{results.get('sessions_updated', 0)} updated | "
+        f"Rooms: {results.get('room_availabilities_created', 0)}"
+        f"{f' ({unchanged} unchanged)' if unchanged else ''}"
+    )
+
+    if results.get("errors"):
+        print(f"    {prefix}⚠️  Errors: {len(results['errors'])}")
+        for error in results["errors"]:
+            logger.error(f"      - {error}")
+
+
+def print_stage_timings(stages: dict[str, dict[str, float]]) -> None:
+    """Print the per-stage duration statistics of the run."""
+    if not stages:
+        return
+    print("\n⏱️  Stage timings (seconds):")
+    print(f"  {'stage':<20} {'count':>7} {'p50':>9} {'p95':>9} {'max':>9} {'total':>10}")
+    for stage, stats in stages.items():
+        print(
+            f"  {stage:<20} {stats['count']:>7} {stats['p50']:>9.3f} {stats['p95']:>9.3f} "
+            f"{stats['max']:>9.3f} {stats['total']:>10.3f}"
+        )
+
+
+def print_hotel_summary(hotel_name: str, hotel_stats: dict[str, Any]) -> None:
+    """Print the summary of a processed hotel."""
+    print(f"\n  📊 Hotel summary {hotel_name}:")
+    print(f"     - Sessions created: {hotel_stats['sessions_created']}")
+    print(f"     - Sessions updated: {hotel_stats['sessions_updated']}")
+    print(f"     - Rooms created: {hotel_stats['room_availabilities_created']}")
+    if hotel_stats.get("room_availabilities_unchanged"):
+        print(f"     - Rooms unchanged: {hotel_stats['room_availabilities_unchanged']}")
+    if hotel_stats.get("queued"):
+        print(f"     - Dates queued for saving: {hotel_stats['queued']}")
+    if hotel_stats.get("spooled"):
+        print(f"     - Dates spooled: {hotel_stats['spooled']}")
+    print(f"     - Errors: {len(hotel_stats['errors'])}")
+
+
+def run_sequential(
+    jobs: list[ScrapeJob],
+    proxy: str | None,
+    total_stats: dict[str, Any],
+    journal: RunJournal | None = None,
+    result_writer: ResultWriter | None = None,
+    spool: ResultSpool | None = None,
+) -> None:
+    """Process jobs one at a time, hotel by hotel.
+
+    Args:
+        jobs: Jobs ordered by hotel.
+        proxy: Proxy used for the whole execution.
+        total_stats: Global statistics to update.
+        journal: Optional run journal where completed jobs are recorded.
+        result_writer: Optional background writer saving the scraped pages.
+        spool: Optional local spool for pages that cannot be saved.
+    """
+    hotel_jobs: dict[int, list[ScrapeJob]] = {}
+    for job in jobs:
+        hotel_jobs.setdefault(job.hotel_id, []).append(job)
+
+    # Optional warm browser pool: the next browser starts while a page is scraped
+    browser_pool = None
+    if settings.browser_pool_size > 0:
+        browser_pool = BrowserPool(size=settings.browser_pool_size, proxy_provider=lambda: proxy)
+        browser_pool.start()
+
+    worker = ScrapeWorker(
+        worker_id=1,
+        proxy=proxy,
+        browser_pool=browser_pool,
+        result_writer=result_writer,
+        spool=spool,
+    )
+    try:
+        for hotel_idx, jobs_for_hotel in enumerate(hotel_jobs.values(), 1):
+            first_job = jobs_for_hotel[0]
+            print(
+                f"\n🏨 [{hotel_idx}/{len(hotel_jobs)}] Processing hotel: "
+                f"{first_job.hotel_name} (ID: {first_job.hotel_id})"
+            )
+            print("-" * 80)
+
+            hotel_stats = empty_results()
+
+            # Process each date for this hotel
+            for date_idx, job in enumerate(jobs_for_hotel, 1):
+                print(
+                    f"  📆 [{date_idx}/{len(jobs_for_hotel)}] Date: "
+                    f"{job.checkin_date} -> {job.checkout_date}"
+                )
+
+                results = worker.process(job)
+                metrics.record_results(results)
+                if journal is not None and is_job_completed(results):
+                    journal.mark_done(job)
+                accumulate_results(hotel_stats, results)
+                print_job_results(results)
+
+                # Random delay between requests
+                # Don't delay after last request of last hotel
+                if not (hotel_idx == len(hotel_jobs) and date_idx == len(jobs_for_hotel)):
+                    delay = random.randint(
+                        settings.scraping_delay_min, settings.scraping_delay_max
+                    )
+                    print(f"    ⏳ Waiting {delay} seconds before next request...")
+                    time.sleep(delay)
+                    record("delay", delay)
+
+            print_hotel_summary(first_job.hotel_name, hotel_stats)
+            merge_hotel_stats(total_stats, hotel_stats)
+    finally:
+        worker.close()
+        if browser_pool is not None:
+            browser_pool.close()
+
+
+def run_concurrent(
+    jobs: list[ScrapeJob],
+    workers: int,
+    total_stats: dict[str, Any],
+    journal: RunJournal | None = None,
+    result_writer: ResultWriter | None = None,
+    spool: ResultSpool | None = None,
+) -> None:
+    """Process jobs with a bounded pool of independent workers.
+
+    Each worker owns its scraper, DB connection and proxy. Statistics are
+    merged once every worker has finished.
+
+    Args:
+        jobs: Jobs to process.
+        workers: Number of concurrent workers.
+        total_stats: Global statistics to update.
+        journal: Optional run journal where completed jobs are recorded.
+        result_writer: Optional background writer saving the scraped pages.
+        spool: Optional local spool for pages that cannot be saved.
+    """
+    print_lock = threading.Lock()
+    done_count = 0
+
+    def on_job_done(worker: ScrapeWorker, job: ScrapeJob, results: dict[str, Any]) -> None:
+        nonlocal done_count
+        metrics.record_results(results)
+        if journal is not None and is_job_completed(results):
+            journal.mark_done(job)
+        with print_lock:
+            done_count += 1
+            print(
+                f"  📆 [{done_count}/{len(jobs)}] [W{worker.worker_id}] "
+                f"{job.hotel_name} (ID: {job.hotel_id}) "
+                f"{job.checkin_date} -> {job.checkout_date}"
+            )
+            print_job_results(results, prefix=f"[W{worker.worker_id}] ")
+
+    pool = ScrapeWorkerPool(
+        workers=workers,
+        proxy_provider=select_proxy,
+        on_job_done=on_job_done,
+        result_writer=result_writer,
+        spool=spool,
+    )
+    outcomes = pool.run(jobs)
+
+    # Merge statistics per hotel, keeping the original hotel order
+    hotel_stats_by_id: dict[int, dict[str, Any]] = {}
+    hotel_names: dict[int, str] = {}
+    for job, results in outcomes:
+        hotel_stats = hotel_stats_by_id.setdefault(job.hotel_id, empty_results())
+        hotel_names[job.hotel_id] = job.hotel_name
+        accumulate_results(hotel_stats, results)
+
+    for hotel_id, hotel_stats in hotel_stats_by_id.items():
+        print_hotel_summary(hotel_names[hotel_id], hotel_stats)
+        merge_hotel_stats(total_stats, hotel_stats)
+
+
+def replay_spool(shard: Shard | None = None) -> None:
+    """Load the results spooled by previous runs (of a shard, if given) into the database."""
+    if not settings.spool_file:
+        print("⚠️ SPOOL_FILE is not configured, nothing to replay")
+        return
+
+    init_connection_pool(size=max(settings.db_pool_size, 1))
+    try:
+        check_schema_support()
+        spool_file = shard.path_for(settings.spool_file) if shard else settings.spool_file
+        stats = ResultSpool(spool_file).replay()
+    finally:
+        close_connection_pool()
+
+    print("\n" + "=" * 80)
+    print("📈 SPOOL REPLAY SUMMARY")
+    print("=" * 80)
+    print(f"Results saved: {stats['replayed']}")
+    print(f"Results still spooled: {stats['failed']}")
+    print(f"Results skipped (newer capture already saved): {stats['stale']}")
+    print(f"Total sessions created: {stats['sessions_created']}")
+    print(f"Total sessions updated: {stats['sessions_updated']}")
+    print(f"Total rooms created: {stats['room_availabilities_created']}")
+    for error in stats["errors"][:10]:
+        print(f"  - {error}")
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    """Measure scraping throughput against the local Booking.com stand-in (no database)."""
+    try:
+        from benchmarks.booking_server import ServerBehavior
+        from benchmarks.throughput import run_throughput
+    except ImportError as e:
+        raise RuntimeError(
+            "Benchmark mode needs the benchmarks/ package of a source checkout"
+        ) from e
+
+    behavior = ServerBehavior(
+        latency=args.latency,
+        subresources=args.subresources,
+        subresource_delay=args.subresource_delay,
+        empty_table_rate=args.empty_rate,
+        error_rate=args.error_rate,
+    )
+    print(f"🏁 Benchmark: {args.pages} pages, {args.workers} worker(s), {behavior}")
+    report = run_throughput(pages=args.pages, workers=args.workers, behavior=behavior)
+
+    print("\n" + "=" * 80)
+    print("📈 BENCHMARK SUMMARY")
+    print("=" * 80)
+    print(f"Pages scraped: {report['succeeded']} of {report['pages']}")
+    print(f"Pages failed: {report['failed']}")
+    print(f"Elapsed: {report['elapsed_seconds']:.1f}s")
+    print(f"Throughput: {report['pages_per_minute']:.1f} pages/minute")
+    print(f"Server responses: {report['server']}")
+    print_stage_timings(report["stages"])
+    logger.info("Benchmark finished", extra={"event": "throughput_benchmark", **report})
+
+
 def main() -> None:
     """Main entry point."""
     # Setup logging
@@ -88,54 +470,127 @@ def main() -> None:
 
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Booking Scraper")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "replay-spool", "benchmark"],
+        default="run",
+        help="run: scrape and save prices (default); "
+        "replay-spool: save the results spooled while the database was unreachable; "
+        "benchmark: measure scraping throughput against a local Booking.com stand-in",
+    )
     parser.add_argument(
         "--days", type=int, default=15, help="Number of days to extract (default: 15)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of concurrent scraper workers (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the jobs already completed by an interrupted run of today",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="INDEX/COUNT",
+        help="Scrape only shard INDEX (0-based) of COUNT, e.g. 0/4 on the first of four "
+        "machines; hotels are assigned by a consistent hash of their id",
+    )
+    benchmark_group = parser.add_argument_group("benchmark options")
+    benchmark_group.add_argument(
+        "--pages", type=int, default=30, help="Pages to scrape (default: 30)"
+    )
+    benchmark_group.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds before each hotel page is served"
+    )
+    benchmark_group.add_argument(
+        "--subresources", type=int, default=0, help="Slow assets added to each page"
+    )
+    benchmark_group.add_argument(
+        "--subresource-delay", type=float, default=0.0, help="Seconds each slow asset takes"
+    )
+    benchmark_group.add_argument(
+        "--empty-rate", type=float, default=0.0, help="Share of pages with an empty room table"
+    )
+    benchmark_group.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of pages answered with HTTP 503"
+    )
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    shard = None
+    if args.shard:
+        try:
+            shard = Shard.parse(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.command == "replay-spool":
+        replay_spool(shard)
+        return
+
+    if args.command == "benchmark":
+        run_benchmark(args)
+        return
+
     # Clean up zombie processes and old temp files at startup
     logger.info("🧹 Cleaning Chrome/ChromeDriver zombie processes and old temp files...")
     kill_chrome_processes()
-    cleanup_old_temp_dirs(max_age_hours=1)
+    cleanup_old_temp_dirs()
     logger.info("✅ Initial cleanup completed")
 
     days_to_extract = args.days
     print(f"📅 Configured to extract {days_to_extract} days")
 
     # Get list of hotels
+    # One pooled connection per worker and writer thread, plus one for the main thread
+    init_connection_pool(
+        size=max(settings.db_pool_size, args.workers + settings.db_writer_threads + 1)
+    )
+
     try:
-        conn_temp = get_db_connection()
-        try:
+        check_schema_support()
+        with db_connection() as conn_temp:
             hotel_repo = HotelRepository(conn_temp)
             hotels = hotel_repo.fetch_all(limit=1000)
 
-            if not hotels:
-                raise RuntimeError("No hotels found in hotels table")
+        if not hotels:
+            raise RuntimeError("No hotels found in hotels table")
 
-            print(f"📋 Total hotels to process: {len(hotels)}")
-        finally:
-            conn_temp.close()
+        print(f"📋 Total hotels to process: {len(hotels)}")
     except DatabaseConnectionError as e:
         logger.error(f"Failed to connect to database: {e}")
         raise
 
-    # Select proxy once for entire execution
-    try:
-        conn_proxy = get_db_connection()
-        try:
-            hotel_repo = HotelRepository(conn_proxy)
-            proxy = hotel_repo.get_random_proxy()
-            if proxy:
-                proxy_display = proxy.split("@")[-1] if "@" in proxy else proxy
-                print(f"🔒 Proxy selected for entire execution: {proxy_display}")
-            else:
-                print("⚠️ No proxies found in database, will use direct connection")
-                proxy = None
-        finally:
-            conn_proxy.close()
-    except DatabaseConnectionError as e:
-        logger.warning(f"Failed to get proxy: {e}, continuing without proxy")
-        proxy = None
+    # Each machine scrapes its own slice of the hotels, with its own checkpoint and spool
+    checkpoint_file: str | Path = settings.checkpoint_file
+    spool_file: str | Path = settings.spool_file
+    if shard is not None:
+        total_hotels = len(hotels)
+        hotels = shard.select(hotels)
+        checkpoint_file = shard.path_for(settings.checkpoint_file)
+        if settings.spool_file:
+            spool_file = shard.path_for(settings.spool_file)
+        print(f"🧩 Shard {shard}: {len(hotels)} of {total_hotels} hotels")
+        if not hotels:
+            print("⚠️ No hotels assigned to this shard, nothing to do")
+            close_connection_pool()
+            return
+
+    # Select proxy once for entire execution (workers select their own)
+    proxy = None
+    if args.workers == 1:
+        proxy = select_proxy()
+        if proxy:
+            proxy_display = proxy.split("@")[-1] if "@" in proxy else proxy
+            print(f"🔒 Proxy selected for entire execution: {proxy_display}")
+        else:
+            print("⚠️ No proxies found in database, will use direct connection")
 
     # Calculate dates: from today to next configured days
     today = now_argentina()
@@ -170,137 +625,116 @@ def main() -> None:
         "total_sessions_created": 0,
         "total_sessions_updated": 0,
         "total_room_availabilities_created": 0,
+        "total_room_availabilities_unchanged": 0,
+        "total_spooled": 0,
         "total_errors": [],
     }
 
-        # Process each hotel
-    for hotel_idx, hotel in enumerate(hotels, 1):
-        hotel_id = hotel.id
-        hotel_name = hotel.name
-        hotel_slug = hotel.slug or hotel.url.split("/")[-1].split(".")[0] if hotel.url else ""
-        hotel_currency = hotel.currency or settings.booking_currency
-
-        if not hotel.url:
-            logger.warning(f"Hotel {hotel_id} has no URL, skipping...")
-            continue
-
-        print(f"\n🏨 [{hotel_idx}/{len(hotels)}] Processing hotel: {hotel_name} (ID: {hotel_id})")
-        print("-" * 80)
-
-        hotel_stats = {
-            "sessions_created": 0,
-            "sessions_updated": 0,
-            "room_availabilities_created": 0,
-            "errors": [],
-        }
-
-        # Process each date for this hotel
-        for date_idx, date_info in enumerate(dates, 1):
-            checkin = date_info["checkin"]
-            checkout = date_info["checkout"]
-
-            print(f"  📆 [{date_idx}/{len(dates)}] Date: {checkin} -> {checkout}")
-
-            # Create new connection for each request
-            conn = None
-            try:
-                conn = get_db_connection()
-                service = UpdatePricesService(conn, proxy=proxy)
-
-                # Build URL with all required parameters
-                hotel_url = build_booking_url(
-                    hotel_slug=hotel_slug,
-                    checkin=checkin,
-                    checkout=checkout,
-                    currency=hotel_currency,
-                    adults=1,
-                    children=0,
-                )
-
-                # Perform scraping
-                results = service.update_hotel_prices(
-                    hotel_id=hotel_id,
-                    hotel_url=hotel_url,
-                    checkin_date=checkin,
-                    checkout_date=checkout,
-                    adults=1,
-                    children=0,
-                    currency=hotel_currency,
-                    extraction_mode="daily",
-                    proxy_id=None,
-                )
-
-                # Accumulate statistics
-                hotel_stats["sessions_created"] += results.get("sessions_created", 0)
-                hotel_stats["sessions_updated"] += results.get("sessions_updated", 0)
-                hotel_stats["room_availabilities_created"] += results.get(
-                    "room_availabilities_created", 0
-                )
+    jobs = build_jobs(hotels, dates)
 
-                if results.get("errors"):
-                    hotel_stats["errors"].extend(results["errors"])
-
-                print(
-                    f"    ✅ Sessions: {results.get('sessions_created', 0)} created, "
-                    f"{results.get('sessions_updated', 0)} updated | "
-                    f"Rooms: {results.get('room_availabilities_created', 0)}"
-                )
+    # Durable progress journal: one run per day, continued with --resume
+    journal = RunJournal.open(
+        checkpoint_file, run_id=today.strftime("%Y-%m-%d"), resume=args.resume
+    )
+    if args.resume:
+        pending_jobs = [job for job in jobs if not journal.is_done(job)]
+        print(
+            f"⏩ Resuming: {len(jobs) - len(pending_jobs)} jobs already completed, "
+            f"{len(pending_jobs)} pending"
+        )
+        jobs = pending_jobs
+
+    # Pages that cannot be saved are kept locally and loaded later with replay-spool
+    spool = ResultSpool(spool_file) if spool_file else None
+
+    # Optional background writer: scrapers queue pages, writer threads save them in batches
+    result_writer = None
+    persisted_stats = empty_results()
+    persisted_lock = threading.Lock()
+
+    def on_persisted(result: ScrapeResult, results: dict[str, Any]) -> None:
+        metrics.record_results(results)
+        if is_job_completed(results):
+            journal.mark_done(result)
+        with persisted_lock:
+            accumulate_results(persisted_stats, results)
+        if results.get("failed"):
+            logger.error(results["errors"][-1])
+
+    if settings.db_writer_threads > 0:
+        result_writer = ResultWriter(on_persisted=on_persisted, spool=spool)
+        result_writer.start()
+
+    # Prometheus textfile for node_exporter, rewritten during the run and at exit
+    exporter = None
+    if settings.metrics_textfile:
+        metrics.jobs_planned.set(len(jobs))
+        metrics.run_start_time.set(time.time())
+        metrics.live_browsers.set_function(DriverFactory.live_driver_count)
+        if result_writer is not None:
+            metrics.writer_queue_depth.set_function(lambda: result_writer.pending)
+        add_listener(metrics.observe_stage)
+        exporter = TextfileExporter(settings.metrics_textfile)
+        exporter.start()
 
-                if results.get("errors"):
-                    print(f"    ⚠️  Errors: {len(results['errors'])}")
-                    for error in results["errors"]:
-                        logger.error(f"      - {error}")
-
-            except Exception as e:
-                error_msg = f"Error processing date {checkin} for hotel {hotel_id}: {str(e)}"
-                logger.error(error_msg)
-                hotel_stats["errors"].append(error_msg)
-                print(f"    ❌ Error: {str(e)}")
-
-            finally:
-                # Close connection after each request
-                if conn:
-                    try:
-                        conn.close()
-                        logger.debug(f"Connection closed for date {checkin}")
-                    except Exception as e:
-                        logger.warning(f"Error closing connection: {e}")
-
-            # Random delay between requests
-            # Don't delay after last request of last hotel
-            if not (hotel_idx == len(hotels) and date_idx == len(dates)):
-                delay = random.randint(
-                    settings.scraping_delay_min, settings.scraping_delay_max
-                )
-                print(f"    ⏳ Waiting {delay} seconds before next request...")
-                time.sleep(delay)
-
-        # Hotel summary
-        print(f"\n  📊 Hotel summary {hotel_name}:")
-        print(f"     - Sessions created: {hotel_stats['sessions_created']}")
-        print(f"     - Sessions updated: {hotel_stats['sessions_updated']}")
-        print(f"     - Rooms created: {hotel_stats['room_availabilities_created']}")
-        print(f"     - Errors: {len(hotel_stats['errors'])}")
-
-        # Accumulate in global statistics
-        total_stats["hotels_processed"] += 1
-        total_stats["total_sessions_created"] += hotel_stats["sessions_created"]
-        total_stats["total_sessions_updated"] += hotel_stats["sessions_updated"]
-        total_stats["total_room_availabilities_created"] += hotel_stats[
-            "room_availabilities_created"
-        ]
-        total_stats["total_errors"].extend(hotel_stats["errors"])
+    try:
+        if args.workers > 1:
+            print(f"👷 Running {len(jobs)} jobs with {args.workers} concurrent workers")
+            run_concurrent(jobs, args.workers, total_stats, journal, result_writer, spool)
+        else:
+            run_sequential(jobs, proxy, total_stats, journal, result_writer, spool)
+    finally:
+        if result_writer is not None:
+            print(f"💾 Saving {result_writer.pending} queued results...")
+            result_writer.close()
+            merge_persisted_stats(total_stats, persisted_stats)
+        if exporter is not None:
+            exporter.stop()
+        # Failed jobs keep the run open so that --resume retries them
+        if all(journal.is_done(job) for job in jobs):
+            journal.finish()
+        else:
+            journal.close()
 
     # Final summary
     print("\n" + "=" * 80)
-    print("📈 FINAL SUMMARY")
+    print("📈 FINAL SUMMARY" + (f" (shard {shard})" if shard else ""))
     print("=" * 80)
     print(f"Hotels processed: {total_stats['hotels_processed']}")
     print(f"Total sessions created: {total_stats['total_sessions_created']}")
     print(f"Total sessions updated: {total_stats['total_sessions_updated']}")
     print(f"Total rooms created: {total_stats['total_room_availabilities_created']}")
+    print(f"Total rooms unchanged: {total_stats['total_room_availabilities_unchanged']}")
+    if total_stats["total_spooled"]:
+        print(
+            f"Total spooled: {total_stats['total_spooled']} "
+            f"(load them with: python -m src.main replay-spool)"
+        )
     print(f"Total errors: {len(total_stats['total_errors'])}")
 
+    shard_label = str(shard) if shard else None
+    logger.info(
+        "Run summary",
+        extra={
+            "event": "run_summary",
+            "shard": shard_label,
+            "hotels": len(hotels),
+            "jobs": len(jobs),
+            "sessions_created": total_stats["total_sessions_created"],
+            "sessions_updated": total_stats["total_sessions_updated"],
+            "room_availabilities_created": total_stats["total_room_availabilities_created"],
+            "spooled": total_stats["total_spooled"],
+            "errors": len(total_stats["total_errors"]),
+        },
+    )
+
+    stages = run_timings.summary()
+    print_stage_timings(stages)
+    logger.info(
+        "Run stage timings",
+        extra={"event": "run_timings", "shard": shard_label, "stages": stages},
+    )
+
     if total_stats["total_errors"]:
         print("\n⚠️  Errors found:")
         for error in total_stats["total_errors"][:10]:
@@ -308,14 +742,15 @@ def main() -> None:
         if len(total_stats["total_errors"]) > 10:
             print(f"  ... and {len(total_stats['total_errors']) - 10} more errors")
 
+    close_connection_pool()
+
     # Final cleanup of zombie processes and temp files
     logger.info("🧹 Final cleanup: removing Chrome/ChromeDriver zombie processes...")
     kill_chrome_processes()
-    cleanup_old_temp_dirs(max_age_hours=1)
+    cleanup_old_temp_dirs()
 
     print("\n✅ Process completed!")
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,135 @@
+"""Lightweight stage timing spans for scrape jobs and runs."""
+
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Durations of the job running in the current thread (set by job_timings())
+_current_job: ContextVar[dict[str, float] | None] = ContextVar("current_job", default=None)
+
+
+class StageTimings:
+    """Thread-safe collection of stage durations for a whole run."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collection."""
+        self._durations: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Record one duration of a stage."""
+        with self._lock:
+            self._durations.setdefault(stage, []).append(seconds)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per-stage statistics.
+
+        Returns:
+            Dictionary of stage -> {count, total, p50, p95, max} (seconds),
+            in the order stages were first recorded.
+        """
+        with self._lock:
+            snapshot = {stage: sorted(values) for stage, values in self._durations.items()}
+        return {
+            stage: {
+                "count": len(values),
+                "total": round(sum(values), 3),
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+                "max": round(values[-1], 3),
+            }
+            for stage, values in snapshot.items()
+            if values
+        }
+
+    def reset(self) -> None:
+        """Forget every recorded duration."""
+        with self._lock:
+            self._durations.clear()
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+# Process-wide run timings
+run_timings = StageTimings()
+
+# Callbacks receiving every recorded (stage, seconds), e.g. metrics exporters
+_listeners: list[Callable[[str, float], None]] = []
+
+
+def add_listener(callback: Callable[[str, float], None]) -> None:
+    """Call ``callback(stage, seconds)`` for every duration recorded from now on."""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_listener(callback: Callable[[str, float], None]) -> None:
+    """Stop calling a callback registered with add_listener()."""
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def record(stage: str, seconds: float) -> None:
+    """Record an already measured stage duration for the run and the current job."""
+    run_timings.add(stage, seconds)
+    job = _current_job.get()
+    if job is not None:
+        job[stage] = job.get(stage, 0.0) + seconds
+    for callback in _listeners:
+        callback(stage, seconds)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time the enclosed block as one occurrence of ``stage``.
+
+    The duration is recorded even if the block raises.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - started)
+
+
+def timed(stage: str) -> Callable[[F], F]:
+    """Decorator timing every call of a function as one occurrence of ``stage``."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def job_timings() -> Iterator[dict[str, float]]:
+    """Collect the stage durations of one job run in the current thread.
+
+    Yields:
+        Dictionary of stage -> seconds (repeated stages are summed), filled
+        while the block runs.
+    """
+    durations: dict[str, float] = {}
+    token = _current_job.set(durations)
+    try:
+        yield durations
+    finally:
+        _current_job.reset(token)
@@ -0,0 +1,129 @@
+"""Integration tests for the local Booking.com stand-in used by benchmark mode."""
+
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.booking_server import BookingStandInServer, ServerBehavior
+from benchmarks.throughput import build_benchmark_jobs
+from src.application.url_builder import build_booking_url
+from src.infrastructure.scraping.profile_template import template_warmup_url
+from src.infrastructure.scraping.room_table_parser import parse_room_table
+
+
+def _get(url: str) -> tuple[int, str]:
+    """Fetch a URL, returning (status, body) for error responses too."""
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status, response.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode("utf-8")
+
+
+@pytest.fixture
+def server() -> Iterator[BookingStandInServer]:
+    """Stand-in server without injected faults, used as the Booking.com base URL."""
+    with BookingStandInServer() as stand_in:
+        with patch("src.config.settings.settings.booking_base_url", stand_in.url):
+            yield stand_in
+
+
+class TestBookingStandInServer:
+    """Test cases for BookingStandInServer."""
+
+    def test_serves_hotel_page_for_built_url(self, server: BookingStandInServer) -> None:
+        """Test that a URL from build_booking_url gets a parseable corpus page."""
+        url = build_booking_url("large_es", "2026-01-10", "2026-01-11", currency="EUR")
+
+        status, html = _get(url)
+
+        assert url.startswith(server.url)
+        assert status == 200
+        assert parse_room_table(html) == parse_room_table(server.pages["large_es"])
+        path, query = server.requests[0]
+        assert path.endswith("/large_es.es.html")
+        assert query["selected_currency"] == "EUR"
+
+    def test_unknown_slug_gets_page_with_rooms(self, server: BookingStandInServer) -> None:
+        """Test that any hotel slug is answered with a page that has rooms."""
+        status, html = _get(build_booking_url("hotel-bristol", "2026-01-10", "2026-01-11"))
+
+        assert status == 200
+        assert parse_room_table(html)
+
+    def test_rejects_incomplete_query(self, server: BookingStandInServer) -> None:
+        """Test that a hotel page without the booking parameters is a bad request."""
+        status, _ = _get(f"{server.url}/hotel/ar/large_es.es.html?checkin=2026-01-10")
+
+        assert status == 400
+        assert server.stats == {"bad_request": 1}
+
+    def test_rejects_checkout_before_checkin(self, server: BookingStandInServer) -> None:
+        """Test that inverted dates are a bad request."""
+        status, body = _get(build_booking_url("large_es", "2026-01-11", "2026-01-10"))
+
+        assert status == 400
+        assert "checkout must be after checkin" in body
+
+    def test_home_page_has_consent_banner(self, server: BookingStandInServer) -> None:
+        """Test that the profile template warm-up URL shows the cookie banner."""
+        status, html = _get(template_warmup_url())
+
+        assert status == 200
+        assert 'id="onetrust-accept-btn-handler"' in html
+
+    def test_unknown_path_is_not_found(self, server: BookingStandInServer) -> None:
+        """Test that paths outside the Booking.com routes get a 404."""
+        status, _ = _get(f"{server.url}/searchresults.html")
+
+        assert status == 404
+
+
+class TestInjectedFaults:
+    """Test cases for the faults injected by ServerBehavior."""
+
+    def test_error_rate(self) -> None:
+        """Test that every page fails with an error rate of 1."""
+        with BookingStandInServer(ServerBehavior(error_rate=1.0, error_status=503)) as server:
+            status, _ = _get(f"{server.url}/hotel/ar/large_es.es.html?{_query()}")
+
+        assert status == 503
+        assert server.stats == {"error": 1}
+
+    def test_empty_table_rate(self) -> None:
+        """Test that the room table is emptied with an empty table rate of 1."""
+        with BookingStandInServer(ServerBehavior(empty_table_rate=1.0)) as server:
+            status, html = _get(f"{server.url}/hotel/ar/large_es.es.html?{_query()}")
+
+        assert status == 200
+        assert parse_room_table(html) == []
+
+    def test_subresources(self) -> None:
+        """Test that slow assets are added to the page and served."""
+        with BookingStandInServer(ServerBehavior(subresources=3)) as server:
+            _, html = _get(f"{server.url}/hotel/ar/small_es.es.html?{_query()}")
+            status, _ = _get(f"{server.url}/static/slow-1.js")
+
+        assert html.count("/static/slow-") == 3
+        assert status == 200
+        assert server.stats["static"] == 1
+
+
+class TestBenchmarkJobs:
+    """Test cases for the jobs scraped by the throughput benchmark."""
+
+    def test_jobs_cycle_slugs_and_dates(self) -> None:
+        """Test that jobs spread over the slugs before moving to the next date."""
+        jobs = build_benchmark_jobs(5, ["a", "b"])
+
+        assert [job.hotel_slug for job in jobs] == ["a", "b", "a", "b", "a"]
+        assert [job.checkin_date for job in jobs[:3]] == ["2030-01-01", "2030-01-01", "2030-01-02"]
+        assert len({job.key for job in jobs}) == 5
+
+
+def _query() -> str:
+    """Valid query string of a hotel page."""
+    return "checkin=2026-01-10&checkout=2026-01-11&group_adults=1&no_rooms=1&selected_currency=EUR"
@@ -0,0 +1,131 @@
+"""Integration tests for BrowserPool with mocked browsers."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.domain.exceptions import ScrapingError
+from src.infrastructure.scraping.browser_pool import BrowserPool
+
+
+def _fake_scraper(proxy: str | None = None) -> Mock:
+    """Build a healthy fake BookingScraper."""
+    scraper = Mock()
+    scraper.proxy = proxy
+    scraper.pages_scraped = 0
+    scraper.temp_dir = "/tmp/profile"
+    scraper.driver.execute_script.return_value = 1
+    return scraper
+
+
+@pytest.fixture
+def mock_scraper_class() -> Iterator[MagicMock]:
+    """Patch the BookingScraper started by the pool."""
+    with patch(
+        "src.infrastructure.scraping.browser_pool.BookingScraper", side_effect=_fake_scraper
+    ) as mock:
+        yield mock
+
+
+def _wait_background(pool: BrowserPool) -> None:
+    """Wait for the pool's background starts and recycles."""
+    for thread in list(pool._threads):
+        thread.join(timeout=5)
+
+
+class TestBrowserPool:
+    """Integration tests for BrowserPool."""
+
+    def test_start_prespawns_browsers(self, mock_scraper_class: MagicMock) -> None:
+        """Test that start() launches every browser and acquire() reuses them."""
+        pool = BrowserPool(size=3, proxy_provider=lambda: "http://proxy:8080", max_memory_mb=0)
+        pool.start()
+        _wait_background(pool)
+
+        scrapers = [pool.acquire() for _ in range(3)]
+
+        assert mock_scraper_class.call_count == 3
+        assert {scraper.proxy for scraper in scrapers} == {"http://proxy:8080"}
+        pool.close()
+
+    def test_acquire_is_bounded(self, mock_scraper_class: MagicMock) -> None:
+        """Test that no more than size browsers are handed out."""
+        pool = BrowserPool(size=1, max_memory_mb=0, acquire_timeout=0.1)
+        scraper = pool.acquire()
+
+        with pytest.raises(ScrapingError, match="No browser available"):
+            pool.acquire()
+
+        pool.release(scraper)
+        assert pool.acquire() is scraper
+        assert mock_scraper_class.call_count == 1
+        pool.close()
+
+    def test_recycles_after_page_limit_and_error(self, mock_scraper_class: MagicMock) -> None:
+        """Test that browsers are replaced after K pages or a failed scrape."""
+        pool = BrowserPool(size=1, max_pages=2, max_memory_mb=0)
+        first = pool.acquire()
+        first.pages_scraped = 2
+        pool.release(first)
+        _wait_background(pool)
+
+        first.close.assert_called_once()
+        second = pool.acquire()
+        assert second is not first
+
+        pool.release(second, failed=True)
+        _wait_background(pool)
+        second.close.assert_called_once()
+        assert pool.browsers_started == 3
+        pool.close()
+
+    def test_unhealthy_browser_is_replaced_on_checkout(self, mock_scraper_class: MagicMock) -> None:
+        """Test the health check done when a browser is borrowed."""
+        pool = BrowserPool(size=1, max_memory_mb=0)
+        crashed = pool.acquire()
+        pool.release(crashed)
+        crashed.driver.execute_script.side_effect = Exception("chrome not reachable")
+
+        replacement = pool.acquire()
+
+        assert replacement is not crashed
+        crashed.close.assert_called_once()
+        pool.close()
+
+    def test_gives_up_when_new_browsers_keep_failing_health_check(
+        self, mock_scraper_class: MagicMock
+    ) -> None:
+        """Test that acquire() raises instead of starting browsers forever."""
+
+        def broken_scraper(proxy: str | None = None) -> Mock:
+            scraper = _fake_scraper(proxy)
+            scraper.driver.execute_script.side_effect = Exception("renderer crashed")
+            return scraper
+
+        mock_scraper_class.side_effect = broken_scraper
+        pool = BrowserPool(size=1, max_memory_mb=0, acquire_timeout=60)
+
+        with pytest.raises(ScrapingError, match="failed the health check"):
+            pool.acquire()
+
+        assert mock_scraper_class.call_count == 2
+        assert pool._alive == 0
+        pool.close()
+
+    @patch(
+        "src.infrastructure.scraping.browser_pool.DriverFactory.get_browser_memory_mb",
+        return_value=2048.0,
+    )
+    def test_recycles_over_memory_threshold(
+        self, mock_memory: MagicMock, mock_scraper_class: MagicMock
+    ) -> None:
+        """Test that a browser over the memory limit is not reused."""
+        pool = BrowserPool(size=1, max_memory_mb=1500)
+        scraper = pool.acquire()
+        pool.release(scraper)
+        _wait_background(pool)
+
+        scraper.close.assert_called_once()
+        mock_memory.assert_called_once_with("/tmp/profile")
+        pool.close()
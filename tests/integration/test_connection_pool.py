@@ -0,0 +1,111 @@
+"""Integration tests for the connection pool with mocked MySQL connections."""
+
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.domain.exceptions import DatabaseConnectionError, DatabaseQueryError
+from src.infrastructure.database.connection import ConnectionPool
+
+
+def _pool(size: int = 2, **kwargs: float) -> ConnectionPool:
+    """Build a pool with dummy connection parameters."""
+    return ConnectionPool(size=size, connect_params={"host": "test"}, **kwargs)
+
+
+class TestConnectionPool:
+    """Test cases for ConnectionPool."""
+
+    @patch("src.infrastructure.database.connection.mysql.connector.connect")
+    def test_reuses_released_connections(self, mock_connect: MagicMock) -> None:
+        """Test that a released connection is handed out again."""
+        mock_connect.side_effect = lambda **params: Mock(in_transaction=False)
+        pool = _pool()
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert mock_connect.call_count == 1
+
+    @patch("src.infrastructure.database.connection.mysql.connector.connect")
+    def test_health_check_replaces_dead_connection(self, mock_connect: MagicMock) -> None:
+        """Test that a connection failing the ping is discarded on borrow."""
+        dead = Mock(in_transaction=False)
+        dead.ping.side_effect = Exception("gone away")
+        fresh = Mock(in_transaction=False)
+        mock_connect.side_effect = [dead, fresh]
+        pool = _pool(health_check_idle=0.0)
+
+        pool.release(pool.acquire())
+        conn = pool.acquire()
+
+        assert conn is fresh
+        dead.close.assert_called_once()
+
+    @patch("src.infrastructure.database.connection.mysql.connector.connect")
+    def test_rolls_back_pending_transaction_on_release(self, mock_connect: MagicMock) -> None:
+        """Test that pending transactions are not leaked to the next borrower."""
+        conn = Mock(in_transaction=True)
+        mock_connect.return_value = conn
+        pool = _pool()
+
+        pool.release(pool.acquire())
+
+        conn.rollback.assert_called_once()
+
+    @patch("src.infrastructure.database.connection.mysql.connector.connect")
+    def test_broken_connection_is_discarded(self, mock_connect: MagicMock) -> None:
+        """Test that a connection broken inside the block is not reused."""
+        conn = Mock(in_transaction=False)
+        conn.is_connected.return_value = False
+        mock_connect.side_effect = [conn, Mock(in_transaction=False)]
+        pool = _pool()
+
+        with pytest.raises(DatabaseQueryError):
+            with pool.connection():
+                raise DatabaseQueryError("Lost connection")
+
+        with pool.connection() as second:
+            assert second is not conn
+        conn.close.assert_called_once()
+
+    @patch("src.infrastructure.database.connection.mysql.connector.connect")
+    def test_exhausted_pool_times_out(self, mock_connect: MagicMock) -> None:
+        """Test that borrowing blocks and fails when every connection is in use."""
+        mock_connect.side_effect = lambda **params: Mock(in_transaction=False)
+        pool = _pool(size=1, timeout=0.05)
+
+        pool.acquire()
+        with pytest.raises(DatabaseConnectionError):
+            pool.acquire()
+
+    @patch("src.infrastructure.database.connection.mysql.connector.connect")
+    def test_concurrent_borrowers_never_exceed_size(self, mock_connect: MagicMock) -> None:
+        """Test that concurrent workers share at most `size` connections."""
+        mock_connect.side_effect = lambda **params: Mock(in_transaction=False)
+        pool = _pool(size=2)
+        in_use: list[int] = []
+        peak: list[int] = [0]
+        lock = threading.Lock()
+
+        def borrow() -> None:
+            for _ in range(20):
+                with pool.connection():
+                    with lock:
+                        in_use.append(1)
+                        peak[0] = max(peak[0], len(in_use))
+                    with lock:
+                        in_use.pop()
+
+        threads = [threading.Thread(target=borrow) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak[0] <= 2
+        assert mock_connect.call_count <= 2
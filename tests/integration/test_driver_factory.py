@@ -0,0 +1,225 @@
+"""Integration tests for DriverFactory with mocked Chrome."""
+
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.domain.exceptions import ScrapingError
+from src.infrastructure.scraping.driver_factory import DriverFactory
+from src.infrastructure.scraping.profile_template import default_profile_root
+
+
+@pytest.fixture(autouse=True)
+def reset_factory_state() -> Iterator[None]:
+    """Forget the memoized chromedriver path and profile store around each test."""
+    DriverFactory._chromedriver_path = None
+    DriverFactory._profile_store = None
+    DriverFactory._template_failed = False
+    yield
+    DriverFactory._chromedriver_path = None
+    DriverFactory._profile_store = None
+    DriverFactory._template_failed = False
+
+
+@pytest.fixture
+def mock_settings(tmp_path: Path) -> Iterator[MagicMock]:
+    """Patch the settings used by DriverFactory."""
+    with patch("src.infrastructure.scraping.driver_factory.settings") as mock:
+        mock.chromedriver_path = ""
+        mock.chrome_profile_template = False
+        mock.chrome_profile_template_max_age_hours = 24
+        mock.chrome_profile_root = str(tmp_path / "profiles")
+        mock.chrome_page_load_strategy = "eager"
+        mock.scraping_timeout = 30
+        mock.chrome_script_timeout = 10
+        mock.chrome_block_profile = "off"
+        mock.chrome_block_extra_patterns = ""
+        mock.chrome_network_usage = False
+        mock.headless_mode = True
+        mock.chrome_user_agent = "test-agent"
+        yield mock
+
+
+class TestDriverFactory:
+    """Integration tests for DriverFactory.create_driver."""
+
+    @patch("src.infrastructure.scraping.driver_factory.ChromeDriverManager")
+    @patch("src.infrastructure.scraping.driver_factory.Service")
+    @patch("src.infrastructure.scraping.driver_factory.webdriver.Chrome")
+    def test_applies_page_load_strategy_and_timeouts(
+        self,
+        mock_chrome: MagicMock,
+        mock_service: MagicMock,
+        mock_manager: MagicMock,
+        mock_settings: MagicMock,
+    ) -> None:
+        """Test that the load strategy and driver timeouts come from settings."""
+        mock_chrome.return_value = Mock()
+        mock_manager.return_value.install.return_value = "/usr/bin/chromedriver"
+
+        driver, temp_dir, _ = DriverFactory.create_driver()
+
+        try:
+            options = mock_chrome.call_args.kwargs["options"]
+            assert options.page_load_strategy == "eager"
+            driver.set_page_load_timeout.assert_called_once_with(30)
+            driver.set_script_timeout.assert_called_once_with(10)
+            driver.execute_cdp_cmd.assert_not_called()
+        finally:
+            DriverFactory.cleanup_driver(None, None, temp_dir)
+
+    def test_performance_log_is_opt_in(self, mock_settings: MagicMock) -> None:
+        """Test that only Network events are logged, and only when asked for."""
+        mock_settings.chrome_network_usage = False
+        options, _ = DriverFactory._build_options(None, "/tmp/profile")
+        assert "goog:loggingPrefs" not in options.to_capabilities()
+
+        mock_settings.chrome_network_usage = True
+        options, _ = DriverFactory._build_options(None, "/tmp/profile")
+        capabilities = options.to_capabilities()
+        assert capabilities["goog:loggingPrefs"] == {"performance": "ALL"}
+        assert capabilities["goog:chromeOptions"]["perfLoggingPrefs"] == {
+            "enableNetwork": True,
+            "enablePage": False,
+        }
+
+    @patch("src.infrastructure.scraping.driver_factory.os.path.exists", return_value=True)
+    @patch("src.infrastructure.scraping.driver_factory.ChromeDriverManager")
+    def test_chromedriver_resolved_once_per_process(
+        self, mock_manager: MagicMock, mock_exists: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        """Test that ChromeDriverManager is only asked the first time."""
+        mock_manager.return_value.install.return_value = "/cache/chromedriver"
+
+        paths = {DriverFactory.resolve_chromedriver_path() for _ in range(3)}
+
+        assert paths == {"/cache/chromedriver"}
+        mock_manager.return_value.install.assert_called_once()
+
+    @patch("src.infrastructure.scraping.driver_factory.os.access", return_value=True)
+    @patch("src.infrastructure.scraping.driver_factory.ChromeDriverManager")
+    def test_explicit_chromedriver_path_skips_manager(
+        self, mock_manager: MagicMock, mock_access: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        """Test that settings.chromedriver_path is used without network lookups."""
+        mock_settings.chromedriver_path = "/opt/chromedriver"
+
+        assert DriverFactory.resolve_chromedriver_path() == "/opt/chromedriver"
+        mock_manager.assert_not_called()
+
+    @patch("src.infrastructure.scraping.driver_factory.shutil.which", return_value=None)
+    @patch("src.infrastructure.scraping.driver_factory.ChromeDriverManager")
+    def test_offline_without_chromedriver_raises(
+        self, mock_manager: MagicMock, mock_which: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        """Test the error when the manager fails and no chromedriver is on PATH."""
+        mock_manager.return_value.install.side_effect = ConnectionError("offline")
+
+        with pytest.raises(ScrapingError, match="offline"):
+            DriverFactory.resolve_chromedriver_path()
+
+
+class TestProfileTemplate:
+    """Integration tests for the cloned Chrome profile template."""
+
+    @patch("src.infrastructure.scraping.driver_factory.warm_up_profile", return_value=True)
+    @patch("src.infrastructure.scraping.driver_factory.ChromeDriverManager")
+    @patch("src.infrastructure.scraping.driver_factory.Service")
+    @patch("src.infrastructure.scraping.driver_factory.webdriver.Chrome")
+    def test_drivers_get_clones_of_one_template(
+        self,
+        mock_chrome: MagicMock,
+        mock_service: MagicMock,
+        mock_manager: MagicMock,
+        mock_warm_up: MagicMock,
+        mock_settings: MagicMock,
+    ) -> None:
+        """Test that the template is built once and cloned for each driver."""
+        mock_settings.chrome_profile_template = True
+        store = DriverFactory.get_profile_store()
+
+        def fake_chrome(service: object, options: Mock) -> Mock:
+            # Chrome writing into the template profile while it is prepared
+            [user_data_dir] = [
+                Path(arg.split("=", 1)[1])
+                for arg in options.arguments
+                if arg.startswith("--user-data-dir=")
+            ]
+            if user_data_dir.parent == store.builds_dir:
+                (user_data_dir / "Default").mkdir(exist_ok=True)
+                (user_data_dir / "Default" / "Cookies").write_text("consent")
+                (user_data_dir / "SingletonLock").write_text("")
+            return Mock()
+
+        mock_chrome.side_effect = fake_chrome
+
+        _, first_dir, _ = DriverFactory.create_driver()
+        _, second_dir, _ = DriverFactory.create_driver()
+
+        mock_warm_up.assert_called_once()
+        assert first_dir != second_dir
+        for profile_dir in (first_dir, second_dir):
+            assert Path(profile_dir, "Default", "Cookies").read_text() == "consent"
+            assert not Path(profile_dir, "SingletonLock").exists()
+            assert profile_dir in DriverFactory._profile_dirs
+        assert list(store.builds_dir.iterdir()) == []
+
+        DriverFactory.cleanup_driver(None, None, first_dir)
+        assert not Path(first_dir).exists()
+        assert first_dir not in DriverFactory._profile_dirs
+        DriverFactory.cleanup_driver(None, None, second_dir)
+
+    def test_cleanup_untracks_profile_already_removed(self, mock_settings: MagicMock) -> None:
+        """Test that a driver whose profile is already gone stops being counted."""
+        store = DriverFactory.get_profile_store()
+        profile_dir = store.new_profile(from_template=False)
+        with DriverFactory._profile_lock:
+            DriverFactory._profile_dirs.add(profile_dir)
+        count = DriverFactory.live_driver_count()
+        Path(profile_dir).rmdir()
+
+        DriverFactory.cleanup_driver(None, None, profile_dir)
+
+        assert profile_dir not in DriverFactory._profile_dirs
+        assert DriverFactory.live_driver_count() == count - 1
+
+    def test_template_published_by_another_process_is_replaced(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that a finished build replaces the template atomically."""
+        store = DriverFactory.get_profile_store()
+        first = store.new_template_build()
+        second = store.new_template_build()
+        (first / "first").write_text("")
+        (second / "second").write_text("")
+
+        store.finish_template(first)
+        store.finish_template(second)
+
+        assert store.template_ready(max_age_hours=1)
+        assert (store.template_dir / "second").exists()
+        assert not (store.template_dir / "first").exists()
+        assert list(store.builds_dir.iterdir()) == []
+
+    def test_default_profile_root_is_not_tmpfs(self) -> None:
+        """Test that profiles go to the system temp dir unless configured."""
+        assert default_profile_root() == Path(tempfile.gettempdir()) / "bookeando-chrome"
+
+    def test_cleanup_stale_keeps_profiles_of_running_processes(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that only clones and template builds of dead processes are removed."""
+        store = DriverFactory.get_profile_store()
+        own = Path(store.new_profile(from_template=False))
+        stale = store.clones_dir / "999999999-deadbeef"
+        stale.mkdir()
+        stale_build = store.builds_dir / "999999999-cafebabe"
+        stale_build.mkdir(parents=True)
+
+        assert DriverFactory.cleanup_stale_profiles() == 2
+        assert own.exists()
+        assert not stale.exists()
+        assert not stale_build.exists()
@@ -5,10 +5,11 @@ from unittest.mock import MagicMock, Mock
 import pytest
 
 from src.domain.exceptions import DatabaseQueryError
-from src.domain.models import Hotel, ScrapeSession
+from src.domain.models import Hotel, RoomAvailability, ScrapeSession
 from src.infrastructure.database.repositories import (
     HotelRepository,
     RoomRepository,
+    SchemaRepository,
     ScrapeSessionRepository,
 )
 
@@ -79,6 +80,64 @@ class TestHotelRepository:
         assert proxy is None
 
 
+class TestSchemaRepository:
+    """Test cases for SchemaRepository."""
+
+    def test_has_unique_key(self) -> None:
+        """Test matching a unique key by its columns in any order."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            ("PRIMARY", "id"),
+            ("uniq_scrape_sessions_hotel_dates", "hotel_id"),
+            ("uniq_scrape_sessions_hotel_dates", "checkin_date"),
+            ("uniq_scrape_sessions_hotel_dates", "checkout_date"),
+        ]
+
+        repo = SchemaRepository(mock_conn)
+
+        assert repo.has_unique_key("scrape_sessions", ("checkout_date", "hotel_id", "checkin_date"))
+        assert not repo.has_unique_key("scrape_sessions", ("hotel_id", "checkin_date"))
+
+    def test_has_unique_key_missing(self) -> None:
+        """Test a table with only its primary key (before migrations/001)."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [("PRIMARY", "id")]
+
+        repo = SchemaRepository(mock_conn)
+
+        assert not repo.has_unique_key(
+            "scrape_sessions", ("hotel_id", "checkin_date", "checkout_date")
+        )
+
+    def test_has_column(self) -> None:
+        """Test checking a column."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (0,)
+
+        repo = SchemaRepository(mock_conn)
+
+        assert not repo.has_column("room_availabilities", "content_hash")
+        assert mock_cursor.execute.call_args[0][1] == ("room_availabilities", "content_hash")
+
+    def test_has_nullable_column(self) -> None:
+        """Test checking that a column accepts NULL."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (1,)
+
+        repo = SchemaRepository(mock_conn)
+
+        assert repo.has_column("room_availabilities", "final_price", nullable=True)
+        assert "IS_NULLABLE = 'YES'" in mock_cursor.execute.call_args[0][0]
+
+
 class TestRoomRepository:
     """Test cases for RoomRepository."""
 
@@ -159,3 +218,218 @@ class TestScrapeSessionRepository:
         assert session_id == 20
         mock_conn.commit.assert_called()
 
+    def test_has_newer_capture(self) -> None:
+        """Test that the stored capture is compared with the session's capture_date."""
+        from datetime import datetime
+
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (1,)
+
+        session = ScrapeSession(
+            hotel_id=1,
+            checkin_date="2024-01-01",
+            checkout_date="2024-01-02",
+            capture_date=datetime(2024, 1, 1, 8, 0, 0),
+            url_requested="https://booking.com/hotel/test",
+        )
+
+        repo = ScrapeSessionRepository(mock_conn)
+
+        assert repo.has_newer_capture(session)
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "capture_date >= %s" in sql
+        assert params == (1, "2024-01-01", "2024-01-02", "2024-01-01 08:00:00")
+
+    def test_upsert_creates_session(self) -> None:
+        """Test that upsert reports a created session in one statement."""
+        from datetime import datetime
+
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.rowcount = 1
+        mock_cursor.lastrowid = 30
+
+        session = ScrapeSession(
+            hotel_id=1,
+            checkin_date="2024-01-01",
+            checkout_date="2024-01-02",
+            capture_date=datetime.now(),
+            url_requested="https://booking.com/hotel/test",
+            room_types_found=4,
+        )
+
+        repo = ScrapeSessionRepository(mock_conn)
+        session_id, created = repo.upsert(session, {})
+
+        assert (session_id, created) == (30, True)
+        mock_cursor.execute.assert_called_once()
+        sql = mock_cursor.execute.call_args[0][0]
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert "LAST_INSERT_ID(id)" in sql
+        mock_conn.commit.assert_called_once()
+
+    def test_upsert_updates_existing_session(self) -> None:
+        """Test that upsert reports an updated session (affected rows = 2)."""
+        from datetime import datetime
+
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.rowcount = 2
+        mock_cursor.lastrowid = 15
+
+        session = ScrapeSession(
+            hotel_id=1,
+            checkin_date="2024-01-01",
+            checkout_date="2024-01-02",
+            capture_date=datetime.now(),
+            url_requested="https://booking.com/hotel/test",
+        )
+
+        repo = ScrapeSessionRepository(mock_conn)
+
+        assert repo.upsert(session, {}) == (15, False)
+
+    def test_upsert_without_session_id_raises(self) -> None:
+        """Test that a missing session ID is an error instead of None."""
+        from datetime import datetime
+
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.rowcount = 1
+        mock_cursor.lastrowid = None
+
+        session = ScrapeSession(
+            hotel_id=1,
+            checkin_date="2024-01-01",
+            checkout_date="2024-01-02",
+            capture_date=datetime.now(),
+            url_requested="https://booking.com/hotel/test",
+        )
+
+        repo = ScrapeSessionRepository(mock_conn)
+
+        with pytest.raises(DatabaseQueryError, match="no session ID"):
+            repo.upsert(session, {})
+        mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
+
+    def test_create_room_availabilities_bulk(self) -> None:
+        """Test that all rows are written with one INSERT and one commit."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+
+        rows = [
+            RoomAvailability(
+                room_type_id=room_type_id,
+                room_type_name=f"Room {room_type_id}",
+                base_price=100.0,
+                final_price=90.0,
+                availability=2,
+                non_refundable=room_type_id == 2,
+            )
+            for room_type_id in (1, 2, 3)
+        ]
+
+        repo = ScrapeSessionRepository(mock_conn)
+        created = repo.create_room_availabilities_bulk(20, rows)
+
+        assert created == 3
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args[0]
+        assert sql.count("(%s, %s, %s, %s, %s, %s, %s, %s, %s)") == 3
+        assert len(params) == 27
+        assert params[1] == 1 and params[10] == 2 and params[6] == 0 and params[15] == 1
+        mock_conn.commit.assert_called_once()
+
+    def test_create_room_availabilities_bulk_with_content_hashes(self) -> None:
+        """Test that snapshot hashes are stored per room type."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        row = RoomAvailability(
+            room_type_id=4, room_type_name="Room", base_price=0.0, final_price=1.0, availability=1
+        )
+
+        repo = ScrapeSessionRepository(mock_conn)
+        repo.create_room_availabilities_bulk(20, [row], content_hashes={4: "0123456789abcdef"})
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "content_hash" in sql
+        assert len(params) == 10
+        assert params[-1] == "0123456789abcdef"
+
+    def test_touch_room_availabilities(self) -> None:
+        """Test that unchanged snapshots only get updated_at bumped."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_cursor.rowcount = 3
+        mock_conn.cursor.return_value = mock_cursor
+
+        repo = ScrapeSessionRepository(mock_conn)
+        touched = repo.touch_room_availabilities(20, {1: "aaaa", 2: "bbbb"})
+
+        assert touched == 3
+        sql, params = mock_cursor.execute.call_args[0]
+        assert sql.startswith("UPDATE room_availabilities ra")
+        assert params[0] == 20
+        assert params[2] == 20
+        assert params[3:] == (1, "aaaa", 2, "bbbb")
+        mock_conn.commit.assert_called_once()
+        assert repo.touch_room_availabilities(20, {}) == 0
+
+    def test_touch_room_availabilities_multi_row_room_type(self) -> None:
+        """Test that every row of the last snapshot of a room type is touched."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_cursor.rowcount = 3  # Three offers of the same room type
+        mock_conn.cursor.return_value = mock_cursor
+
+        repo = ScrapeSessionRepository(mock_conn)
+        touched = repo.touch_room_availabilities(20, {1: "aaaa"})
+
+        assert touched == 3
+        sql = " ".join(mock_cursor.execute.call_args[0][0].split())
+        # The snapshot is every row sharing the created_at of the latest row,
+        # not only the latest row itself
+        assert "MAX(id) AS last_id" in sql
+        assert "latest ON latest.last_id = last_row.id" in sql
+        assert "snapshot.created_at = ra.created_at" in sql
+        assert "latest.last_id = ra.id" not in sql
+
+    def test_create_room_availabilities_bulk_empty(self) -> None:
+        """Test that an empty list does not touch the database."""
+        mock_conn = Mock()
+
+        repo = ScrapeSessionRepository(mock_conn)
+
+        assert repo.create_room_availabilities_bulk(20, []) == 0
+        mock_conn.cursor.assert_not_called()
+
+    def test_create_room_availabilities_bulk_error(self) -> None:
+        """Test that a failed bulk insert is rolled back."""
+        import mysql.connector
+
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.execute.side_effect = mysql.connector.Error("Database error")
+
+        repo = ScrapeSessionRepository(mock_conn)
+        row = RoomAvailability(
+            room_type_id=1,
+            room_type_name="Room",
+            base_price=0.0,
+            final_price=1.0,
+            availability=None,
+        )
+
+        with pytest.raises(DatabaseQueryError):
+            repo.create_room_availabilities_bulk(20, [row])
+        mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
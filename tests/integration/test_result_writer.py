@@ -0,0 +1,217 @@
+"""Integration tests for the background result writer with a mocked database."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.application.persist_results import ResultPersister
+from src.application.result_writer import ResultWriter
+from src.domain.exceptions import DatabaseConnectionError, DatabaseQueryError
+from src.domain.models import RoomAvailability, ScrapeResult, ScrapeSession
+
+
+def _make_result(day: int) -> ScrapeResult:
+    """Build a scrape result for testing."""
+    session = ScrapeSession(
+        hotel_id=1,
+        checkin_date=f"2024-01-{day:02d}",
+        checkout_date=f"2024-01-{day + 1:02d}",
+        capture_date=datetime(2024, 1, 1, 12, 0),
+        url_requested="https://www.booking.com/hotel/test.html",
+        adults=1,
+        children=0,
+        currency="EUR",
+        success=True,
+    )
+    room = RoomAvailability(
+        room_type_id=0,
+        room_type_name="Double Room",
+        base_price=100.0,
+        final_price=90.0,
+        availability=2,
+    )
+    return ScrapeResult(session=session, request_params={}, room_availabilities=[room])
+
+
+@contextmanager
+def _fake_db_connection() -> Iterator[Mock]:
+    """Stand-in for the pooled db_connection() context manager."""
+    yield Mock()
+
+
+@pytest.fixture
+def mock_db() -> Iterator[None]:
+    """Patch the connection pool used by the writer."""
+    with patch("src.application.result_writer.db_connection", _fake_db_connection):
+        yield
+
+
+class TestResultWriter:
+    """Integration tests for ResultWriter."""
+
+    def test_close_drains_queue_in_batches(self, mock_db: None) -> None:
+        """Test that every submitted result is saved, in batches, before close() returns."""
+        saved: list[dict[str, Any]] = []
+        batch_sizes: list[int] = []
+
+        def persist_batch(batch: list[ScrapeResult]) -> list[dict[str, Any]]:
+            batch_sizes.append(len(batch))
+            return [{"sessions_created": 1, "errors": []} for _ in batch]
+
+        with patch("src.application.result_writer.ResultPersister") as mock_persister:
+            mock_persister.return_value.persist_batch.side_effect = persist_batch
+            writer = ResultWriter(
+                threads=1,
+                queue_size=10,
+                batch_size=4,
+                on_persisted=lambda result, results: saved.append(results),
+            )
+            for day in range(1, 11):
+                writer.submit(_make_result(day))
+            writer.start()
+            writer.close()
+
+        assert len(saved) == 10
+        assert sum(batch_sizes) == 10
+        assert max(batch_sizes) <= 4
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.submit(_make_result(1))
+
+    def test_submit_blocks_while_queue_is_full(self, mock_db: None) -> None:
+        """Test the backpressure applied to scrapers when the writer falls behind."""
+        release = threading.Event()
+
+        def slow_persist_batch(batch: list[ScrapeResult]) -> list[dict[str, Any]]:
+            release.wait(5)
+            return [{"errors": []} for _ in batch]
+
+        with patch("src.application.result_writer.ResultPersister") as mock_persister:
+            mock_persister.return_value.persist_batch.side_effect = slow_persist_batch
+            writer = ResultWriter(threads=1, queue_size=1, batch_size=1)
+            writer.start()
+            writer.submit(_make_result(1))  # Taken by the writer thread
+            writer.submit(_make_result(2))  # Fills the queue, unless not yet taken
+
+            producer = threading.Thread(target=writer.submit, args=(_make_result(3),))
+            producer.start()
+            producer.join(timeout=0.3)
+            assert producer.is_alive()
+
+            release.set()
+            producer.join(timeout=5)
+            assert not producer.is_alive()
+            writer.close()
+
+        assert mock_persister.return_value.persist_batch.call_count == 3
+
+    def test_connection_failure_reports_failed_results(self) -> None:
+        """Test that results are reported as failed when no connection is available."""
+        outcomes: list[dict[str, Any]] = []
+
+        @contextmanager
+        def broken_connection() -> Iterator[Mock]:
+            raise DatabaseConnectionError("pool exhausted")
+            yield Mock()
+
+        with patch("src.application.result_writer.db_connection", broken_connection):
+            writer = ResultWriter(
+                threads=1,
+                queue_size=5,
+                batch_size=5,
+                on_persisted=lambda result, results: outcomes.append(results),
+            )
+            writer.start()
+            writer.submit(_make_result(1))
+            writer.close()
+
+        assert outcomes[0]["failed"] is True
+        assert "pool exhausted" in outcomes[0]["errors"][0]
+
+    def test_failed_results_are_spooled(self) -> None:
+        """Test that results that cannot be saved are handed to the spool."""
+        outcomes: list[dict[str, Any]] = []
+        spool = Mock()
+
+        @contextmanager
+        def broken_connection() -> Iterator[Mock]:
+            raise DatabaseConnectionError("Can't connect to MySQL server")
+            yield Mock()
+
+        with patch("src.application.result_writer.db_connection", broken_connection):
+            writer = ResultWriter(
+                threads=1,
+                on_persisted=lambda result, results: outcomes.append(results),
+                spool=spool,
+            )
+            writer.start()
+            writer.submit(_make_result(1))
+            writer.close()
+
+        spool.append.assert_called_once()
+        assert outcomes[0]["spooled"] is True
+        assert outcomes[0]["failed"] is False
+
+
+class TestResultPersister:
+    """Integration tests for ResultPersister.persist_batch."""
+
+    @pytest.fixture
+    def room_types(self) -> Mock:
+        """Room type cache resolving every name to ID 7."""
+        cache = Mock()
+        cache.resolve.return_value = {"double room": 7}
+        return cache
+
+    @patch("src.application.persist_results.settings")
+    @patch("src.application.persist_results.ScrapeSessionRepository")
+    def test_batch_is_committed_once(
+        self, mock_repo_class: MagicMock, mock_settings: Mock, room_types: Mock
+    ) -> None:
+        """Test that a batch is written in one transaction."""
+        mock_settings.db_session_upsert = True
+        mock_conn = Mock()
+        repo = mock_repo_class.return_value
+        repo.upsert.side_effect = [(1, True), (2, False)]
+        repo.create_room_availabilities_bulk.return_value = 1
+
+        persister = ResultPersister(mock_conn, room_types=room_types)
+        outcomes = persister.persist_batch([_make_result(1), _make_result(2)])
+
+        mock_repo_class.assert_called_with(mock_conn, autocommit=False)
+        mock_conn.commit.assert_called_once()
+        assert [o["sessions_created"] for o in outcomes] == [1, 0]
+        assert [o["sessions_updated"] for o in outcomes] == [0, 1]
+        saved_rows = repo.create_room_availabilities_bulk.call_args_list[0][0][1]
+        assert saved_rows[0].room_type_id == 7
+
+    @patch("src.application.persist_results.settings")
+    @patch("src.application.persist_results.ScrapeSessionRepository")
+    def test_failed_batch_falls_back_to_single_saves(
+        self, mock_repo_class: MagicMock, mock_settings: Mock, room_types: Mock
+    ) -> None:
+        """Test that a failing batch is rolled back and saved result by result."""
+        mock_settings.db_session_upsert = True
+        mock_conn = Mock()
+        repo = mock_repo_class.return_value
+        # Batch: first upsert fails. Fallback: first result fails again, second is saved.
+        repo.upsert.side_effect = [
+            DatabaseQueryError("deadlock"),
+            DatabaseQueryError("bad row"),
+            (2, True),
+        ]
+        repo.create_room_availabilities_bulk.return_value = 1
+
+        persister = ResultPersister(mock_conn, room_types=room_types)
+        outcomes = persister.persist_batch([_make_result(1), _make_result(2)])
+
+        mock_conn.rollback.assert_called_once()
+        mock_conn.commit.assert_not_called()
+        assert outcomes[0]["failed"] is True
+        assert "bad row" in outcomes[0]["errors"][0]
+        assert outcomes[1]["sessions_created"] == 1
+        assert not outcomes[1].get("failed")
@@ -0,0 +1,88 @@
+"""Integration tests for the room type cache with a mocked repository."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from src.infrastructure.database.repositories import RoomRepository
+from src.infrastructure.database.room_type_cache import RoomTypeCache
+
+
+class FakeRoomRepository:
+    """In-memory stand-in for RoomRepository."""
+
+    def __init__(self, rows: list[tuple[int, str]]) -> None:
+        self.rows = list(rows)
+        self.fetch_calls = 0
+        self.created: list[str] = []
+        self._lock = threading.Lock()
+
+    def fetch_by_hotel(self, hotel_id: int) -> dict[str, int]:
+        self.fetch_calls += 1
+        result: dict[str, int] = {}
+        for room_type_id, name in sorted(self.rows):
+            result.setdefault(name.strip().lower(), room_type_id)
+        return result
+
+    def create_many(self, hotel_id: int, room_names: list[str], description: str = "") -> None:
+        time.sleep(0.01)  # Widen the race window
+        with self._lock:
+            for name in room_names:
+                self.created.append(name)
+                self.rows.append((len(self.rows) + 100, name))
+
+
+class TestRoomTypeCache:
+    """Test cases for RoomTypeCache."""
+
+    def test_preloads_hotel_once(self) -> None:
+        """Test that known rooms are served from memory after one query."""
+        repo = FakeRoomRepository([(1, "Doble"), (2, "Suite")])
+        cache = RoomTypeCache()
+
+        first = cache.resolve(repo, 10, ["doble", "Suite "])
+        second = cache.resolve(repo, 10, ["DOBLE"])
+
+        assert first == {"doble": 1, "suite": 2}
+        assert second == {"doble": 1}
+        assert repo.fetch_calls == 1
+        assert repo.created == []
+
+    def test_creates_missing_names_in_one_batch(self) -> None:
+        """Test that missing rooms are inserted together and then resolved."""
+        repo = FakeRoomRepository([(1, "Doble")])
+        cache = RoomTypeCache()
+
+        result = cache.resolve(repo, 10, ["Doble", "Triple", "Cuádruple", "triple", ""])
+
+        assert repo.created == ["Triple", "Cuádruple"]
+        assert set(result) == {"doble", "triple", "cuádruple"}
+
+    def test_concurrent_workers_create_room_once(self) -> None:
+        """Test that simultaneous discoveries of a new room insert it only once."""
+        repo = FakeRoomRepository([])
+        cache = RoomTypeCache()
+        results: list[dict[str, int]] = []
+
+        def worker() -> None:
+            results.append(cache.resolve(repo, 10, ["Nueva Suite"]))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert repo.created == ["Nueva Suite"]
+        assert len({tuple(result.items()) for result in results}) == 1
+
+    def test_fetch_by_hotel_keeps_lowest_id(self) -> None:
+        """Test that duplicated names resolve to the lowest ID."""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [(3, "Doble"), (7, "doble "), (9, "Suite")]
+
+        result = RoomRepository(mock_conn).fetch_by_hotel(10)
+
+        assert result == {"doble": 3, "suite": 9}
@@ -1,11 +1,21 @@
 """Integration tests for scraping flow with mocks."""
 
+import logging
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from selenium.common.exceptions import TimeoutException
 
 from src.domain.models import RoomAvailability, ScrapedHotelData
 from src.infrastructure.scraping.booking_scraper import BookingScraper
+from src.infrastructure.scraping.room_table import (
+    NON_REFUNDABLE_MARKER,
+    ROOM_TABLE_SCRIPT,
+    ROW_FIELD_SELECTORS,
+    ROW_SELECTORS,
+    ROWS_READY_SCRIPT,
+    TABLE_SELECTOR,
+)
 
 
 class TestBookingScraperIntegration:
@@ -46,6 +56,7 @@ class TestBookingScraperIntegration:
             assert result.hotel_url == "https://www.booking.com/hotel/test.html"
             assert result.checkin_date == "2024-01-01"
             assert result.checkout_date == "2024-01-02"
+            assert not result.complete  # No room rows parsed
         finally:
             scraper.close()
 
@@ -115,3 +126,172 @@ class TestBookingScraperIntegration:
         with pytest.raises(ScrapingError):
             BookingScraper(proxy=None)
 
+
+    @patch("src.infrastructure.scraping.booking_scraper.DriverFactory.create_driver")
+    def test_scrape_hotel_continues_after_page_load_timeout(
+        self, mock_create_driver: MagicMock
+    ) -> None:
+        """Test that a page load timeout stops the load and extraction goes on."""
+        mock_driver = Mock()
+        mock_driver.page_source = "<html><body>Test</body></html>"
+        mock_driver.get.side_effect = TimeoutException("slow third-party assets")
+        mock_driver.find_elements.return_value = []
+        mock_driver.execute_script.side_effect = lambda script, *args: (
+            [1, 1000] if script == ROWS_READY_SCRIPT else None
+        )
+        mock_create_driver.return_value = (mock_driver, "/tmp/test", 9222)
+
+        scraper = BookingScraper(proxy=None)
+        try:
+            result = scraper.scrape_hotel(
+                hotel_url="https://www.booking.com/hotel/test.html",
+                checkin_date="2024-01-01",
+                checkout_date="2024-01-02",
+            )
+        finally:
+            scraper.close()
+
+        assert result.success
+        mock_driver.execute_script.assert_any_call("window.stop();")
+
+
+class TestScraperSession:
+    """Integration tests for ScraperSession browser reuse."""
+
+    @patch("src.infrastructure.scraping.booking_scraper.DriverFactory.cleanup_driver")
+    @patch("src.infrastructure.scraping.booking_scraper.DriverFactory.create_driver")
+    def test_reuses_browser_until_page_limit(
+        self, mock_create_driver: MagicMock, mock_cleanup: MagicMock
+    ) -> None:
+        """Test that one browser serves several pages and is recycled at the limit."""
+        from src.infrastructure.scraping.scraper_session import ScraperSession
+
+        mock_create_driver.side_effect = lambda proxy=None: (Mock(), "/tmp/test", 9222)
+
+        session = ScraperSession(max_pages=2)
+        first = session.acquire()
+        first.pages_scraped = 1
+        session.release(first)
+        assert session.acquire() is first
+
+        first.pages_scraped = 2
+        session.release(first)
+        second = session.acquire()
+
+        assert second is not first
+        assert mock_create_driver.call_count == 2
+        session.close()
+
+    @patch("src.infrastructure.scraping.booking_scraper.DriverFactory.cleanup_driver")
+    @patch("src.infrastructure.scraping.booking_scraper.DriverFactory.create_driver")
+    def test_recycles_browser_after_error(
+        self, mock_create_driver: MagicMock, mock_cleanup: MagicMock
+    ) -> None:
+        """Test that a failed scrape closes the browser."""
+        from src.infrastructure.scraping.scraper_session import ScraperSession
+
+        mock_create_driver.side_effect = lambda proxy=None: (Mock(), "/tmp/test", 9222)
+
+        session = ScraperSession(max_pages=10)
+        scraper = session.acquire()
+        session.release(scraper, failed=True)
+
+        assert scraper.driver is None
+        assert session.acquire() is not scraper
+        session.close()
+
+
+class TestScriptExtraction:
+    """Integration tests for the single round-trip extraction mode."""
+
+    @patch("src.infrastructure.scraping.booking_scraper.settings")
+    @patch("src.infrastructure.scraping.booking_scraper.DriverFactory.create_driver")
+    def test_scrape_hotel_uses_one_script_call(
+        self,
+        mock_create_driver: MagicMock,
+        mock_settings: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that rows come from execute_script and not from per-row lookups."""
+        mock_settings.scraper_extraction_mode = "script"
+        mock_settings.booking_currency = "EUR"
+        mock_settings.scraper_ready_max_wait = 5.0
+        mock_settings.scraper_ready_stable_ms = 500
+        mock_settings.scraper_ready_poll_ms = 100
+
+        mock_driver = Mock()
+        mock_driver.page_source = "<html><body>Test</body></html>"
+        payload = [
+            {
+                "row_class": "js-rt-block-row",
+                "data_block_id": "1",
+                "html_length": 300,
+                "non_refundable": False,
+                "room_type": "Deluxe Room",
+                "base_price": "€100",
+                "final_price": "€90",
+            }
+        ]
+        mock_driver.execute_script.side_effect = lambda script, *args: (
+            [1, 1000] if script == ROWS_READY_SCRIPT else payload
+        )
+        mock_create_driver.return_value = (mock_driver, "/tmp/test", 9222)
+
+        scraper = BookingScraper(proxy=None)
+        try:
+            with caplog.at_level(logging.INFO):
+                result = scraper.scrape_hotel(
+                    hotel_url="https://www.booking.com/hotel/test.html",
+                    checkin_date="2024-01-01",
+                    checkout_date="2024-01-02",
+                )
+        finally:
+            scraper.close()
+
+        assert result.success
+        summaries = [r for r in caplog.records if getattr(r, "event", None) == "scrape_summary"]
+        assert len(summaries) == 1
+        assert summaries[0].rows_found == 1
+        assert summaries[0].rows_kept == 1
+        assert set(summaries[0].timings) == {"navigate", "wait", "extract", "total"}
+        assert [r for r in caplog.records if r.levelno == logging.INFO] == summaries
+        assert [room.room_type_name for room in result.room_availabilities] == ["Deluxe Room"]
+        assert result.room_availabilities[0].final_price == 90.0
+        assert result.wait_seconds < 5.0
+        mock_driver.find_elements.assert_not_called()
+        mock_driver.execute_script.assert_any_call(
+            ROOM_TABLE_SCRIPT, ROW_SELECTORS, ROW_FIELD_SELECTORS, NON_REFUNDABLE_MARKER
+        )
+
+
+class TestRowsReadyWait:
+    """Integration tests for the rows readiness wait."""
+
+    @patch("src.infrastructure.scraping.booking_scraper.settings")
+    @patch("src.infrastructure.scraping.booking_scraper.DriverFactory.create_driver")
+    def test_fallback_only_page_is_ready_before_the_cap(
+        self, mock_create_driver: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        """Test that rows matched only by a fallback selector end the wait."""
+        mock_settings.scraper_ready_max_wait = 5.0
+        mock_settings.scraper_ready_stable_ms = 50
+        mock_settings.scraper_ready_poll_ms = 10
+
+        mock_driver = Mock()
+        # No readiness script result: rows are counted with find_elements
+        mock_driver.execute_script.return_value = None
+        mock_driver.find_elements.side_effect = lambda by, selector: (
+            [Mock(), Mock()] if selector == "tr[data-block-id]" else []
+        )
+        mock_create_driver.return_value = (mock_driver, "/tmp/test", 9222)
+
+        scraper = BookingScraper(proxy=None)
+        try:
+            waited = scraper._wait_for_rows_ready()
+        finally:
+            scraper.close()
+
+        assert waited < 1.0
+        mock_driver.execute_script.assert_any_call(
+            ROWS_READY_SCRIPT, TABLE_SELECTOR, ROW_SELECTORS
+        )
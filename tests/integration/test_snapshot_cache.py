@@ -0,0 +1,187 @@
+"""Integration tests for delta storage with a mocked repository."""
+
+from unittest.mock import Mock, patch
+
+from src.application.persist_results import ResultPersister
+from src.domain.models import RoomAvailability, ScrapeResult
+from src.infrastructure.database.repositories import ScrapeSessionRepository
+from src.infrastructure.database.snapshot_cache import (
+    UNAVAILABLE_HASH,
+    SnapshotCache,
+    content_hash,
+)
+
+
+def _row(room_type_id: int, final_price: float, non_refundable: bool = False) -> RoomAvailability:
+    """Build a resolved room availability for testing."""
+    return RoomAvailability(
+        room_type_id=room_type_id,
+        room_type_name=f"Room {room_type_id}",
+        base_price=120.0,
+        final_price=final_price,
+        availability=3,
+        non_refundable=non_refundable,
+    )
+
+
+class TestContentHash:
+    """Test cases for content_hash."""
+
+    def test_hash_ignores_row_order(self) -> None:
+        """Test that the same rows in another order give the same hash."""
+        rows = [_row(1, 100.0), _row(1, 90.0, non_refundable=True)]
+
+        assert content_hash(rows) == content_hash(list(reversed(rows)))
+        assert len(content_hash(rows)) == 16
+
+    def test_hash_changes_with_price(self) -> None:
+        """Test that a price change changes the hash."""
+        assert content_hash([_row(1, 100.0)]) != content_hash([_row(1, 101.0)])
+
+
+class TestSnapshotCache:
+    """Test cases for SnapshotCache."""
+
+    def test_first_capture_is_written_in_full(self) -> None:
+        """Test that every room type is inserted when nothing is stored yet."""
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {}
+        cache = SnapshotCache()
+
+        delta = cache.diff(repo, 10, [_row(1, 100.0), _row(2, 200.0)])
+
+        assert len(delta.rows_to_insert) == 2
+        assert delta.unchanged == {}
+        assert set(delta.content_hashes) == {1, 2}
+
+    def test_only_changed_room_types_are_written(self) -> None:
+        """Test that unchanged room types are skipped after the first capture."""
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {1: content_hash([_row(1, 100.0)])}
+        cache = SnapshotCache()
+
+        first = cache.diff(repo, 10, [_row(1, 100.0), _row(2, 200.0)])
+        cache.store(first)
+        second = cache.diff(repo, 10, [_row(1, 100.0), _row(2, 210.0)])
+
+        assert [row.room_type_id for row in first.rows_to_insert] == [2]
+        assert [row.room_type_id for row in second.rows_to_insert] == [2]
+        assert list(second.unchanged) == [1]
+        assert second.unchanged_rows == 1
+        repo.fetch_latest_content_hashes.assert_called_once_with(10)
+
+    def test_uncommitted_delta_is_not_remembered(self) -> None:
+        """Test that a delta not passed to store() does not hide rows."""
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {}
+        cache = SnapshotCache()
+
+        cache.diff(repo, 10, [_row(1, 100.0)])  # e.g. rolled back
+        delta = cache.diff(repo, 10, [_row(1, 100.0)])
+
+        assert len(delta.rows_to_insert) == 1
+
+    def test_room_type_that_disappears_is_recorded_unavailable(self) -> None:
+        """Test that a room type missing from the next run gets an unavailable row once."""
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {}
+        cache = SnapshotCache()
+
+        first = cache.diff(repo, 10, [_row(1, 100.0), _row(2, 200.0)], complete=True)
+        cache.store(first)
+        sold_out = cache.diff(repo, 10, [_row(1, 100.0)], complete=True)  # Room 2 sold out
+        cache.store(sold_out)
+        still_sold_out = cache.diff(repo, 10, [_row(1, 100.0)], complete=True)
+        cache.store(still_sold_out)
+        back = cache.diff(repo, 10, [_row(1, 100.0), _row(2, 200.0)], complete=True)
+
+        [tombstone] = sold_out.rows_to_insert
+        assert tombstone.room_type_id == 2
+        assert tombstone.availability == 0
+        assert tombstone.base_price is None and tombstone.final_price is None
+        assert sold_out.content_hashes[2] == UNAVAILABLE_HASH
+        assert sold_out.unavailable == [2]
+        assert still_sold_out.rows_to_insert == []
+        assert still_sold_out.unchanged == {1: first.content_hashes[1], 2: UNAVAILABLE_HASH}
+        assert [row.room_type_id for row in back.rows_to_insert] == [2]
+        assert back.unavailable == []
+
+    def test_stored_room_type_missing_from_database_snapshot(self) -> None:
+        """Test a room type stored by an earlier process that is gone from the page."""
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {1: "a" * 16, 2: None}
+        cache = SnapshotCache()
+
+        delta = cache.diff(repo, 10, [_row(1, 100.0)], complete=True)
+
+        assert delta.unavailable == [2]
+
+    def test_incomplete_capture_marks_nothing_unavailable(self) -> None:
+        """Test that missing room types are kept when some rows could not be resolved."""
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {1: "a" * 16, 2: "b" * 16}
+        cache = SnapshotCache()
+
+        delta = cache.diff(repo, 10, [_row(1, 100.0)], complete=False)
+
+        assert delta.unavailable == []
+        assert set(delta.content_hashes) == {1}
+
+    def test_empty_capture_marks_nothing_unavailable(self) -> None:
+        """Test that a page without rooms is never taken as every room sold out."""
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {1: "a" * 16}
+        cache = SnapshotCache()
+
+        delta = cache.diff(repo, 10, [], complete=True)
+
+        assert delta.rows_to_insert == []
+        assert delta.unavailable == []
+
+
+class TestResultPersisterDelta:
+    """Test cases for ResultPersister with delta storage."""
+
+    @patch("src.application.persist_results.settings")
+    def test_persist_bumps_unchanged_rows(self, mock_settings: Mock) -> None:
+        """Test that unchanged room types are touched instead of inserted."""
+        mock_settings.db_delta_storage = True
+        cache = SnapshotCache()
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.fetch_latest_content_hashes.return_value = {1: content_hash([_row(1, 100.0)])}
+        repo.create_room_availabilities_bulk.return_value = 1
+        results: dict = {"room_availabilities_created": 0, "errors": []}
+
+        persister = ResultPersister(Mock(), room_types=Mock(), snapshots=cache)
+        delta = persister._write_rows(repo, 10, [_row(1, 100.0), _row(2, 200.0)], results)
+
+        rows, hashes = repo.create_room_availabilities_bulk.call_args[0][1:]
+        assert [row.room_type_id for row in rows] == [2]
+        assert set(hashes) == {1, 2}
+        repo.touch_room_availabilities.assert_called_once_with(10, {1: hashes[1]})
+        assert results["room_availabilities_created"] == 1
+        assert results["room_availabilities_unchanged"] == 1
+        assert delta is not None
+
+    @patch("src.application.persist_results.settings")
+    def test_empty_capture_leaves_stored_rows_unchanged(self, mock_settings: Mock) -> None:
+        """Test that a page whose room table was not found writes no rows."""
+        mock_settings.db_delta_storage = True
+        mock_settings.db_session_upsert = True
+        repo = Mock(spec=ScrapeSessionRepository)
+        repo.upsert.return_value = (10, False)
+        repo.fetch_latest_content_hashes.return_value = {1: "a" * 16, 2: "b" * 16}
+        repo.create_room_availabilities_bulk.return_value = 0
+        room_types = Mock()
+        room_types.resolve.return_value = {}
+        result = ScrapeResult(session=Mock(hotel_id=1), request_params={}, complete=False)
+
+        persister = ResultPersister(Mock(), room_types=room_types, snapshots=SnapshotCache())
+        persister.session_repo = repo
+        results = persister.persist(result)
+
+        rows = repo.create_room_availabilities_bulk.call_args[0][1]
+        assert rows == []
+        repo.touch_room_availabilities.assert_called_once_with(10, {})
+        assert results["room_availabilities_created"] == 0
+        assert results["errors"] == []
@@ -0,0 +1,198 @@
+"""Integration tests for the local result spool with a mocked database."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.application.persist_results import ResultPersister
+from src.application.spool import ResultSpool
+from src.domain.models import RoomAvailability, ScrapeResult, ScrapeSession
+
+
+def _make_result(day: int) -> ScrapeResult:
+    """Build a scrape result for testing."""
+    session = ScrapeSession(
+        hotel_id=1,
+        checkin_date=f"2024-01-{day:02d}",
+        checkout_date=f"2024-01-{day + 1:02d}",
+        capture_date=datetime(2024, 1, 1, 12, 30),
+        url_requested="https://www.booking.com/hotel/test.html",
+        currency="EUR",
+        success=True,
+        room_types_found=1,
+    )
+    room = RoomAvailability(
+        room_type_id=0,
+        room_type_name="Habitación Doble",
+        base_price=100.0,
+        final_price=90.0,
+        availability=None,
+        offer="Oferta",
+        non_refundable=True,
+    )
+    return ScrapeResult(
+        session=session,
+        request_params={"adults": 1, "extraction_mode": "daily"},
+        room_availabilities=[room],
+    )
+
+
+@contextmanager
+def _fake_db_connection() -> Iterator[Mock]:
+    """Stand-in for the pooled db_connection() context manager."""
+    yield Mock()
+
+
+@pytest.fixture
+def mock_persister() -> Iterator[MagicMock]:
+    """Patch the connection pool and persister used by replay()."""
+    with (
+        patch("src.application.spool.db_connection", _fake_db_connection),
+        patch("src.application.spool.ResultPersister") as mock,
+    ):
+        yield mock
+
+
+class TestResultSpool:
+    """Integration tests for ResultSpool."""
+
+    def test_append_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Test that spooled results are read back unchanged."""
+        spool = ResultSpool(tmp_path / "spool" / "results.jsonl")
+        results = [_make_result(1), _make_result(2)]
+        for result in results:
+            spool.append(result, error="MySQL server has gone away")
+
+        assert spool.load() == results
+
+    def test_load_skips_corrupt_lines(self, tmp_path: Path) -> None:
+        """Test that a line cut by a crash does not prevent reading the rest."""
+        spool = ResultSpool(tmp_path / "results.jsonl")
+        spool.append(_make_result(1))
+        with open(spool.path, "a", encoding="utf-8") as f:
+            f.write('{"spooled_at": "2024-01-01T12:00:00", "result": {"sess')
+
+        assert [result.key for result in spool.load()] == [(1, "2024-01-01", "2024-01-02")]
+
+    def test_replay_saves_results_and_empties_spool(
+        self, tmp_path: Path, mock_persister: MagicMock
+    ) -> None:
+        """Test that replayed results are saved in batches and removed from the spool."""
+        spool = ResultSpool(tmp_path / "results.jsonl")
+        for day in range(1, 4):
+            spool.append(_make_result(day))
+
+        def persist_batch(batch: list[ScrapeResult]) -> list[dict[str, Any]]:
+            return [
+                {"sessions_created": 1, "room_availabilities_created": 1, "errors": []}
+                for _ in batch
+            ]
+
+        mock_persister.return_value.persist_batch.side_effect = persist_batch
+        stats = spool.replay(batch_size=2)
+
+        assert stats["replayed"] == 3
+        assert stats["sessions_created"] == 3
+        assert mock_persister.return_value.persist_batch.call_count == 2
+        assert spool.load() == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_replay_keeps_results_that_fail_again(
+        self, tmp_path: Path, mock_persister: MagicMock
+    ) -> None:
+        """Test that results which still cannot be saved stay in the spool."""
+        spool = ResultSpool(tmp_path / "results.jsonl")
+        spool.append(_make_result(1))
+        spool.append(_make_result(2))
+
+        mock_persister.return_value.persist_batch.return_value = [
+            {"sessions_created": 1, "errors": []},
+            {"failed": True, "errors": ["Error saving date 2024-01-02 for hotel 1: timeout"]},
+        ]
+        stats = spool.replay()
+
+        assert stats["replayed"] == 1
+        assert stats["failed"] == 1
+        assert [result.key for result in spool.load()] == [(1, "2024-01-02", "2024-01-03")]
+
+    def test_replay_without_spool_file(self, tmp_path: Path, mock_persister: MagicMock) -> None:
+        """Test that replaying a missing spool does nothing."""
+        stats = ResultSpool(tmp_path / "results.jsonl").replay()
+
+        assert stats["replayed"] == 0
+        mock_persister.assert_not_called()
+
+    def test_replay_drains_leftover_and_current_spool(
+        self, tmp_path: Path, mock_persister: MagicMock
+    ) -> None:
+        """Test that an interrupted replay and the current spool are replayed in one call."""
+        spool = ResultSpool(tmp_path / "results.jsonl")
+        spool.append(_make_result(1))
+        spool.path.rename(tmp_path / "results.jsonl.replaying")  # Crashed replay
+        with open(tmp_path / "results.jsonl.replaying", "a", encoding="utf-8") as f:
+            f.write('{"spooled_at": "2024-01-01T12:00:00", "result": {"sess')  # Cut line
+        spool.append(_make_result(2))
+
+        mock_persister.return_value.persist_batch.side_effect = lambda batch: [
+            {"sessions_created": 1, "errors": []} for _ in batch
+        ]
+        stats = spool.replay()
+
+        [batch] = [call.args[0] for call in mock_persister.return_value.persist_batch.mock_calls]
+        assert [result.key[1] for result in batch] == ["2024-01-01", "2024-01-02"]
+        assert stats["replayed"] == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_replay_skips_stale_results(self, tmp_path: Path, mock_persister: MagicMock) -> None:
+        """Test that results older than the stored capture are not saved nor respooled."""
+        spool = ResultSpool(tmp_path / "results.jsonl")
+        spool.append(_make_result(1))
+        spool.append(_make_result(2))
+
+        mock_persister.return_value.persist_batch.return_value = [
+            {"stale": True, "errors": []},
+            {"sessions_updated": 1, "errors": []},
+        ]
+        stats = spool.replay()
+
+        assert mock_persister.call_args.kwargs["skip_stale"] is True
+        assert stats["stale"] == 1
+        assert stats["replayed"] == 1
+        assert spool.load() == []
+
+
+class TestStaleReplay:
+    """Integration tests for ResultPersister(skip_stale=True)."""
+
+    def test_persist_batch_skips_results_with_newer_stored_capture(self) -> None:
+        """Test that a stale result writes nothing while a fresh one is saved."""
+        mock_conn = Mock()
+        stale, fresh = _make_result(1), _make_result(2)
+        room_types = Mock()
+        room_types.resolve.return_value = {"habitación doble": 7}
+
+        with (
+            patch("src.application.persist_results.ScrapeSessionRepository") as repo_class,
+            patch("src.application.persist_results.settings") as mock_settings,
+        ):
+            mock_settings.db_session_upsert = True
+            mock_settings.db_delta_storage = False
+            repo = repo_class.return_value
+            repo.has_newer_capture.side_effect = lambda session: session is stale.session
+            repo.upsert.return_value = (40, False)
+            repo.create_room_availabilities_bulk.return_value = 1
+
+            persister = ResultPersister(mock_conn, room_types=room_types, skip_stale=True)
+            outcomes = persister.persist_batch([stale, fresh])
+
+        assert outcomes[0]["stale"] is True
+        assert outcomes[0]["sessions_updated"] == 0
+        assert outcomes[1]["sessions_updated"] == 1
+        repo.upsert.assert_called_once_with(fresh.session, fresh.request_params)
+        room_types.resolve.assert_called_once()
+        mock_conn.commit.assert_called_once()
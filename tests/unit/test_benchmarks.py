@@ -0,0 +1,87 @@
+"""Unit tests for the benchmark suite helpers (corpus, stand-in database, harness)."""
+
+import pytest
+
+from benchmarks.cases import _persister, _scrape_result
+from benchmarks.corpus import PAGES, build_page, load_manifest, load_page
+from benchmarks.harness import Benchmark, compare, measure
+from src.config.settings import settings
+from src.infrastructure.scraping.room_table_parser import parse_room_table
+
+MANIFEST = load_manifest()
+
+
+class TestCorpus:
+    """Test cases for the recorded page corpus."""
+
+    @pytest.mark.parametrize("name", sorted(MANIFEST))
+    def test_pages_parse_to_manifest_counts(self, name: str) -> None:
+        """Test that every page yields the rooms recorded in the manifest."""
+        rooms = parse_room_table(load_page(name))
+
+        assert len(rooms) == MANIFEST[name]["rooms"]
+        assert len({room.room_type_name for room in rooms}) <= MANIFEST[name]["room_types"]
+
+    def test_committed_pages_match_generator(self) -> None:
+        """Test that the committed files are the ones the generator produces."""
+        for spec in PAGES:
+            html, counts = build_page(spec)
+
+            assert html == load_page(spec.name)
+            assert counts["rate_rows"] == MANIFEST[spec.name]["rate_rows"]
+
+
+class TestStandInDatabase:
+    """Test cases for the in-memory database behind the write path benchmarks."""
+
+    def test_persist_then_unchanged(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a new session, then the same page saved again through delta storage."""
+        monkeypatch.setattr(settings, "db_delta_storage", True)
+        rooms = parse_room_table(load_page("small_es"))
+        persister = _persister()
+        result = _scrape_result(rooms, "2026-01-10")
+
+        first = persister.persist(result)
+        second = persister.persist(result)
+
+        assert first["sessions_created"] == 1
+        assert first["room_availabilities_created"] == len(rooms)
+        assert second["sessions_updated"] == 1
+        assert second["room_availabilities_created"] == 0
+        assert second["room_availabilities_unchanged"] == len(rooms)
+        assert second["errors"] == []
+
+    def test_persist_batch(self) -> None:
+        """Test that a batch is saved in one transaction."""
+        rooms = parse_room_table(load_page("small_es"))
+        persister = _persister()
+
+        outcomes = persister.persist_batch(
+            [_scrape_result(rooms, f"2026-01-{day:02d}") for day in range(1, 4)]
+        )
+
+        assert [outcome["sessions_created"] for outcome in outcomes] == [1, 1, 1]
+        assert not any(outcome.get("failed") for outcome in outcomes)
+
+
+class TestHarness:
+    """Test cases for measure and compare."""
+
+    def test_measure(self) -> None:
+        """Test the statistics of a measured benchmark."""
+        result = measure(Benchmark("noop", lambda: None, items=10), repeat=3, min_time=0.001)
+
+        assert result["repeat"] == 3
+        assert result["loops"] >= 1
+        assert result["min"] <= result["median"]
+        assert result["items_per_second"] > 0
+
+    def test_compare_flags_slower_medians(self) -> None:
+        """Test that only medians slower than the allowed ratio are regressions."""
+        baseline = {"a": {"median": 1.0}, "b": {"median": 1.0}, "gone": {"median": 1.0}}
+        current = {"a": {"median": 1.1}, "b": {"median": 1.5}, "new": {"median": 9.0}}
+
+        regressions = compare(current, baseline, max_regression=0.2)
+
+        assert [regression.name for regression in regressions] == ["b"]
+        assert regressions[0].ratio == pytest.approx(1.5)
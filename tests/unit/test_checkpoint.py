@@ -0,0 +1,79 @@
+"""Unit tests for the run checkpoint journal."""
+
+from pathlib import Path
+
+from src.application.checkpoint import RunJournal
+from src.domain.models import ScrapeJob
+
+
+def _job(hotel_id: int, day: int) -> ScrapeJob:
+    """Build a job for testing."""
+    return ScrapeJob(
+        hotel_id=hotel_id,
+        hotel_name=f"Hotel {hotel_id}",
+        hotel_slug=f"hotel-{hotel_id}",
+        currency="EUR",
+        checkin_date=f"2024-01-{day:02d}",
+        checkout_date=f"2024-01-{day + 1:02d}",
+    )
+
+
+class TestRunJournal:
+    """Test cases for RunJournal."""
+
+    def test_resume_skips_completed_jobs(self, tmp_path: Path) -> None:
+        """Test that a resumed journal remembers the jobs completed before."""
+        path = tmp_path / "journal.jsonl"
+        journal = RunJournal.open(path, run_id="2024-01-01")
+        journal.mark_done(_job(1, 1))
+        journal.mark_done(_job(1, 2))
+        journal.close()
+
+        resumed = RunJournal.open(path, run_id="2024-01-01", resume=True)
+        assert resumed.is_done(_job(1, 1))
+        assert resumed.is_done(_job(1, 2))
+        assert not resumed.is_done(_job(2, 1))
+
+        resumed.mark_done(_job(2, 1))
+        resumed.close()
+        assert len(RunJournal.open(path, "2024-01-01", resume=True).completed) == 3
+
+    def test_new_run_without_resume_starts_empty(self, tmp_path: Path) -> None:
+        """Test that opening without resume discards the previous journal."""
+        path = tmp_path / "journal.jsonl"
+        journal = RunJournal.open(path, run_id="2024-01-01")
+        journal.mark_done(_job(1, 1))
+        journal.close()
+
+        fresh = RunJournal.open(path, run_id="2024-01-01")
+        fresh.close()
+        assert not RunJournal.open(path, "2024-01-01", resume=True).is_done(_job(1, 1))
+
+    def test_resume_ignores_other_or_finished_runs(self, tmp_path: Path) -> None:
+        """Test that resume does not reuse a journal from another day or a finished run."""
+        path = tmp_path / "journal.jsonl"
+        journal = RunJournal.open(path, run_id="2024-01-01")
+        journal.mark_done(_job(1, 1))
+        journal.close()
+        assert not RunJournal.open(path, "2024-01-02", resume=True).completed
+
+        journal = RunJournal.open(path, run_id="2024-01-02")
+        journal.mark_done(_job(1, 1))
+        journal.finish()
+        assert not RunJournal.open(path, "2024-01-02", resume=True).completed
+
+    def test_truncated_last_line_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a record cut by a crash does not break resuming."""
+        path = tmp_path / "journal.jsonl"
+        journal = RunJournal.open(path, run_id="2024-01-01")
+        journal.mark_done(_job(1, 1))
+        journal.close()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"hotel_id": 2, "check')
+
+        resumed = RunJournal.open(path, run_id="2024-01-01", resume=True)
+        assert resumed.completed == {_job(1, 1).key}
+
+        resumed.mark_done(_job(2, 1))
+        resumed.close()
+        assert RunJournal.open(path, "2024-01-01", resume=True).is_done(_job(2, 1))
@@ -0,0 +1,165 @@
+"""Unit tests for the logging setup."""
+
+import json
+import logging
+from collections.abc import Iterator
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.infrastructure.logging.setup import (
+    BufferedRotatingFileHandler,
+    JSONFormatter,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def log_settings(tmp_path: Path) -> Iterator[Mock]:
+    """Patch the logging settings and restore the root logger afterwards."""
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = list(root_logger.handlers), root_logger.level
+    with patch("src.infrastructure.logging.setup.settings") as mock_settings:
+        mock_settings.log_level = "DEBUG"
+        mock_settings.log_format = "json"
+        mock_settings.log_file = str(tmp_path / "logs" / "scraper.log")
+        mock_settings.log_async = True
+        mock_settings.log_max_bytes = 0
+        mock_settings.log_backup_count = 2
+        yield mock_settings
+        shutdown_logging()
+    for handler in root_logger.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+def _read_records(path: str) -> list[dict]:
+    """Read the JSON records of a log file."""
+    return [json.loads(line) for line in Path(path).read_text(encoding="utf-8").splitlines()]
+
+
+class TestJSONFormatter:
+    """Test cases for JSONFormatter."""
+
+    def test_serializes_extra_fields(self) -> None:
+        """Test that fields passed with extra= are part of the JSON record."""
+        logger = logging.getLogger("test.json")
+        record = logger.makeRecord(
+            "test.json",
+            logging.INFO,
+            __file__,
+            1,
+            "Scrape %s",
+            ("done",),
+            None,
+            extra={"event": "scrape_summary", "rows_kept": 12, "timings": {"total": 1.5}},
+        )
+
+        data = json.loads(JSONFormatter().format(record))
+
+        assert data["message"] == "Scrape done"
+        assert data["event"] == "scrape_summary"
+        assert data["rows_kept"] == 12
+        assert data["timings"] == {"total": 1.5}
+        assert "lineno" not in data
+
+    def test_non_serializable_extra_uses_str(self) -> None:
+        """Test that values json cannot encode do not break logging."""
+        record = logging.makeLogRecord({"msg": "x", "path": Path("/tmp/a")})
+
+        assert json.loads(JSONFormatter().format(record))["path"] == "/tmp/a"
+
+
+class TestAsyncLogging:
+    """Test cases for the queue-based logging mode."""
+
+    def test_records_are_written_by_listener(self, log_settings: Mock) -> None:
+        """Test that queued records reach the file, formatted as JSON, on shutdown."""
+        setup_logging()
+        logger = logging.getLogger("test.async")
+
+        logger.debug("Room %s at %.2f", "Doble", 90.5)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Scrape failed")
+        shutdown_logging()
+
+        records = _read_records(log_settings.log_file)
+        assert records[0]["message"] == "Room Doble at 90.50"
+        assert records[0]["level"] == "DEBUG"
+        assert records[1]["message"] == "Scrape failed"
+        assert "ValueError: boom" in records[1]["exception"]
+
+    def test_logging_thread_only_enqueues(self, log_settings: Mock) -> None:
+        """Test that the root logger only has the queue handler in async mode."""
+        setup_logging()
+
+        root_handlers = logging.getLogger().handlers
+        assert len(root_handlers) == 1
+        assert isinstance(root_handlers[0], QueueHandler)
+
+    def test_sync_mode_keeps_direct_handlers(self, log_settings: Mock) -> None:
+        """Test that LOG_ASYNC=false attaches the console and file handlers directly."""
+        log_settings.log_async = False
+        setup_logging()
+
+        handler_types = {type(handler).__name__ for handler in logging.getLogger().handlers}
+        assert handler_types == {"StreamHandler", "RotatingFileHandler"}
+
+
+class TestBufferedRotatingFileHandler:
+    """Test cases for BufferedRotatingFileHandler."""
+
+    def test_buffers_until_flush_and_rotates(self, tmp_path: Path) -> None:
+        """Test that records stay buffered until flushed and files rotate by size."""
+        path = tmp_path / "scraper.log"
+        handler = BufferedRotatingFileHandler(str(path), max_bytes=1000, backup_count=1)
+        formatter = logging.Formatter("%(message)s")
+        handler.setFormatter(formatter)
+
+        with patch.object(formatter, "format", wraps=formatter.format) as mock_format:
+            for _ in range(10):
+                handler.emit(logging.makeLogRecord({"msg": "x" * 50, "levelno": logging.INFO}))
+            assert path.read_text() == ""
+            assert mock_format.call_count == 10
+        handler.flush()
+        assert path.read_text() == ("x" * 50 + "\n") * 10
+        assert handler.bytes_written == 510
+
+        for _ in range(10):
+            handler.emit(logging.makeLogRecord({"msg": "y" * 50, "levelno": logging.INFO}))
+        handler.close()
+
+        assert (tmp_path / "scraper.log.1").stat().st_size <= 1000
+        assert path.stat().st_size <= 1000
+        assert path.stat().st_size == handler.bytes_written
+
+    def test_errors_are_flushed_immediately(self, tmp_path: Path) -> None:
+        """Test that ERROR records are not left in the buffer."""
+        path = tmp_path / "scraper.log"
+        handler = BufferedRotatingFileHandler(str(path))
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(logging.makeLogRecord({"msg": "failed", "levelno": logging.ERROR}))
+
+        assert path.read_text() == "failed\n"
+        handler.close()
+
+    def test_appends_to_existing_file_size(self, tmp_path: Path) -> None:
+        """Test that the size of an existing log file counts towards rotation."""
+        path = tmp_path / "scraper.log"
+        path.write_text("z" * 98 + "\n")
+        handler = BufferedRotatingFileHandler(str(path), max_bytes=100, backup_count=1)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(logging.makeLogRecord({"msg": "new", "levelno": logging.INFO}))
+        handler.close()
+
+        assert (tmp_path / "scraper.log.1").read_text() == "z" * 98 + "\n"
+        assert path.read_text() == "new\n"
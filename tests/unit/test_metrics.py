@@ -0,0 +1,123 @@
+"""Unit tests for the Prometheus textfile exporter."""
+
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.metrics.prometheus import (
+    Counter,
+    Gauge,
+    Histogram,
+    ScraperMetrics,
+    TextfileExporter,
+)
+
+
+class TestMetricTypes:
+    """Test cases for Counter, Gauge and Histogram."""
+
+    def test_counter_with_labels(self) -> None:
+        """Test that labelled counters render one sample per label set."""
+        counter = Counter("errors_total", "Errors.", ("exception",))
+        counter.inc(exception="TimeoutError")
+        counter.inc(2, exception='Bad"Name')
+
+        assert counter.render() == [
+            "# HELP errors_total Errors.",
+            "# TYPE errors_total counter",
+            'errors_total{exception="Bad\\"Name"} 2',
+            'errors_total{exception="TimeoutError"} 1',
+        ]
+
+    def test_counter_rejects_wrong_labels_and_decrements(self) -> None:
+        """Test the counter validations."""
+        counter = Counter("pages_total", "Pages.", ("outcome",))
+
+        with pytest.raises(ValueError):
+            counter.inc(status="ok")
+        with pytest.raises(ValueError):
+            counter.inc(-1, outcome="ok")
+
+    def test_gauge_reads_callback(self) -> None:
+        """Test that a gauge with a callback reports the current value."""
+        depth = [3]
+        gauge = Gauge("queue_depth", "Queue depth.")
+        gauge.set_function(lambda: depth[0])
+
+        depth[0] = 5
+
+        assert gauge.samples() == ["queue_depth 5"]
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Test bucket, sum and count lines of a histogram."""
+        histogram = Histogram("write_seconds", "Writes.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.samples() == [
+            'write_seconds_bucket{le="0.1"} 1',
+            'write_seconds_bucket{le="1"} 2',
+            'write_seconds_bucket{le="+Inf"} 3',
+            "write_seconds_sum 2.55",
+            "write_seconds_count 3",
+        ]
+
+
+class TestScraperMetrics:
+    """Test cases for ScraperMetrics."""
+
+    def test_record_results(self) -> None:
+        """Test that job results feed the session, room and job counters."""
+        metrics = ScraperMetrics()
+
+        metrics.record_results(
+            {"sessions_created": 1, "room_availabilities_created": 4, "errors": []}
+        )
+        metrics.record_results({"queued": True, "errors": []})
+        metrics.record_results({"failed": True, "errors": ["boom"]})
+
+        assert metrics.sessions.value(action="created") == 1
+        assert metrics.rooms_saved.value() == 4
+        assert metrics.jobs_finished.value(outcome="saved") == 1
+        assert metrics.jobs_finished.value(outcome="failed") == 1
+
+    def test_stages_feed_histograms(self) -> None:
+        """Test that timing stages are routed to their histograms."""
+        metrics = ScraperMetrics()
+
+        metrics.observe_stage("navigate", 1.2)
+        metrics.observe_stage("db_write_batch", 0.3)
+        metrics.observe_stage("delay", 10.0)
+        metrics.record_error(TimeoutError("slow"))
+
+        text = metrics.render()
+        assert "booking_scraper_page_load_seconds_count 1" in text
+        assert 'booking_scraper_db_write_seconds_count{operation="batch"} 1' in text
+        assert 'booking_scraper_errors_total{exception="TimeoutError"} 1' in text
+
+
+class TestTextfileExporter:
+    """Test cases for TextfileExporter."""
+
+    def test_write_replaces_file(self, tmp_path: Path) -> None:
+        """Test that the file is written whole, without leftover temporary files."""
+        metrics = ScraperMetrics()
+        path = tmp_path / "textfile" / "booking_scraper.prom"
+        exporter = TextfileExporter(str(path), scraper_metrics=metrics, interval=60)
+
+        exporter.start()
+        metrics.pages_scraped.inc(outcome="success")
+        exporter.stop()
+
+        text = path.read_text(encoding="utf-8")
+        assert 'booking_scraper_pages_scraped_total{outcome="success"} 1' in text
+        assert text.endswith("\n")
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_write_error_is_not_raised(self, tmp_path: Path) -> None:
+        """Test that an unwritable target only logs a warning."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        exporter = TextfileExporter(str(blocker / "metrics.prom"), scraper_metrics=ScraperMetrics())
+
+        assert exporter.write() is False
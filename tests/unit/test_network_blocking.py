@@ -0,0 +1,93 @@
+"""Unit tests for the Chrome network blocking profiles."""
+
+import json
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.scraping.network_blocking import (
+    TRACKER_PATTERNS,
+    apply_block_profile,
+    get_block_profile,
+    parse_patterns,
+    summarize_performance_log,
+)
+
+
+def _entry(method: str, **params: Any) -> dict[str, Any]:
+    """Build a performance log entry as returned by driver.get_log."""
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class TestBlockProfiles:
+    """Test cases for block profile selection and pattern building."""
+
+    def test_off_profile_blocks_nothing(self) -> None:
+        """Test that the 'off' profile does not touch the driver."""
+        driver = Mock()
+        profile = get_block_profile("off")
+
+        assert not profile.enabled
+        assert apply_block_profile(driver, profile) == []
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_balanced_keeps_stylesheets_and_minimal_blocks_them(self) -> None:
+        """Test the difference between the 'balanced' and 'minimal' presets."""
+        balanced = get_block_profile("balanced").url_patterns()
+        minimal = get_block_profile("Minimal").url_patterns()
+
+        assert "*.jpg*" in balanced and "*.woff2*" in balanced
+        assert set(TRACKER_PATTERNS) <= set(balanced)
+        assert "*.css*" not in balanced
+        assert "*.css*" in minimal
+
+    def test_apply_sends_patterns_through_cdp(self) -> None:
+        """Test that patterns, including extra ones, are sent to Network.setBlockedURLs."""
+        driver = Mock()
+        patterns = apply_block_profile(
+            driver, get_block_profile("balanced"), parse_patterns(" *youtube.com* , ,*.gif*")
+        )
+
+        assert patterns.count("*.gif*") == 1
+        assert "*youtube.com*" in patterns
+        driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+        driver.execute_cdp_cmd.assert_any_call("Network.setBlockedURLs", {"urls": patterns})
+
+    def test_unknown_profile_raises(self) -> None:
+        """Test that a typo in the profile name fails loudly."""
+        with pytest.raises(ValueError, match="balanced"):
+            get_block_profile("agressive")
+
+
+class TestSummarizePerformanceLog:
+    """Test cases for summarize_performance_log."""
+
+    def test_counts_transferred_and_blocked_requests(self) -> None:
+        """Test bytes transferred and blocked requests per resource type."""
+        entries = [
+            _entry("Network.requestWillBeSent", requestId="1", type="Document"),
+            _entry("Network.loadingFinished", requestId="1", encodedDataLength=120_000),
+            _entry("Network.requestWillBeSent", requestId="2", type="Image"),
+            _entry("Network.loadingFailed", requestId="2", blockedReason="inspector"),
+            _entry("Network.requestWillBeSent", requestId="3", type="Font"),
+            _entry("Network.loadingFailed", requestId="3", type="Font", blockedReason="inspector"),
+            _entry("Network.requestWillBeSent", requestId="4", type="Script"),
+            _entry("Network.loadingFailed", requestId="4", errorText="net::ERR_FAILED"),
+            {"message": "not json"},
+        ]
+
+        usage = summarize_performance_log(entries)
+
+        assert usage.requests == 4
+        assert usage.transferred_bytes == 120_000
+        assert usage.blocked_by_type == {"Image": 1, "Font": 1}
+        assert usage.blocked_requests == 2
+        assert usage.estimated_saved_bytes > 0
+
+    def test_non_list_log_is_empty(self) -> None:
+        """Test that an unsupported log returns an empty summary."""
+        usage = summarize_performance_log(Mock())
+
+        assert usage.requests == 0
+        assert usage.estimated_saved_bytes == 0
@@ -0,0 +1,123 @@
+"""Unit tests for room table row mapping."""
+
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.infrastructure.scraping.room_table import (
+    RoomRowData,
+    build_room_availabilities,
+    should_log_rows,
+)
+
+
+def _row(**fields: object) -> RoomRowData:
+    """Build a valid room row with the given fields."""
+    data = {"row_class": "js-rt-block-row", "data_block_id": "1", "html_length": 500}
+    data.update(fields)
+    return RoomRowData.from_dict(data)
+
+
+class TestBuildRoomAvailabilities:
+    """Test cases for build_room_availabilities."""
+
+    def test_maps_prices_offer_and_availability(self) -> None:
+        """Test mapping of a complete row."""
+        rows = [
+            _row(
+                room_type=" Doble Deluxe ",
+                base_price="€ 120",
+                final_price="€ 100",
+                offer="Oferta de temporada",
+                availability="Solo quedan 3",
+                non_refundable=True,
+            )
+        ]
+
+        result = build_room_availabilities(rows, "url", "2024-01-01", "2024-01-02")
+
+        assert len(result) == 1
+        room = result[0]
+        assert room.room_type_name == "Doble Deluxe"
+        assert room.base_price == 120.0
+        assert room.final_price == 100.0
+        assert room.offer == "Oferta de temporada"
+        assert room.availability == 3
+        assert room.non_refundable is True
+
+    def test_carries_forward_room_name_and_availability(self) -> None:
+        """Test that rows without name or availability inherit the previous ones."""
+        rows = [
+            _row(room_type="Triple", final_price="€ 90", availability_fallback="Quedan 2"),
+            _row(final_price="€ 80"),
+        ]
+
+        result = build_room_availabilities(rows, "url", "2024-01-01", "2024-01-02")
+
+        assert [r.room_type_name for r in result] == ["Triple", "Triple"]
+        assert [r.availability for r in result] == [2, 2]
+
+    def test_uses_fallback_price(self) -> None:
+        """Test that the prc-no-css price is used when the main one is missing."""
+        rows = [_row(room_type="Suite", fallback_price="€ 250")]
+
+        result = build_room_availabilities(rows, "url", "2024-01-01", "2024-01-02")
+
+        assert result[0].final_price == 250.0
+
+    def test_keeps_only_last_estudio(self) -> None:
+        """Test the 'Estudio' dedup rule."""
+        rows = [
+            _row(room_type="Estudio", final_price="€ 50"),
+            _row(room_type="Doble", final_price="€ 70"),
+            _row(room_type="Estudio Superior", final_price="€ 60"),
+        ]
+
+        result = build_room_availabilities(rows, "url", "2024-01-01", "2024-01-02")
+
+        assert [r.room_type_name for r in result] == ["Doble", "Estudio Superior"]
+
+    def test_skips_headers_and_short_rows(self) -> None:
+        """Test that header rows and rows without content are ignored."""
+        rows = [
+            _row(row_class="hprt-table-header", room_type="Header"),
+            RoomRowData(row_class="other", room_type="No block id", html_length=500),
+            _row(room_type="Empty", html_length=10),
+            _row(room_type="Doble", final_price="€ 70"),
+        ]
+
+        result = build_room_availabilities(rows, "url", "2024-01-01", "2024-01-02")
+
+        assert [r.room_type_name for r in result] == ["Doble"]
+
+    def test_row_detail_is_only_logged_when_requested(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that per-row lines are DEBUG-only and opt-in."""
+        rows = [_row(room_type="Doble", final_price="€ 100")]
+
+        with caplog.at_level(logging.DEBUG, logger="src.infrastructure.scraping.room_table"):
+            build_room_availabilities(rows, "url", "2024-01-01", "2024-01-02")
+            quiet = len(caplog.records)
+            build_room_availabilities(rows, "url", "2024-01-01", "2024-01-02", log_rows=True)
+
+        assert all(record.levelno == logging.DEBUG for record in caplog.records)
+        assert len(caplog.records) > quiet * 2
+
+
+class TestShouldLogRows:
+    """Test cases for should_log_rows."""
+
+    @patch("src.infrastructure.scraping.room_table.settings")
+    def test_sampling_needs_debug_level(self, mock_settings: Mock) -> None:
+        """Test that rows are never sampled unless DEBUG is enabled."""
+        mock_settings.log_row_sample_rate = 1.0
+        logger = logging.getLogger("src.infrastructure.scraping.room_table")
+
+        with patch.object(logger, "isEnabledFor", return_value=False):
+            assert should_log_rows() is False
+        with patch.object(logger, "isEnabledFor", return_value=True):
+            assert should_log_rows() is True
+            mock_settings.log_row_sample_rate = 0.0
+            assert should_log_rows() is False
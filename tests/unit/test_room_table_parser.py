@@ -0,0 +1,78 @@
+"""Unit tests for the offline room table parser."""
+
+import pytest
+
+from src.infrastructure.scraping.room_table_parser import parse_html, parse_room_table
+
+PAGE = """<html><body>
+<table class="hprt-table"><thead><tr class="hprt-table-header"><th>Tipo</th></tr></thead>
+<tbody>
+<tr data-block-id="1" class="js-rt-block-row">
+  <td><a><span class="hprt-roomtype-icon-link">
+     Habitación  Doble </span></a><br></td>
+  <td><div class="bui-f-color-destructive js-strikethrough-price">€ 1.200</div>
+      <span class="prco-valign-middle-helper">€&nbsp;1.000</span></td>
+  <td><div class="c-deals-container"><div><div>x</div>
+      <div><span><span><span>Oferta</span></span></span></div></div></div></td>
+  <td><ul><li class="bui-list__item bui-text--color-destructive-dark">
+      <div class="bui-list__description">Solo quedan 2</div></li></ul>No reembolsable</td>
+</tr>
+<tr data-block-id="2" class="js-rt-block-row">
+  <td>Otra tarifa para la misma habitación, sin nombre ni disponibilidad propia</td>
+  <td><span class="prc-no-css">€ 900</span></td>
+</tr>
+</tbody></table>
+</body></html>"""
+
+
+class TestParseRoomTable:
+    """Test cases for parse_room_table."""
+
+    def test_parses_rows_like_the_live_scraper(self) -> None:
+        """Test prices, offer, availability, carry-forward and non-refundable flag."""
+        rooms = parse_room_table(PAGE)
+
+        assert len(rooms) == 2
+        first, second = rooms
+        assert first.room_type_name == "Habitación Doble"
+        assert first.base_price == 1200.0
+        assert first.final_price == 1000.0
+        assert first.offer == "Oferta"
+        assert first.availability == 2
+        assert first.non_refundable is True
+
+        assert second.room_type_name == "Habitación Doble"
+        assert second.final_price == 900.0
+        assert second.availability == 2
+        assert second.non_refundable is False
+
+    def test_rows_without_tbody(self) -> None:
+        """Test the fallback selector for tables without tbody."""
+        html = PAGE.replace("<tbody>", "").replace("</tbody>", "")
+
+        assert len(parse_room_table(html)) == 2
+
+    def test_page_without_table(self) -> None:
+        """Test that a page without room table yields no rooms."""
+        assert parse_room_table("<html><body><p>Sin disponibilidad</p></body></html>") == []
+
+
+class TestSelectors:
+    """Test cases for the minimal selector engine."""
+
+    def test_child_and_nth_child(self) -> None:
+        """Test child combinator and :nth-child."""
+        document = parse_html(
+            "<div class='a'><span>1</span><span>2</span><b><span>3</span></b></div>"
+        )
+
+        assert [e.text for e in document.select("div.a > span")] == ["1", "2"]
+        assert [e.text for e in document.select("div > span:nth-child(2)")] == ["2"]
+        assert [e.text for e in document.select("div.a span")] == ["1", "2", "3"]
+
+    def test_unsupported_selector(self) -> None:
+        """Test that unsupported syntax is rejected."""
+        document = parse_html("<div></div>")
+
+        with pytest.raises(ValueError):
+            document.select("div ~ span")
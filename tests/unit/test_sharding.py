@@ -0,0 +1,92 @@
+"""Unit tests for the hotel sharding of --shard INDEX/COUNT."""
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from src.application.sharding import Shard, jump_consistent_hash
+from src.domain.models import Hotel
+
+HOTEL_IDS = range(1, 1001)
+
+
+class TestJumpConsistentHash:
+    """Test cases for jump_consistent_hash."""
+
+    def test_assignments_are_stable(self) -> None:
+        """Test pinned assignments: changing them would move hotels between machines."""
+        assert [jump_consistent_hash(key, 10) for key in range(1, 11)] == [
+            6,
+            6,
+            8,
+            1,
+            4,
+            9,
+            0,
+            4,
+            7,
+            7,
+        ]
+
+    def test_single_bucket(self) -> None:
+        """Test that every key goes to bucket 0 with one bucket."""
+        assert {jump_consistent_hash(key, 1) for key in HOTEL_IDS} == {0}
+
+    def test_balanced(self) -> None:
+        """Test that sequential hotel ids are spread evenly."""
+        counts = Counter(jump_consistent_hash(key, 4) for key in HOTEL_IDS)
+
+        assert set(counts) == {0, 1, 2, 3}
+        assert max(counts.values()) - min(counts.values()) < 60
+
+    def test_adding_a_bucket_only_moves_keys_to_it(self) -> None:
+        """Test that growing from 4 to 5 buckets moves about a fifth of the keys."""
+        moved = [
+            key for key in HOTEL_IDS if jump_consistent_hash(key, 4) != jump_consistent_hash(key, 5)
+        ]
+
+        assert all(jump_consistent_hash(key, 5) == 4 for key in moved)
+        assert 150 < len(moved) < 250
+
+    def test_rejects_zero_buckets(self) -> None:
+        """Test that at least one bucket is required."""
+        with pytest.raises(ValueError):
+            jump_consistent_hash(1, 0)
+
+
+class TestShard:
+    """Test cases for Shard."""
+
+    def test_parse(self) -> None:
+        """Test parsing INDEX/COUNT."""
+        shard = Shard.parse(" 2/4 ")
+
+        assert (shard.index, shard.count) == (2, 4)
+        assert str(shard) == "2/4"
+
+    @pytest.mark.parametrize("text", ["4/4", "-1/4", "0/0", "1", "a/b", "1/2/3"])
+    def test_parse_invalid(self, text: str) -> None:
+        """Test that malformed or out of range shards are rejected."""
+        with pytest.raises(ValueError):
+            Shard.parse(text)
+
+    def test_shards_partition_hotels(self) -> None:
+        """Test that every hotel belongs to exactly one shard, in its original order."""
+        hotels = [Hotel(id=hotel_id, name=f"h{hotel_id}", url="") for hotel_id in HOTEL_IDS]
+
+        selections = [Shard(index, 3).select(hotels) for index in range(3)]
+
+        assert sorted(hotel.id for selection in selections for hotel in selection) == list(
+            HOTEL_IDS
+        )
+        for selection in selections:
+            assert [hotel.id for hotel in selection] == sorted(hotel.id for hotel in selection)
+
+    def test_path_for(self) -> None:
+        """Test the per-shard name of local state files."""
+        shard = Shard(0, 4)
+
+        assert shard.path_for("checkpoints/run_journal.jsonl") == Path(
+            "checkpoints/run_journal.shard-0-of-4.jsonl"
+        )
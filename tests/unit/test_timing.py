@@ -0,0 +1,97 @@
+"""Unit tests for stage timing spans."""
+
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import timing
+from src.utils.timing import StageTimings, job_timings, percentile, record, span, timed
+
+
+@pytest.fixture(autouse=True)
+def fresh_run_timings() -> Iterator[StageTimings]:
+    """Replace the process-wide run timings with an empty collection."""
+    with patch.object(timing, "run_timings", StageTimings()) as run_timings:
+        yield run_timings
+
+
+class TestPercentile:
+    """Test cases for percentile."""
+
+    def test_nearest_rank(self) -> None:
+        """Test nearest-rank percentiles of a sorted list."""
+        values = [float(value) for value in range(1, 21)]
+
+        assert percentile(values, 50) == 10.0
+        assert percentile(values, 95) == 19.0
+        assert percentile(values, 100) == 20.0
+
+    def test_single_and_empty(self) -> None:
+        """Test the edge cases of one and zero values."""
+        assert percentile([3.0], 95) == 3.0
+        assert percentile([], 50) == 0.0
+
+
+class TestStageTimings:
+    """Test cases for StageTimings."""
+
+    def test_summary_per_stage(self) -> None:
+        """Test count, total, percentiles and max of each stage."""
+        timings = StageTimings()
+        for seconds in (0.3, 0.1, 0.2):
+            timings.add("scrape", seconds)
+        timings.add("db_write", 0.05)
+
+        summary = timings.summary()
+
+        assert list(summary) == ["scrape", "db_write"]
+        assert summary["scrape"] == {"count": 3, "total": 0.6, "p50": 0.2, "p95": 0.3, "max": 0.3}
+        assert summary["db_write"]["count"] == 1
+
+    def test_reset(self) -> None:
+        """Test that reset forgets every stage."""
+        timings = StageTimings()
+        timings.add("scrape", 1.0)
+
+        timings.reset()
+
+        assert timings.summary() == {}
+
+
+class TestSpans:
+    """Test cases for record, span, timed and job_timings."""
+
+    def test_job_collects_its_stages(self, fresh_run_timings: StageTimings) -> None:
+        """Test that stages inside job_timings() are summed per job and kept for the run."""
+        with job_timings() as durations:
+            record("delay", 2.0)
+            record("delay", 1.0)
+            with span("scrape"):
+                pass
+        record("delay", 5.0)  # outside any job
+
+        assert durations["delay"] == 3.0
+        assert durations["scrape"] >= 0.0
+        assert fresh_run_timings.summary()["delay"]["count"] == 3
+
+    def test_span_records_on_error(self, fresh_run_timings: StageTimings) -> None:
+        """Test that a failing block is still timed."""
+        with pytest.raises(ValueError):
+            with span("db_write"):
+                raise ValueError("boom")
+
+        assert fresh_run_timings.summary()["db_write"]["count"] == 1
+
+    def test_timed_decorator(self, fresh_run_timings: StageTimings) -> None:
+        """Test that every call of a decorated function is one occurrence of the stage."""
+
+        @timed("db_session")
+        def save(value: int) -> int:
+            return value * 2
+
+        assert save(2) == 4
+        assert save.__name__ == "save"
+        save(3)
+
+        assert fresh_run_timings.summary()["db_session"]["count"] == 2
@@ -0,0 +1,135 @@
+"""Unit tests for the concurrent scraper worker pool."""
+
+import threading
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.application.worker_pool import ScrapeWorker, ScrapeWorkerPool
+from src.domain.models import ScrapeJob
+
+
+def _make_jobs(hotels: int, dates: int) -> list[ScrapeJob]:
+    """Build a list of jobs for testing."""
+    return [
+        ScrapeJob(
+            hotel_id=hotel_id,
+            hotel_name=f"Hotel {hotel_id}",
+            hotel_slug=f"hotel-{hotel_id}",
+            currency="EUR",
+            checkin_date=f"2024-01-{day:02d}",
+            checkout_date=f"2024-01-{day + 1:02d}",
+        )
+        for hotel_id in range(1, hotels + 1)
+        for day in range(1, dates + 1)
+    ]
+
+
+class TestScrapeWorkerPool:
+    """Test cases for ScrapeWorkerPool."""
+
+    def test_run_processes_every_job_in_order(self) -> None:
+        """Test that every job is processed once and outcomes keep job order."""
+        jobs = _make_jobs(hotels=3, dates=4)
+        threads_seen: set[str] = set()
+        lock = threading.Lock()
+
+        def fake_process(self: ScrapeWorker, job: ScrapeJob) -> dict[str, Any]:
+            with lock:
+                threads_seen.add(threading.current_thread().name)
+            return {
+                "sessions_created": 1,
+                "sessions_updated": 0,
+                "room_availabilities_created": 2,
+                "errors": [],
+            }
+
+        with patch.object(ScrapeWorker, "process", fake_process):
+            pool = ScrapeWorkerPool(workers=3, delay_between_jobs=False)
+            outcomes = pool.run(jobs)
+
+        assert [job for job, _ in outcomes] == jobs
+        assert sum(results["room_availabilities_created"] for _, results in outcomes) == 24
+        assert threads_seen <= {f"scrape-worker-{i}" for i in range(1, 4)}
+
+    def test_each_worker_gets_its_own_proxy(self) -> None:
+        """Test that the proxy provider is called once per worker."""
+        jobs = _make_jobs(hotels=2, dates=2)
+        proxies: list[str | None] = []
+        lock = threading.Lock()
+
+        def fake_process(self: ScrapeWorker, job: ScrapeJob) -> dict[str, Any]:
+            with lock:
+                proxies.append(self.proxy)
+            return {"errors": []}
+
+        calls = iter(["http://1.1.1.1:80", "http://2.2.2.2:80"])
+        with patch.object(ScrapeWorker, "process", fake_process):
+            pool = ScrapeWorkerPool(
+                workers=2, proxy_provider=lambda: next(calls), delay_between_jobs=False
+            )
+            pool.run(jobs)
+
+        assert len(proxies) == 4
+        assert set(proxies) <= {"http://1.1.1.1:80", "http://2.2.2.2:80"}
+
+    def test_process_turns_exceptions_into_errors(self) -> None:
+        """Test that a failing job is reported in the results instead of raising."""
+        job = _make_jobs(hotels=1, dates=1)[0]
+        worker = ScrapeWorker(worker_id=1)
+
+        with patch.object(ScrapeWorker, "run_job", side_effect=RuntimeError("boom")):
+            results = worker.process(job)
+
+        assert results["failed"] is True
+        assert "boom" in results["errors"][0]
+
+    def test_run_job_hands_result_to_writer(self) -> None:
+        """Test that with a result writer the job is queued instead of saved."""
+        job = _make_jobs(hotels=1, dates=1)[0]
+        writer = Mock()
+        scrape_result = Mock()
+        worker = ScrapeWorker(worker_id=1, browser_pool=Mock(), result_writer=writer)
+
+        with (
+            patch("src.application.worker_pool.UpdatePricesService") as mock_service,
+            patch("src.application.worker_pool.db_connection") as mock_db,
+        ):
+            mock_service.return_value.scrape.return_value = (
+                scrape_result,
+                {"errors": [], "rooms_scraped": 3},
+            )
+            results = worker.run_job(job)
+
+        writer.submit.assert_called_once_with(scrape_result)
+        mock_db.assert_not_called()
+        assert results["queued"] is True
+        assert mock_service.call_args[0][0] is None
+
+    def test_run_job_spools_result_when_database_fails(self) -> None:
+        """Test that a scraped page is spooled instead of lost when saving fails."""
+        job = _make_jobs(hotels=1, dates=1)[0]
+        spool = Mock()
+        scrape_result = Mock()
+        scrape_result.key = job.key
+        worker = ScrapeWorker(worker_id=1, browser_pool=Mock(), spool=spool)
+
+        with (
+            patch("src.application.worker_pool.UpdatePricesService") as mock_service,
+            patch(
+                "src.application.worker_pool.db_connection",
+                side_effect=RuntimeError("Can't connect to MySQL server"),
+            ),
+        ):
+            mock_service.return_value.scrape.return_value = (scrape_result, {"errors": []})
+            results = worker.process(job)
+
+        spool.append.assert_called_once_with(scrape_result, error="Can't connect to MySQL server")
+        assert results["spooled"] is True
+        assert not results.get("failed")
+
+    def test_invalid_worker_count(self) -> None:
+        """Test that a pool needs at least one worker."""
+        with pytest.raises(ValueError):
+            ScrapeWorkerPool(workers=0)